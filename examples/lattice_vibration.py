@@ -4,7 +4,12 @@ import numpy as np
 import phonopy
 
 from spgrep import get_spacegroup_irreps
-from spgrep.representation import check_spacegroup_representation, project_to_irrep
+from spgrep.representation import (
+    InducedSiteRepresentation,
+    check_spacegroup_representation,
+    get_site_permutations,
+    project_to_irrep,
+)
 
 
 def get_displacements_representation(
@@ -19,39 +24,23 @@ def get_displacements_representation(
     .. math::
        \\Gamma_{\\kappa'\\mu'; \\kappa\\mu}^{\\mathbf{q}}(g) := \\exp \\left( -i \\mathbf{R}_{g} \\mathbf{q} \\cdot \\mathbf{h}_{g}(\\kappa) \\right) [\\mathbf{R}_{g}]_{\\mu'\\mu} \\delta_{ g\\kappa, \\kappa' }
     """
-    little_order = len(little_rotations)
-    num_atoms = len(positions)
-
     # Operation-`i` moves atom-`kappa` to `permutations[i, kappa]`
-    permutations = np.zeros((little_order, num_atoms), dtype=int)
-    for i, (Ri, vi) in enumerate(zip(little_rotations, little_translations)):
-        for kappa, position in enumerate(positions):
-            new_pos = np.remainder(Ri @ position + vi, 1)
-            for kappa2, position2 in enumerate(positions):
-                if np.allclose(position2, new_pos):
-                    permutations[i, kappa] = kappa2
-                    break
-
-    shifts = np.zeros((little_order, num_atoms, 3))
-    for i, (Ri, vi) in enumerate(zip(little_rotations, little_translations)):
-        perm_i = permutations[i]
-        shifts[i] = positions @ Ri.T + vi[None, :] - positions[perm_i]
-
-    perm_rep = np.zeros((little_order, num_atoms, num_atoms), dtype=np.complex128)
-    for i, Ri in enumerate(little_rotations):
-        for kappa in range(num_atoms):
-            kappa2 = permutations[i, kappa]
-            perm_rep[i, kappa2, kappa] = np.exp(
-                -2j * np.pi * np.dot(Ri.T @ qpoint, shifts[i, kappa])
-            )
+    permutations, shifts = get_site_permutations(little_rotations, little_translations, positions)
+
+    # Phase factor for atom-`kappa` moved by operation-`i`
+    phases = np.exp(
+        -2j
+        * np.pi
+        * np.einsum("ipq,p,ikq->ik", little_rotations, qpoint, shifts, optimize="greedy")
+    )
 
     # Rotation matrix in cartesian (order, 3, 3)
     A = np.transpose(lattice)  # column-wise lattice vectors
     Ainv = np.linalg.inv(A)
     rotation_rep = np.array([A @ r @ Ainv for r in little_rotations], dtype=np.complex128)
 
-    rep = np.einsum("ipq,iab->ipaqb", perm_rep, rotation_rep, optimize="greedy")
-    return rep.reshape(-1, num_atoms * 3, num_atoms * 3)
+    # Only permutations, phases and local rotations are stored instead of (order, 3N, 3N) matrices
+    return InducedSiteRepresentation(permutations, phases, rotation_rep)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+"""Compare projective and double-group modes to enumerate spinor irreps of crystallographic point groups."""
+
+from time import perf_counter
+
+import numpy as np
+
+from spgrep.pointgroup import pg_dataset
+from spgrep.spinor import enumerate_spinor_small_representations
+
+
+def benchmark(lattice, rotations, method, double_group, repeat=3):
+    """Return the best elapsed time in seconds among ``repeat`` runs."""
+    elapsed = []
+    for _ in range(repeat):
+        start = perf_counter()
+        enumerate_spinor_small_representations(
+            lattice, rotations, method=method, double_group=double_group
+        )
+        elapsed.append(perf_counter() - start)
+    return min(elapsed)
+
+
+if __name__ == "__main__":
+    hexagonal_lattice = np.array(
+        [
+            [1, 0, 0],
+            [-0.5, np.sqrt(3) / 2, 0],
+            [0, 0, 1],
+        ]
+    )
+
+    print(f"{'PG':>6} {'order':>5} {'method':>6} {'projective':>10} {'double':>10}")
+    for pg_symbol, groups in pg_dataset.items():
+        if pg_symbol.startswith(("3", "-3", "6", "-6")):
+            lattice = hexagonal_lattice
+        else:
+            lattice = np.eye(3)
+        rotations = np.array(groups[0])
+
+        for method in ["Neto", "random"]:
+            projective = benchmark(lattice, rotations, method, double_group=False)
+            double = benchmark(lattice, rotations, method, double_group=True)
+            print(
+                f"{pg_symbol:>6} {len(rotations):>5} {method:>6} {projective * 1e3:>8.2f}ms {double * 1e3:>8.2f}ms"
+            )
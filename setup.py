@@ -72,7 +72,7 @@ setup(
     url=URL,
     package_dir={"": "src"},
     packages=find_packages(where="src", include=["spgrep"]),
-    package_data={},
+    package_data={"spgrep": ["data/*.json"]},
     # numpy: https://github.com/numpy/numpy/issues/2434
     setup_requires=["setuptools_scm", "numpy"],
     install_requires=REQUIRED,
@@ -0,0 +1,263 @@
+"""Clebsch-Gordan coefficients for tensor products of irreps."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Literal
+
+import numpy as np
+
+from spgrep.representation import DirectProductRepresentation, get_character
+from spgrep.utils import NDArrayComplex, NDArrayFloat, NDArrayInt
+
+MAX_CLEBSCH_GORDAN_CACHE_SIZE = 1024
+# (Key of irreps of group, key of first irrep, key of second irrep) -> coefficients
+_clebsch_gordan_cache: OrderedDict[tuple[str, str, str], list[NDArrayComplex]] = OrderedDict()
+
+
+def get_tensor_product_multiplicities(
+    characters1: NDArrayComplex,
+    characters2: NDArrayComplex,
+    characters: NDArrayComplex,
+    atol: float = 1e-6,
+) -> NDArrayInt:
+    r"""Calculate multiplicities of irreps in tensor products of irreps only from their characters.
+
+    .. math::
+       m_{\alpha \beta}^{\gamma} = \frac{1}{|G|} \sum_{g \in G} \chi^{\alpha}(g) \chi^{\beta}(g) \chi^{\gamma}(g)^{\ast}
+
+    For projective irreps, ``characters`` should be of irreps with the product of factor systems of ``characters1`` and ``characters2``.
+
+    Parameters
+    ----------
+    characters1: array, (num_irreps1, order)
+    characters2: array, (num_irreps2, order)
+    characters: array, (num_irreps, order)
+    atol: float
+        Absolute tolerance to check multiplicities are integers
+
+    Returns
+    -------
+    multiplicities: array[int], (num_irreps1, num_irreps2, num_irreps)
+        ``multiplicities[a, b, c]`` is the number of times the ``c``-th irrep appears in tensor product of the ``a``-th and ``b``-th irreps.
+    """
+    characters1 = np.atleast_2d(characters1)
+    characters2 = np.atleast_2d(characters2)
+    characters = np.atleast_2d(characters)
+    order = characters.shape[1]
+    overlap = (
+        np.einsum(
+            "ak,bk,ck->abc", characters1, characters2, np.conj(characters), optimize="greedy"
+        )
+        / order
+    )
+    multiplicities = np.rint(np.real(overlap)).astype(int)
+    if not np.allclose(overlap, multiplicities, atol=atol):
+        raise ValueError("Inner products of characters should be integers.")
+    return multiplicities
+
+
+def get_clebsch_gordan_coefficients(
+    irrep1: NDArrayComplex,
+    irrep2: NDArrayComplex,
+    irreps: list[NDArrayComplex],
+    atol: float = 1e-6,
+    use_cache: bool = True,
+    cache_key: tuple[str, str, str] | None = None,
+) -> list[NDArrayComplex]:
+    r"""Calculate Clebsch-Gordan coefficients to decompose tensor product of two unitary irreps.
+
+    For each irrep :math:`\Gamma^{\gamma}` in ``irreps``, let :math:`m_{\gamma}` be its multiplicity in :math:`\Gamma^{\alpha} \otimes \Gamma^{\beta}`.
+    The returned coefficients :math:`C^{\gamma}_{r, ab, i}` (``0 <= r < m_{gamma}``) satisfy
+
+    .. math::
+       \sum_{a'b'} \Gamma^{\alpha}(g)_{aa'} \Gamma^{\beta}(g)_{bb'} C^{\gamma}_{r, a'b', i}
+       = \sum_{j} C^{\gamma}_{r, ab, j} \Gamma^{\gamma}(g)_{ji},
+
+    and :math:`\{ C^{\gamma}_{r, \cdot, i} \}_{\gamma r i}` forms an orthonormal basis.
+    For each :math:`\gamma` with nonzero multiplicity, the multiplicity space is taken as the image of the Hermitian projector
+    :math:`P^{\gamma}_{00} = \frac{d_{\gamma}}{|G|} \sum_{g} \Gamma^{\gamma}(g)_{00}^{\ast} \Gamma^{\alpha}(g) \otimes \Gamma^{\beta}(g)`,
+    and partner vectors are obtained by transfer operators :math:`P^{\gamma}_{i0}` without materializing the tensor product.
+    Results are memoized for each group (identified by ``irreps``) and each pair of ``irrep1`` and ``irrep2``.
+
+    Parameters
+    ----------
+    irrep1: array, (order, dim1, dim1)
+    irrep2: array, (order, dim2, dim2)
+    irreps: list of array with (order, dim, dim)
+        All unitary irreps with the product of factor systems of ``irrep1`` and ``irrep2``.
+        For spinor (projective) irreps ``irrep1`` and ``irrep2``, ``irreps`` are linear irreps.
+    atol: float
+        Absolute tolerance to check multiplicities are integers
+    use_cache: bool, default=True
+        If True, reuse memoized results.
+        See also :func:`clear_clebsch_gordan_cache`.
+    cache_key: (Optional) tuple of str
+        Precomputed ``(get_irreps_key(irreps), get_irreps_key([irrep1]), get_irreps_key([irrep2]))``.
+        Specify it to avoid hashing irreps on each call, e.g. in a loop over pairs of irreps of the same group.
+
+    Returns
+    -------
+    coefficients: list of array with (multiplicity, dim1, dim2, dim)
+        ``coefficients[gamma]`` is for ``irreps[gamma]``.
+    """
+    if use_cache and cache_key is None:
+        cache_key = (get_irreps_key(irreps), get_irreps_key([irrep1]), get_irreps_key([irrep2]))
+    if use_cache and cache_key in _clebsch_gordan_cache:
+        _clebsch_gordan_cache.move_to_end(cache_key)
+        return [coeffs.copy() for coeffs in _clebsch_gordan_cache[cache_key]]
+
+    order, dim1, _ = irrep1.shape
+    dim2 = irrep2.shape[1]
+    direct = DirectProductRepresentation([irrep1, irrep2])
+    identity = np.eye(dim1 * dim2).reshape(dim1 * dim2, dim1, dim2)
+    characters = np.array([get_character(irrep) for irrep in irreps])
+    multiplicities = get_tensor_product_multiplicities(
+        get_character(irrep1), get_character(irrep2), characters, atol=atol
+    )[0, 0]
+
+    coefficients = []
+    for irrep, multiplicity in zip(irreps, multiplicities):
+        dim = irrep.shape[1]
+        if multiplicity == 0:
+            coefficients.append(np.zeros((0, dim1, dim2, dim), dtype=np.complex128))
+            continue
+
+        # Hermitian projector onto the first partner of each copy
+        projector = direct.apply(identity, weights=dim / order * np.conj(irrep[:, 0, 0]))
+        projector = projector.reshape(dim1 * dim2, dim1 * dim2).T
+        projector = (projector + np.conj(projector.T)) / 2
+        _, eigvecs = np.linalg.eigh(projector)
+        first = eigvecs[:, -multiplicity:].T.reshape(multiplicity, dim1, dim2)
+
+        # Partners by transfer operators
+        applied = direct.apply(first)  # (order, multiplicity, dim1, dim2)
+        partners = dim / order * np.einsum("ki,krab->rabi", np.conj(irrep[:, :, 0]), applied)
+        coefficients.append(partners)
+
+    if use_cache and cache_key is not None:
+        # Keep copies so that later modification of returned coefficients does not affect cache
+        _clebsch_gordan_cache[cache_key] = [coeffs.copy() for coeffs in coefficients]
+        if len(_clebsch_gordan_cache) > MAX_CLEBSCH_GORDAN_CACHE_SIZE:
+            _clebsch_gordan_cache.popitem(last=False)
+    return coefficients
+
+
+def get_operator_characters(
+    rotations: NDArrayInt,
+    kind: Literal[
+        "scalar", "pseudoscalar", "vector", "pseudovector", "symmetric", "antisymmetric"
+    ],
+) -> NDArrayFloat:
+    r"""Calculate characters of representations for physical operators without constructing their matrices.
+
+    Characters only depend on traces and determinants of ``rotations``, so they do not depend on choice of basis vectors.
+
+    - 'scalar': :math:`1`
+    - 'pseudoscalar': :math:`\det \mathbf{R}`
+    - 'vector': :math:`\mathrm{tr} \mathbf{R}`, e.g. electric dipole for IR absorption
+    - 'pseudovector': :math:`\det \mathbf{R} \, \mathrm{tr} \mathbf{R}`, e.g. magnetic dipole
+    - 'symmetric': :math:`\frac{1}{2} \left( (\mathrm{tr} \mathbf{R})^{2} + \mathrm{tr} \mathbf{R}^{2} \right)`, rank-2 symmetric tensor e.g. Raman tensor
+    - 'antisymmetric': :math:`\frac{1}{2} \left( (\mathrm{tr} \mathbf{R})^{2} - \mathrm{tr} \mathbf{R}^{2} \right)`, rank-2 antisymmetric tensor
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+    kind: str
+
+    Returns
+    -------
+    characters: array, (order, )
+    """
+    rotations = np.asarray(rotations)
+    traces = np.einsum("kii->k", rotations).astype(np.float64)
+    dets = np.rint(np.linalg.det(rotations))
+    if kind == "scalar":
+        return np.ones(len(rotations))
+    elif kind == "pseudoscalar":
+        return dets
+    elif kind == "vector":
+        return traces
+    elif kind == "pseudovector":
+        return dets * traces
+    elif kind in ["symmetric", "antisymmetric"]:
+        traces2 = np.einsum("kij,kji->k", rotations, rotations).astype(np.float64)
+        sign = 1 if kind == "symmetric" else -1
+        return (traces**2 + sign * traces2) / 2
+    else:
+        raise ValueError(f"Unknown kind of operator: {kind}")
+
+
+def get_selection_rules(
+    characters_initial: NDArrayComplex,
+    characters_operator: NDArrayComplex,
+    characters_final: NDArrayComplex | None = None,
+    atol: float = 1e-6,
+) -> NDArrayInt:
+    r"""Calculate selection rules of matrix elements for all pairs of irreps from characters.
+
+    A matrix element :math:`\langle \Gamma^{a} | \Gamma^{o} | \Gamma^{b} \rangle` can be nonzero only if the trivial irrep appears in :math:`\Gamma^{a \ast} \otimes \Gamma^{o} \otimes \Gamma^{b}`.
+    Its multiplicity is computed for all triplets by one contraction of characters,
+
+    .. math::
+       M_{a o b} = \frac{1}{|G|} \sum_{g \in G} \chi^{a}(g)^{\ast} \chi^{o}(g) \chi^{b}(g).
+
+    For small representations of a little group, characters of all irreps should be given over the same symmetry operations, and translations parts cancel out between ``characters_initial`` and ``characters_final``.
+
+    Parameters
+    ----------
+    characters_initial: array, (num_irreps_initial, order)
+        Characters of irreps for bra states
+    characters_operator: array, (num_operators, order) or (order, )
+        Characters of operators, e.g. returned by :func:`get_operator_characters`
+    characters_final: (Optional) array, (num_irreps_final, order)
+        Characters of irreps for ket states. If not specified, ``characters_initial`` is used.
+    atol: float
+        Absolute tolerance to check multiplicities are integers
+
+    Returns
+    -------
+    multiplicities: array[int], (num_irreps_initial, num_operators, num_irreps_final)
+        The matrix element is allowed by symmetry iff ``multiplicities > 0``.
+    """
+    characters_initial = np.atleast_2d(characters_initial)
+    characters_operator = np.atleast_2d(characters_operator)
+    if characters_final is None:
+        characters_final = characters_initial
+    characters_final = np.atleast_2d(characters_final)
+    order = characters_initial.shape[1]
+
+    overlap = (
+        np.einsum(
+            "ak,ok,bk->aob",
+            np.conj(characters_initial),
+            characters_operator,
+            characters_final,
+            optimize="greedy",
+        )
+        / order
+    )
+    multiplicities = np.rint(np.real(overlap)).astype(int)
+    if not np.allclose(overlap, multiplicities, atol=atol):
+        raise ValueError("Inner products of characters should be integers.")
+    return multiplicities
+
+
+def clear_clebsch_gordan_cache():
+    """Clear memoized results of :func:`get_clebsch_gordan_coefficients`."""
+    _clebsch_gordan_cache.clear()
+
+
+def get_irreps_key(irreps: list[NDArrayComplex]) -> str:
+    """Return key of ``irreps`` for memoizing :func:`get_clebsch_gordan_coefficients`.
+
+    Values are rounded to eight decimals before hashing to absorb numerical noise.
+    """
+    sha = hashlib.sha1()
+    for irrep in irreps:
+        # Add zero to remove negative zeros
+        values = np.round(np.asarray(irrep, dtype=np.complex128), decimals=8) + 0.0
+        sha.update(str(values.shape).encode())
+        sha.update(values.tobytes())
+    return sha.hexdigest()
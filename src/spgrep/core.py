@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal, overload
 
 import numpy as np
 from spglib import get_magnetic_symmetry_dataset, get_symmetry_dataset
 
 from spgrep.corep import enumerate_spinor_small_corepresentations
-from spgrep.group import get_little_group
+from spgrep.group import get_cayley_table, get_little_group
+from spgrep.induced import InducedRepresentation, induce_small_representation
 from spgrep.irreps import (
+    decompose_representation,
     enumerate_small_representations,
     enumerate_unitary_irreps,
+    is_equivalent_irrep,
     purify_irrep_value,
+    purify_irrep_value_batch,
 )
 from spgrep.spinor import (
     enumerate_spinor_small_representations,
@@ -23,13 +27,70 @@ from spgrep.transform import (
     transform_symmetry_and_kpoint,
     unique_primitive_symmetry,
 )
-from spgrep.utils import NDArrayBool, NDArrayComplex, NDArrayFloat, NDArrayInt
+from spgrep.utils import (
+    NDArrayBool,
+    NDArrayComplex,
+    NDArrayFloat,
+    NDArrayInt,
+    get_rotation_indices,
+)
 
 ################################################################################
 # Linear representation
 ################################################################################
 
 
+@overload
+def get_spacegroup_irreps(
+    lattice: NDArrayFloat,
+    positions: NDArrayFloat,
+    numbers: NDArrayInt,
+    kpoint: NDArrayFloat,
+    method: Literal["Neto", "random"] = ...,
+    reciprocal_lattice: NDArrayFloat | None = ...,
+    symprec: float = ...,
+    rtol: float = ...,
+    atol: float = ...,
+    max_num_random_generations: int = ...,
+    lazy: Literal[False] = ...,
+) -> tuple[list[NDArrayComplex], NDArrayInt, NDArrayFloat, NDArrayInt]: ...
+
+
+@overload
+def get_spacegroup_irreps(
+    lattice: NDArrayFloat,
+    positions: NDArrayFloat,
+    numbers: NDArrayInt,
+    kpoint: NDArrayFloat,
+    method: Literal["Neto", "random"] = ...,
+    reciprocal_lattice: NDArrayFloat | None = ...,
+    symprec: float = ...,
+    rtol: float = ...,
+    atol: float = ...,
+    max_num_random_generations: int = ...,
+    *,
+    lazy: Literal[True],
+) -> tuple[list[ConventionalIrrepView], NDArrayInt, NDArrayFloat, NDArrayInt]: ...
+
+
+@overload
+def get_spacegroup_irreps(
+    lattice: NDArrayFloat,
+    positions: NDArrayFloat,
+    numbers: NDArrayInt,
+    kpoint: NDArrayFloat,
+    method: Literal["Neto", "random"] = ...,
+    reciprocal_lattice: NDArrayFloat | None = ...,
+    symprec: float = ...,
+    rtol: float = ...,
+    atol: float = ...,
+    max_num_random_generations: int = ...,
+    lazy: bool = ...,
+) -> tuple[
+    list[NDArrayComplex] | list[ConventionalIrrepView], NDArrayInt, NDArrayFloat, NDArrayInt
+]: ...
+
+
 def get_spacegroup_irreps(
     lattice: NDArrayFloat,
     positions: NDArrayFloat,
@@ -41,7 +102,10 @@ def get_spacegroup_irreps(
     rtol: float = 1e-5,
     atol: float = 1e-8,
     max_num_random_generations: int = 4,
-) -> tuple[list[NDArrayComplex], NDArrayInt, NDArrayFloat, NDArrayInt]:
+    lazy: bool = False,
+) -> tuple[
+    list[NDArrayComplex] | list[ConventionalIrrepView], NDArrayInt, NDArrayFloat, NDArrayInt
+]:
     r"""Compute all irreducible representations of space group of given structure up to unitary transformation.
 
     Parameters
@@ -73,6 +137,8 @@ def get_spacegroup_irreps(
         Absolute tolerance to distinguish difference eigenvalues
     max_num_random_generations: int
         Maximum number of trials to generate random matrix
+    lazy: bool, default=False
+        If True, return each irrep as :class:`spgrep.core.ConventionalIrrepView`, which computes representation matrices on demand instead of materializing them for all centering translations.
 
     Returns
     -------
@@ -86,19 +152,13 @@ def get_spacegroup_irreps(
         Let ``i = mapping_little_group[idx]``.
         ``(rotations[i], translations[i])`` belongs to the little group of given space space group and kpoint.
     """
-    # Transform given `kpoint` in dual of `lattice`
-    dual_lattice = np.linalg.inv(lattice).T
-    if reciprocal_lattice is None:
-        reciprocal_lattice = dual_lattice
-    # kpoint @ reciprocal_lattice == kpoint_conv @ dual_lattice
-    kpoint_conv = kpoint @ reciprocal_lattice @ np.linalg.inv(dual_lattice)
-
-    dataset = get_symmetry_dataset(cell=(lattice, positions, numbers), symprec=symprec)
+    dataset, to_primitive, kpoint_conv = _get_symmetry_dataset_and_kpoint(
+        lattice, positions, numbers, kpoint, reciprocal_lattice, symprec
+    )
     rotations = dataset["rotations"]
     translations = dataset["translations"]
 
     # Transform to primitive
-    to_primitive = get_primitive_transformation_matrix(dataset["hall_number"])
     prim_rotations, prim_translations, prim_kpoint = transform_symmetry_and_kpoint(
         to_primitive, rotations, translations, kpoint_conv
     )
@@ -126,11 +186,350 @@ def get_spacegroup_irreps(
         mapping_to_prim,
         prim_irreps,
         mapping_prim_little_group,
+        lazy=lazy,
     )
 
     return irreps, rotations, translations, mapping_little_group
 
 
+def get_spacegroup_irreps_incremental(
+    lattice: NDArrayFloat,
+    positions: NDArrayFloat,
+    numbers: NDArrayInt,
+    kpoint: NDArrayFloat,
+    previous: tuple[list[NDArrayComplex], NDArrayInt, NDArrayFloat, NDArrayInt] | None = None,
+    method: Literal["Neto", "random"] = "Neto",
+    reciprocal_lattice: NDArrayFloat | None = None,
+    symprec: float = 1e-5,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    max_num_random_generations: int = 4,
+) -> tuple[list[NDArrayComplex], NDArrayInt, NDArrayFloat, NDArrayInt]:
+    r"""Compute irreps of space group of given structure by reusing those of previous structure with higher symmetry.
+
+    This is intended for a sequence of slightly perturbed structures, e.g. snapshots of molecular dynamics or relaxation, sharing the same lattice basis.
+    If symmetry operations of the given structure form a subgroup of those in ``previous``, irreps of ``previous`` are restricted to the new little group and reduced into irreps.
+    Otherwise, irreps are computed from scratch by :func:`get_spacegroup_irreps`.
+
+    Parameters
+    ----------
+    lattice: array, (3, 3)
+        Row-wise basis vectors. ``lattice[i, :]`` is the i-th lattice vector.
+    positions: array, (num_atoms, 3)
+        Fractional coordinates of sites
+    numbers: array, (num_atoms, )
+        Integer list specifying atomic species
+    kpoint: array, (3, )
+        Reciprocal vector with respect to ``reciprocal_lattice``
+    previous: (Optional) tuple
+        Returned value of this function or :func:`get_spacegroup_irreps` for previous structure with the same ``kpoint``
+    method: str, 'Neto' or 'random'
+        'Neto': construct irreps from a fixed chain of subgroups of little co-group
+        'random': construct irreps by numerically diagonalizing a random matrix commute with regular representation
+    reciprocal_lattice: (Optional) array, (3, 3)
+        ``reciprocal_lattice[i, :]`` is the i-th basis vector of reciprocal lattice for ``kpoint`` without `2 * pi factor`.
+        If not specified, ``reciprocal_lattice`` is set to ``np.linalg.inv(lattice).T``.
+    symprec: float
+        Parameter for searching symmetry operation in Spglib
+    rtol: float
+        Relative tolerance for comparing float values
+    atol: float
+        Absolute tolerance to distinguish difference eigenvalues
+    max_num_random_generations: int
+        Maximum number of trials to generate random matrix
+
+    Returns
+    -------
+    irreps: list of Irreps with (little_group_order, dim, dim)
+    rotations: array[int], (num_sym, 3, 3)
+    translations: array, (num_sym, 3)
+    mapping_little_group: array, (little_group_order, )
+        Same as :func:`get_spacegroup_irreps`
+    """
+    if previous is not None:
+        restricted = _restrict_previous_spacegroup_irreps(
+            lattice,
+            positions,
+            numbers,
+            kpoint,
+            previous,
+            reciprocal_lattice=reciprocal_lattice,
+            symprec=symprec,
+            rtol=rtol,
+            atol=atol,
+            max_num_random_generations=max_num_random_generations,
+        )
+        if restricted is not None:
+            return restricted
+
+    # Compute from scratch if symmetry is not lowered from ``previous`` or restriction failed
+    return get_spacegroup_irreps(
+        lattice,
+        positions,
+        numbers,
+        kpoint,
+        method=method,
+        reciprocal_lattice=reciprocal_lattice,
+        symprec=symprec,
+        rtol=rtol,
+        atol=atol,
+        max_num_random_generations=max_num_random_generations,
+    )
+
+
+def get_full_spacegroup_irreps(
+    lattice: NDArrayFloat,
+    positions: NDArrayFloat,
+    numbers: NDArrayInt,
+    kpoint: NDArrayFloat,
+    method: Literal["Neto", "random"] = "Neto",
+    reciprocal_lattice: NDArrayFloat | None = None,
+    symprec: float = 1e-5,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    max_num_random_generations: int = 4,
+    materialize: bool = False,
+) -> tuple[list[InducedRepresentation] | list[NDArrayComplex], NDArrayInt, NDArrayFloat]:
+    r"""Compute all irreducible representations of space group induced from small representations over star of given kpoint.
+
+    Each irrep is returned as :class:`spgrep.induced.InducedRepresentation` with arms of star, coset representatives, and blocks of small representations.
+    Its dimension is ``num_arms * dim`` for small representation with dimension ``dim``, but only ``num_arms`` blocks with ``(dim, dim)`` are stored for each symmetry operation.
+
+    Parameters
+    ----------
+    lattice: array, (3, 3)
+        Row-wise basis vectors. ``lattice[i, :]`` is the i-th lattice vector.
+    positions: array, (num_atoms, 3)
+        Fractional coordinates of sites
+    numbers: array, (num_atoms, )
+        Integer list specifying atomic species
+    kpoint: array, (3, )
+        Reciprocal vector with respect to ``reciprocal_lattice``
+    method: str, 'Neto' or 'random'
+        'Neto': construct irreps from a fixed chain of subgroups of little co-group
+        'random': construct irreps by numerically diagonalizing a random matrix commute with regular representation
+    reciprocal_lattice: (Optional) array, (3, 3)
+        ``reciprocal_lattice[i, :]`` is the i-th basis vector of reciprocal lattice for ``kpoint`` without `2 * pi factor`.
+        If not specified, ``reciprocal_lattice`` is set to ``np.linalg.inv(lattice).T``.
+    symprec: float
+        Parameter for searching symmetry operation in Spglib
+    rtol: float
+        Relative tolerance for comparing float values
+    atol: float
+        Absolute tolerance to distinguish difference eigenvalues
+    max_num_random_generations: int
+        Maximum number of trials to generate random matrix
+    materialize: bool, default=False
+        If True, return each irrep as dense matrices with (num_sym, num_arms * dim, num_arms * dim).
+
+    Returns
+    -------
+    irreps: list of InducedRepresentation or list of array
+        ``irreps[alpha]`` is the ``alpha``-th irrep for ``(rotations[i], translations[i])``.
+        Arms of star ``irreps[alpha].kpoints`` are given in dual basis of ``lattice``.
+        The first arm is equivalent to ``kpoint`` and its blocks for little group coincide with irreps from :func:`get_spacegroup_irreps`.
+    rotations: array[int], (num_sym, 3, 3)
+        Linear parts of symmetry operations
+    translations: array, (num_sym, 3)
+        Translation parts of symmetry operations
+    """
+    dataset, to_primitive, kpoint_conv = _get_symmetry_dataset_and_kpoint(
+        lattice, positions, numbers, kpoint, reciprocal_lattice, symprec
+    )
+    rotations = dataset["rotations"]
+    translations = dataset["translations"]
+
+    # Transform to primitive
+    prim_rotations, prim_translations, prim_kpoint = transform_symmetry_and_kpoint(
+        to_primitive, rotations, translations, kpoint_conv
+    )
+    uniq_prim_rotations, uniq_prim_translations, mapping = unique_primitive_symmetry(
+        prim_rotations, prim_translations
+    )
+    mapping_to_prim = np.asarray(mapping)
+
+    prim_irreps, mapping_prim_little_group = get_spacegroup_irreps_from_primitive_symmetry(
+        rotations=uniq_prim_rotations,
+        translations=uniq_prim_translations,
+        kpoint=prim_kpoint,
+        method=method,
+        rtol=rtol,
+        atol=atol,
+        max_num_random_generations=max_num_random_generations,
+    )
+
+    # Lattice translations from centering: (R, t) = (E, n) (R, t_prim)
+    shifts = np.rint(prim_translations - uniq_prim_translations[mapping_to_prim]).astype(int)
+    # Index of conventional operation for each primitive coset
+    mapping_from_prim = np.zeros(len(uniq_prim_rotations), dtype=int)
+    mapping_from_prim[mapping_to_prim[::-1]] = np.arange(len(rotations))[::-1]
+
+    irreps: list[InducedRepresentation] = []
+    for prim_irrep in prim_irreps:
+        prim_induced = induce_small_representation(
+            uniq_prim_rotations,
+            uniq_prim_translations,
+            prim_kpoint,
+            prim_irrep,
+            mapping_prim_little_group,
+            atol=atol,
+        )
+        permutations = prim_induced.permutations[mapping_to_prim]
+        # (E, n) acts on row arm
+        row_phases = np.take_along_axis(
+            prim_induced.get_translation_phases(shifts), permutations, axis=1
+        )
+        blocks = row_phases[:, :, None, None] * prim_induced.blocks[mapping_to_prim]
+        induced = InducedRepresentation(
+            permutations,
+            blocks,
+            prim_induced.kpoints @ np.linalg.inv(to_primitive),
+            coset_representatives=mapping_from_prim[prim_induced.coset_representatives],
+        )
+        irreps.append(induced)
+
+    if materialize:
+        return [irrep.toarray() for irrep in irreps], rotations, translations
+    return irreps, rotations, translations
+
+
+def get_compatibility_relations(
+    lattice: NDArrayFloat,
+    positions: NDArrayFloat,
+    numbers: NDArrayInt,
+    kpoints: NDArrayFloat,
+    edges: list[tuple[int, int]],
+    method: Literal["Neto", "random"] = "Neto",
+    reciprocal_lattice: NDArrayFloat | None = None,
+    symprec: float = 1e-5,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    max_num_random_generations: int = 4,
+) -> tuple[list[list[NDArrayComplex]], list[NDArrayInt]]:
+    r"""Compute compatibility relations of small representations between kpoints.
+
+    For each edge ``(i, j)``, the little group of ``kpoints[j]`` should be a subgroup of that of ``kpoints[i]``, for example, ``kpoints[j]`` lies on a line through ``kpoints[i]``.
+    The small representation :math:`\Delta^{\mathbf{K}}` of :math:`\mathbf{K}` = ``kpoints[i]`` is subduced to the little group of :math:`\mathbf{k}` = ``kpoints[j]`` as
+
+    .. math::
+       (\mathbf{R}, \mathbf{w}) \mapsto e^{ -2 \pi i (\mathbf{k} - \mathbf{K}) \cdot \mathbf{w} } \Delta^{\mathbf{K}}((\mathbf{R}, \mathbf{w})),
+
+    and decomposed into small representations of :math:`\mathbf{k}` by characters.
+    Small representations are computed once for each kpoint, and multiplicities for all edges are computed by one contraction of restricted characters.
+
+    Parameters
+    ----------
+    lattice: array, (3, 3)
+        Row-wise basis vectors. ``lattice[i, :]`` is the i-th lattice vector.
+    positions: array, (num_atoms, 3)
+        Fractional coordinates of sites
+    numbers: array, (num_atoms, )
+        Integer list specifying atomic species
+    kpoints: array, (num_kpoints, 3)
+        Reciprocal vectors with respect to ``reciprocal_lattice``
+    edges: list of (int, int)
+        Pairs of indices of ``kpoints`` from higher-symmetry kpoint to lower-symmetry one
+    method: str, 'Neto' or 'random'
+        'Neto': construct irreps from a fixed chain of subgroups of little co-group
+        'random': construct irreps by numerically diagonalizing a random matrix commute with regular representation
+    reciprocal_lattice: (Optional) array, (3, 3)
+        ``reciprocal_lattice[i, :]`` is the i-th basis vector of reciprocal lattice for ``kpoints`` without `2 * pi factor`.
+        If not specified, ``reciprocal_lattice`` is set to ``np.linalg.inv(lattice).T``.
+    symprec: float
+        Parameter for searching symmetry operation in Spglib
+    rtol: float
+        Relative tolerance for comparing float values
+    atol: float
+        Absolute tolerance to distinguish difference eigenvalues
+    max_num_random_generations: int
+        Maximum number of trials to generate random matrix
+
+    Returns
+    -------
+    irreps: list of list of Irreps
+        ``irreps[i]`` is small representations of ``kpoints[i]`` as returned by :func:`get_spacegroup_irreps`.
+    multiplicities: list of array[int]
+        ``multiplicities[e][alpha, beta]`` is the number of times ``irreps[j][beta]`` appears in ``irreps[i][alpha]`` for ``(i, j) = edges[e]``.
+    """
+    dataset, to_primitive, kpoints_conv = _get_symmetry_dataset_and_kpoint(
+        lattice, positions, numbers, np.atleast_2d(kpoints), reciprocal_lattice, symprec
+    )
+    rotations = dataset["rotations"]
+    translations = dataset["translations"]
+
+    prim_rotations, prim_translations, _ = transform_symmetry_and_kpoint(
+        to_primitive, rotations, translations, kpoints_conv[0]
+    )
+    uniq_prim_rotations, uniq_prim_translations, mapping_to_prim = unique_primitive_symmetry(
+        prim_rotations, prim_translations
+    )
+
+    # Small representations and their characters for each kpoint
+    all_irreps = []
+    all_characters = []
+    all_mappings = []
+    for kpoint_conv in kpoints_conv:
+        prim_kpoint = to_primitive.T @ kpoint_conv
+        prim_irreps, mapping_prim_little_group = get_spacegroup_irreps_from_primitive_symmetry(
+            rotations=uniq_prim_rotations,
+            translations=uniq_prim_translations,
+            kpoint=prim_kpoint,
+            method=method,
+            rtol=rtol,
+            atol=atol,
+            max_num_random_generations=max_num_random_generations,
+        )
+        irreps, mapping_little_group = _adjust_phase_for_centering_translations(
+            prim_translations,
+            prim_kpoint,
+            uniq_prim_translations,
+            mapping_to_prim,
+            prim_irreps,
+            mapping_prim_little_group,
+        )
+        all_irreps.append(irreps)
+        all_characters.append(np.array([np.einsum("kii->k", irrep) for irrep in irreps]))
+        all_mappings.append(mapping_little_group)
+
+    # Restrict characters of kpoints[i] to little group of kpoints[j] for all edges at once.
+    # Characters are padded with zeros, which do not contribute to overlaps.
+    num_edges = len(edges)
+    max_num_irreps = max(len(irreps) for irreps in all_irreps)
+    max_order = max(len(mapping) for mapping in all_mappings)
+    subduced = np.zeros((num_edges, max_num_irreps, max_order), dtype=np.complex128)
+    lower = np.zeros((num_edges, max_num_irreps, max_order), dtype=np.complex128)
+    orders = np.zeros(num_edges, dtype=int)
+    for e, (i, j) in enumerate(edges):
+        indices = np.searchsorted(all_mappings[i], all_mappings[j])
+        indices = np.clip(indices, 0, len(all_mappings[i]) - 1)
+        if not np.all(all_mappings[i][indices] == all_mappings[j]):
+            raise ValueError(
+                f"Little group of kpoints[{j}] is not a subgroup of that of kpoints[{i}]."
+            )
+        phases = np.exp(
+            -2j * np.pi * translations[all_mappings[j]] @ (kpoints_conv[j] - kpoints_conv[i])
+        )
+        order = len(all_mappings[j])
+        subduced[e, : len(all_irreps[i]), :order] = all_characters[i][:, indices] * phases
+        lower[e, : len(all_irreps[j]), :order] = all_characters[j]
+        orders[e] = order
+
+    overlaps = np.einsum("eak,ebk->eab", subduced, np.conj(lower)) / orders[:, None, None]
+    all_multiplicities = np.rint(np.real(overlaps)).astype(int)
+    is_integer = np.all(
+        np.isclose(overlaps, all_multiplicities, rtol=rtol, atol=atol**0.5), axis=(1, 2)
+    )
+    if not np.all(is_integer):
+        i, j = edges[int(np.argmin(is_integer))]
+        raise ValueError(f"Failed to decompose small representations along edge ({i}, {j}).")
+    multiplicities = [
+        all_multiplicities[e, : len(all_irreps[i]), : len(all_irreps[j])]
+        for e, (i, j) in enumerate(edges)
+    ]
+
+    return all_irreps, multiplicities
+
+
 def get_spacegroup_irreps_from_primitive_symmetry(
     rotations: NDArrayInt,
     translations: NDArrayFloat,
@@ -277,9 +676,10 @@ def get_spacegroup_spinor_irreps(
     rtol: float = 1e-5,
     atol: float = 1e-8,
     max_num_random_generations: int = 4,
+    lazy: bool = False,
 ) -> (
     tuple[
-        list[NDArrayComplex],
+        list[NDArrayComplex] | list[ConventionalIrrepView],
         NDArrayComplex,
         NDArrayComplex,
         NDArrayInt,
@@ -287,7 +687,7 @@ def get_spacegroup_spinor_irreps(
         NDArrayInt,
     ]
     | tuple[
-        list[NDArrayComplex],
+        list[NDArrayComplex] | list[ConventionalIrrepView],
         NDArrayComplex,
         NDArrayComplex,
         NDArrayBool,
@@ -339,6 +739,8 @@ def get_spacegroup_spinor_irreps(
         Absolute tolerance to distinguish difference eigenvalues
     max_num_random_generations: int
         Maximum number of trials to generate random matrix
+    lazy: bool, default=False
+        If True, return each irrep as :class:`spgrep.core.ConventionalIrrepView`, which computes representation matrices on demand instead of materializing them for all centering translations.
 
     Returns
     -------
@@ -436,6 +838,7 @@ def get_spacegroup_spinor_irreps(
         mapping_to_prim,
         prim_irreps,
         mapping_prim_little_group,
+        lazy=lazy,
     )
 
     if magmoms is None:
@@ -691,6 +1094,198 @@ def get_crystallographic_pointgroup_spinor_irreps_from_symmetry(
 ################################################################################
 
 
+class ConventionalIrrepView:
+    """Lazy view of a small representation in a conventional cell.
+
+    Representation matrices for the conventional little group are produced on demand from the small representation in a primitive cell:
+    ``view[i] == prim_irrep[indices[i]] * phases[i]``.
+    Use ``np.asarray(view)`` or :meth:`toarray` to materialize all of them at once.
+
+    Parameters
+    ----------
+    prim_irrep: array, (prim_little_group_order, dim, dim)
+        Small representation for symmetry operations in a primitive cell
+    indices: array[int], (little_group_order, )
+        ``indices[i]`` is an index of ``prim_irrep`` corresponding to the ``i``-th operation in the conventional little group.
+    phases: array, (little_group_order, )
+        Phase factors from centering translations
+    atol: float
+        Absolute tolerance to purify values of representation matrices
+    """
+
+    def __init__(
+        self,
+        prim_irrep: NDArrayComplex,
+        indices: NDArrayInt,
+        phases: NDArrayComplex,
+        atol: float = 1e-8,
+    ):
+        """Initialize view without copying ``prim_irrep``."""
+        self.prim_irrep = prim_irrep
+        self.indices = indices
+        self.phases = phases
+        self.atol = atol
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Shape of materialized representation matrices."""
+        dim = self.prim_irrep.shape[1]
+        return (len(self.indices), dim, dim)
+
+    @property
+    def dtype(self):
+        """Data type of materialized representation matrices."""
+        return np.result_type(self.prim_irrep.dtype, self.phases.dtype)
+
+    def __len__(self) -> int:
+        """Return order of conventional little group."""
+        return len(self.indices)
+
+    def __getitem__(self, key) -> NDArrayComplex:
+        """Return representation matrix (or matrices if ``key`` is a slice or an array)."""
+        indices = self.indices[key]
+        phases = self.phases[key]
+        if np.ndim(indices) == 0:
+            return purify_irrep_value(self.prim_irrep[indices] * phases, atol=self.atol)
+        return purify_irrep_value(self.prim_irrep[indices] * phases[:, None, None], atol=self.atol)
+
+    def __iter__(self):
+        """Iterate representation matrices one by one."""
+        for i in range(len(self)):
+            yield self[i]
+
+    def __array__(self, dtype=None, copy=None):
+        """Materialize representation matrices for ``np.asarray``."""
+        irrep = self.toarray()
+        if dtype is not None:
+            irrep = irrep.astype(dtype)
+        return irrep
+
+    def toarray(self) -> NDArrayComplex:
+        """Materialize representation matrices with (little_group_order, dim, dim)."""
+        return self[:]
+
+
+def _restrict_previous_spacegroup_irreps(
+    lattice: NDArrayFloat,
+    positions: NDArrayFloat,
+    numbers: NDArrayInt,
+    kpoint: NDArrayFloat,
+    previous: tuple[list[NDArrayComplex], NDArrayInt, NDArrayFloat, NDArrayInt],
+    reciprocal_lattice: NDArrayFloat | None = None,
+    symprec: float = 1e-5,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    max_num_random_generations: int = 4,
+) -> tuple[list[NDArrayComplex], NDArrayInt, NDArrayFloat, NDArrayInt] | None:
+    """Reduce irreps of ``previous`` restricted to given structure, or return None if failed."""
+    prev_irreps, prev_rotations, prev_translations, prev_mapping_little_group = previous
+    dataset, _, kpoint_conv = _get_symmetry_dataset_and_kpoint(
+        lattice, positions, numbers, kpoint, reciprocal_lattice, symprec
+    )
+    rotations = dataset["rotations"]
+    translations = dataset["translations"]
+
+    # Match operations with previous ones: (R, t) = (E, n) (R_prev, t_prev)
+    prev_indices = _match_operations(prev_rotations, prev_translations, rotations, translations)
+    if prev_indices is None:
+        return None
+
+    # Little group of new structure is its intersection with previous little group
+    positions_in_prev = np.searchsorted(prev_mapping_little_group, prev_indices)
+    positions_in_prev = np.minimum(positions_in_prev, len(prev_mapping_little_group) - 1)
+    in_little_group = prev_mapping_little_group[positions_in_prev] == prev_indices
+    mapping_little_group = np.nonzero(in_little_group)[0]
+    positions_in_prev = positions_in_prev[mapping_little_group]
+    shifts = (
+        translations[mapping_little_group] - prev_translations[prev_indices[mapping_little_group]]
+    )
+    phases = np.exp(-2j * np.pi * shifts @ kpoint_conv)
+
+    # Coset representatives by lattice translations
+    little_rotations = rotations[mapping_little_group]
+    little_translations = translations[mapping_little_group]
+    first_indices = get_rotation_indices(little_rotations, little_rotations)
+    representatives, coset_indices = np.unique(first_indices, return_inverse=True)
+    table = get_cayley_table(little_rotations[representatives])
+    # (R, t) = (E, c) (R, t_rep) with lattice or centering translation c
+    coset_phases = np.exp(
+        -2j
+        * np.pi
+        * (little_translations - little_translations[representatives][coset_indices])
+        @ kpoint_conv
+    )
+
+    # Reduce restricted irreps and collect inequivalent ones
+    irreps: list[NDArrayComplex] = []
+    characters: list[NDArrayComplex] = []
+    for prev_irrep in prev_irreps:
+        restricted = np.asarray(prev_irrep)[positions_in_prev] * phases[:, None, None]
+        for irrep in decompose_representation(
+            restricted[representatives],
+            rtol=rtol,
+            max_num_random_generations=max_num_random_generations,
+            method="isotypic",
+            table=table,
+            atol=atol,
+        ):
+            character = np.einsum("kii->k", irrep)
+            if any(is_equivalent_irrep(character, other) for other in characters):
+                continue
+            characters.append(character)
+            irreps.append(irrep[coset_indices] * coset_phases[:, None, None])
+
+    # Irreps of little co-group should exhaust its order
+    if sum(irrep.shape[1] ** 2 for irrep in irreps) != len(representatives):
+        return None
+
+    irreps = purify_irrep_value_batch(irreps, atol=atol)
+    return irreps, rotations, translations, mapping_little_group
+
+
+def _match_operations(
+    prev_rotations: NDArrayInt,
+    prev_translations: NDArrayFloat,
+    rotations: NDArrayInt,
+    translations: NDArrayFloat,
+    atol: float = 1e-5,
+) -> NDArrayInt | None:
+    """Return indices of previous operations equal to given ones modulo lattice translations, or None if some are missing."""
+    indices = np.zeros(len(rotations), dtype=int)
+    for i, (rotation, translation) in enumerate(zip(rotations, translations)):
+        candidates = np.nonzero(np.all(prev_rotations == rotation[None, :, :], axis=(1, 2)))[0]
+        diff = prev_translations[candidates] - translation[None, :]
+        matched = np.nonzero(np.all(np.abs(diff - np.rint(diff)) < atol, axis=1))[0]
+        if len(matched) == 0:
+            return None
+        indices[i] = candidates[matched[0]]
+    return indices
+
+
+def _get_symmetry_dataset_and_kpoint(
+    lattice: NDArrayFloat,
+    positions: NDArrayFloat,
+    numbers: NDArrayInt,
+    kpoint: NDArrayFloat,
+    reciprocal_lattice: NDArrayFloat | None = None,
+    symprec: float = 1e-5,
+) -> tuple[Any, NDArrayFloat, NDArrayFloat]:
+    """Return symmetry dataset, transformation to primitive, and ``kpoint`` in dual of ``lattice``.
+
+    ``kpoint`` may be a stack of kpoints with (..., 3).
+    """
+    # Transform given `kpoint` in dual of `lattice`
+    if reciprocal_lattice is None:
+        kpoint_conv = np.asarray(kpoint, dtype=np.float64)
+    else:
+        # kpoint @ reciprocal_lattice == kpoint_conv @ np.linalg.inv(lattice).T
+        kpoint_conv = kpoint @ reciprocal_lattice @ np.transpose(lattice)
+
+    dataset = get_symmetry_dataset(cell=(lattice, positions, numbers), symprec=symprec)
+    to_primitive = get_primitive_transformation_matrix(dataset["hall_number"])
+    return dataset, to_primitive, kpoint_conv
+
+
 def _adjust_phase_for_centering_translations(
     prim_translations,
     prim_kpoint,
@@ -698,35 +1293,33 @@ def _adjust_phase_for_centering_translations(
     mapping_to_prim,
     prim_irreps,
     mapping_prim_little_group,
+    lazy=False,
 ):
-    remapping_prim_little_group = {}  # [0..order) -> [0..prim_little_group_order)
-    for i, idx in enumerate(mapping_prim_little_group):
-        remapping_prim_little_group[idx] = i
-
-    mapping_little_group = []  # [0..little_group_order) -> [0..num_sym)
-    mapping_conv_to_prim_little_group = (
-        []
-    )  # [0..little_group_order) -> [0..prim_little_group_order)
-    shifts = []  # (little_group_order, )
-    for i in range(len(mapping_to_prim)):
-        idx_prim = mapping_to_prim[i]  # in [0..order)
-        idx_prim_little = remapping_prim_little_group.get(
-            idx_prim
-        )  # in [0..prim_little_group_order)
-        if idx_prim_little is None:
-            continue
-
-        mapping_little_group.append(i)
-        mapping_conv_to_prim_little_group.append(idx_prim_little)
-        shifts.append(prim_translations[i] - uniq_prim_translations[idx_prim])
-
-    phases = np.array([np.exp(-2j * np.pi * np.dot(prim_kpoint, shift)) for shift in shifts])
-
-    irreps = []
-    for prim_irrep in prim_irreps:
-        # prim_irrep: (little_group_order, dim, dim)
-        irrep = prim_irrep[mapping_conv_to_prim_little_group] * phases[:, None, None]
-        irrep = purify_irrep_value(irrep)
+    order = len(uniq_prim_translations)
+    mapping_to_prim = np.asarray(mapping_to_prim)
+
+    # [0..order) -> [0..prim_little_group_order), -1 if not in little group
+    remapping_prim_little_group = np.full(order, -1, dtype=int)
+    remapping_prim_little_group[mapping_prim_little_group] = np.arange(
+        len(mapping_prim_little_group)
+    )
+
+    # mapping_conv_to_prim_little_group: [0..little_group_order) -> [0..prim_little_group_order)
+    idx_prim_little = remapping_prim_little_group[mapping_to_prim]
+    # mapping_little_group: [0..little_group_order) -> [0..num_sym)
+    mapping_little_group = np.nonzero(idx_prim_little != -1)[0]
+    mapping_conv_to_prim_little_group = idx_prim_little[mapping_little_group]
 
-        irreps.append(irrep)
-    return irreps, np.array(mapping_little_group)
+    shifts = (
+        prim_translations[mapping_little_group]
+        - uniq_prim_translations[mapping_to_prim[mapping_little_group]]
+    )
+    phases = np.exp(-2j * np.pi * shifts @ prim_kpoint)
+
+    irreps = [
+        ConventionalIrrepView(prim_irrep, mapping_conv_to_prim_little_group, phases)
+        for prim_irrep in prim_irreps
+    ]
+    if not lazy:
+        irreps = [irrep.toarray() for irrep in irreps]
+    return irreps, mapping_little_group
@@ -6,11 +6,14 @@ from itertools import product
 
 import numpy as np
 
+from spgrep.pointgroup import get_pointgroup_chain_generators
 from spgrep.utils import (
     NDArrayComplex,
     NDArrayFloat,
     NDArrayInt,
+    encode_rotations,
     ndarray2d_to_integer_tuple,
+    nroot,
 )
 
 
@@ -32,22 +35,48 @@ def get_cayley_table(
     order = rotations.shape[0]
     if time_reversals is None:
         time_reversals = np.zeros((order,), dtype=np.int_)
-
-    operations_list = [
-        (ndarray2d_to_integer_tuple(r), tr) for r, tr in zip(rotations, time_reversals)
-    ]
-
-    table = [[-1 for _ in range(order)] for _ in range(order)]
-    for i, (ri, tri) in enumerate(zip(rotations, time_reversals)):
-        for j, (rj, trj) in enumerate(zip(rotations, time_reversals)):
-            rk = ri @ rj
-            trk = tri != trj
-            k = operations_list.index((ndarray2d_to_integer_tuple(rk), trk))
-            if table[i][j] != -1:
-                ValueError("Should specify a matrix group.")
-            table[i][j] = k
-
-    return np.array(table)
+    time_reversals = np.asarray(time_reversals, dtype=np.int64)
+    products = np.einsum("iab,jbc->ijac", rotations, rotations)
+    product_time_reversals = (time_reversals[:, None] != time_reversals[None, :]).astype(np.int64)
+
+    if not _is_encodable(rotations):
+        # Elements out of range of integer keys: look up products one by one
+        operations: dict[tuple, int] = {}
+        for i, (r, tr) in enumerate(zip(rotations, time_reversals)):
+            operations.setdefault((ndarray2d_to_integer_tuple(r), tr), i)
+        table = np.zeros((order, order), dtype=int)
+        for i, j in product(range(order), repeat=2):
+            key = (ndarray2d_to_integer_tuple(products[i, j]), product_time_reversals[i, j])
+            if key not in operations:
+                raise ValueError("Should specify a matrix group.")
+            table[i, j] = operations[key]
+        return table
+
+    if not _is_encodable(products):
+        # Some product is out of range, so it is not in `rotations`
+        raise ValueError("Should specify a matrix group.")
+
+    # Look up products by integer keys of operations
+    keys = 2 * encode_rotations(rotations) + time_reversals
+    argsort = np.argsort(keys, kind="stable")
+    sorted_keys = keys[argsort]
+
+    product_keys = 2 * encode_rotations(products) + product_time_reversals
+    positions = np.minimum(np.searchsorted(sorted_keys, product_keys), order - 1)
+    if np.any(sorted_keys[positions] != product_keys):
+        raise ValueError("Should specify a matrix group.")
+    table = argsort[positions]
+
+    return table
+
+
+def _is_encodable(rotations: NDArrayInt) -> bool:
+    """Return True iff ``rotations`` can be encoded by :func:`spgrep.utils.encode_rotations`."""
+    rotations = np.around(rotations)
+    # Keys are packed by four bits for each element in int64
+    if rotations.shape[-2] * rotations.shape[-1] > 15:
+        return False
+    return bool(np.all(rotations >= -8) and np.all(rotations <= 7))
 
 
 def get_identity_index(table: NDArrayInt) -> int:
@@ -82,6 +111,82 @@ def get_order(table: NDArrayInt, idx: int) -> int:
     return ret
 
 
+def get_solvable_chain_generators(table: NDArrayInt) -> list[int]:
+    r"""Calculate generators of composition series of given solvable group from its Cayley table.
+
+    The derived series :math:`G \rhd [G, G] \rhd \dots \rhd \{ E \}` is refined so that each factor group is cyclic of prime order.
+
+    Parameters
+    ----------
+    table: array[int], (order, order)
+        Cayley table
+
+    Returns
+    -------
+    generators: list[int]
+        Let :math:`G_{0} := G` and :math:`G_{i} := G_{i-1} / \langle` ``generators[i]`` :math:`\rangle` (i = 0, 1, ...).
+        Then, :math:`G_{i}` is normal subgroup of :math:`G_{i-1}` with prime index.
+        Unlike :func:`spgrep.pointgroup.get_pointgroup_chain_generators`, ``generators[i]`` to the power of the index may not be identity.
+    """
+    order = table.shape[0]
+    identity = get_identity_index(table)
+    inverses = np.argmax(table == identity, axis=1)
+
+    # Derived series
+    derived_series = [np.ones(order, dtype=np.bool_)]
+    while np.count_nonzero(derived_series[-1]) > 1:
+        elements = np.nonzero(derived_series[-1])[0]
+        # commutators[a, b] = a b a^-1 b^-1
+        commutators = table[
+            table[elements[:, None], elements[None, :]],
+            table[inverses[elements][:, None], inverses[elements][None, :]],
+        ]
+        mask = np.zeros(order, dtype=np.bool_)
+        mask[commutators.flatten()] = True
+        commutator_subgroup = _get_generated_subgroup(table, mask)
+        if np.count_nonzero(commutator_subgroup) == len(elements):
+            raise ValueError("Given group is not solvable.")
+        derived_series.append(commutator_subgroup)
+
+    # Refine each Abelian factor group from the bottom
+    generators = []
+    subgroup = derived_series[-1]
+    for larger in derived_series[-2::-1]:
+        while np.count_nonzero(subgroup) < np.count_nonzero(larger):
+            x = np.nonzero(larger & ~subgroup)[0][0]
+            # Smallest power of `x` in `subgroup`
+            powers = [x]
+            while not subgroup[powers[-1]]:
+                powers.append(table[powers[-1], x])
+            n = len(powers)
+            q = min(d for d in range(2, n + 1) if n % d == 0)
+            # x^(n/q) has index q over `subgroup`
+            r = powers[n // q - 1]
+            generators.append(int(r))
+
+            # Extend subgroup by `r`: <r> subgroup = sum_{a < q} r^a subgroup
+            extended = subgroup.copy()
+            coset = np.nonzero(subgroup)[0]
+            for _ in range(q - 1):
+                coset = table[r, coset]
+                extended[coset] = True
+            subgroup = extended
+
+    return generators[::-1]
+
+
+def _get_generated_subgroup(table: NDArrayInt, mask: NDArrayInt) -> NDArrayInt:
+    """Return boolean mask of subgroup generated by elements in ``mask``."""
+    subgroup = mask.copy()
+    while True:
+        elements = np.nonzero(subgroup)[0]
+        extended = subgroup.copy()
+        extended[table[elements[:, None], elements[None, :]].flatten()] = True
+        if np.count_nonzero(extended) == len(elements):
+            return subgroup
+        subgroup = extended
+
+
 def is_matrix_group(rotations: NDArrayInt) -> bool:
     """Return True iff given integer matrices forms group."""
     try:
@@ -91,11 +196,7 @@ def is_matrix_group(rotations: NDArrayInt) -> bool:
 
     # Check if each element appears only once in a row
     order = rotations.shape[0]
-    for i in range(order):
-        if set(table[i]) != set(range(order)):
-            return False
-
-    return True
+    return bool(np.all(np.sort(table, axis=1) == np.arange(order)[None, :]))
 
 
 def get_factor_system_from_little_group(
@@ -139,6 +240,98 @@ def get_factor_system_from_little_group(
     return factor_system
 
 
+def get_canonical_factor_system(
+    rotations: NDArrayInt,
+    factor_system: NDArrayComplex,
+    table: NDArrayInt | None = None,
+    solvable_chain_generators: list[int] | None = None,
+) -> tuple[NDArrayComplex, NDArrayComplex]:
+    r"""Reduce factor system to canonical representative of its class in :math:`H^{2}(G, U(1))`.
+
+    Let :math:`r_{1}, \dots, r_{m}` be ``solvable_chain_generators`` and :math:`G_{i} := \langle r_{i}, \dots, r_{m} \rangle`.
+    Each operation is uniquely written as :math:`r_{i}^{a} s` with :math:`s \in G_{i+1}` and :math:`0 \leq a < p_{i}`,
+    where :math:`p_{i}` is the smallest positive integer with :math:`r_{i}^{p_{i}} \in G_{i+1}`.
+    The gauge is fixed so that projective representations :math:`D'` with the canonical factor system satisfy
+
+    .. math::
+       D'(r_{i}^{a} s) = D'(r_{i})^{a} D'(s), \quad D'(r_{i})^{p_{i}} = D'(r_{i}^{p_{i}}), \quad D'(E) = 1.
+
+    The remaining :math:`p_{i}`-th roots of unity for :math:`D'(r_{i})` are chosen to minimize phases of the canonical factor system lexicographically.
+    Thus, factor systems differing only by a coboundary are reduced to the same canonical one, and their irreps are related by a diagonal gauge:
+    ``irrep[k] = canonical_irrep[k] / gauge[k]``.
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+        Crystallographic point group in primitive basis
+    factor_system: array, (order, order)
+    table: (Optional) array[int], (order, order)
+        Precomputed Cayley table of ``rotations``
+    solvable_chain_generators: (Optional) list[int]
+        Generators of solvable group chain.
+        If not specified, they are obtained by :func:`spgrep.pointgroup.get_pointgroup_chain_generators`.
+
+    Returns
+    -------
+    canonical: array, (order, order)
+        ``canonical[i, j] = factor_system[i, j] * gauge[i] * gauge[j] / gauge[table[i, j]]``
+    gauge: array, (order, )
+    """
+    if table is None:
+        table = get_cayley_table(rotations)
+    if solvable_chain_generators is None:
+        solvable_chain_generators = get_pointgroup_chain_generators(rotations)
+
+    order = table.shape[0]
+    identity = get_identity_index(table)
+
+    # Decompose group as G_{i} = sum_{a} r_{i}^{a} G_{i+1} from the smallest subgroup
+    steps = []
+    subgroup = [identity]
+    for r in solvable_chain_generators[::-1]:
+        powers = [identity]  # powers[a] = r^a
+        # coeffs[a] = c s.t. D(r)^a = c D(r^a)
+        coeffs = [1 / factor_system[identity, identity]]
+        while powers[-1] not in subgroup or len(powers) == 1:
+            coeffs.append(coeffs[-1] * factor_system[powers[-1], r])
+            powers.append(table[powers[-1], r])
+        index = len(powers) - 1
+        steps.append((r, index, powers, coeffs, subgroup))
+        subgroup = [table[powers[a], s] for a in range(index) for s in subgroup]
+    if len(subgroup) != order:
+        raise ValueError("Given generators do not generate whole group.")
+
+    # Fix gauge for each choice of roots of unity
+    gauges = []
+    for choice in product(*[range(index) for _, index, _, _, _ in steps]):
+        gauge = np.zeros(order, dtype=np.complex128)
+        gauge[identity] = 1 / factor_system[identity, identity]
+        for (r, index, powers, coeffs, subgroup), c in zip(steps, choice):
+            # D'(r)^p = D'(r^p)
+            gauge[r] = nroot(gauge[powers[index]] / coeffs[index], index) * np.exp(
+                2j * np.pi * c / index
+            )
+            # D'(r^a s) = D'(r)^a D'(s)
+            for a in range(1, index):
+                for s in subgroup:
+                    gauge[table[powers[a], s]] = (
+                        gauge[r] ** a * gauge[s] * coeffs[a] * factor_system[powers[a], s]
+                    )
+        gauges.append(gauge)
+    gauges = np.array(gauges)
+
+    # canonicals[c, i, j] = factor_system[i, j] * gauge[c, i] * gauge[c, j] / gauge[c, table[i, j]]
+    canonicals = (
+        factor_system[None, :, :] * gauges[:, :, None] * gauges[:, None, :] / gauges[:, table]
+    )
+
+    # Choose lexicographically smallest phases. Phases are quantized by multiples of 1/8!
+    quantized = np.around(np.angle(canonicals) / (2 * np.pi) * 40320).astype(int) % 40320
+    quantized = quantized.reshape(len(gauges), -1)
+    best = np.lexsort(quantized.T[::-1])[0]
+    return canonicals[best], gauges[best]
+
+
 def get_little_group(
     rotations: NDArrayInt,
     translations: NDArrayFloat,
@@ -184,19 +377,41 @@ def get_little_group(
 def check_cocycle_condition(
     rotations: NDArrayInt,
     factor_system: NDArrayComplex,
+    table: NDArrayInt | None = None,
+    chunk_size: int | None = None,
 ) -> bool:
-    """Return true if given factor system satisfies the cocycle condition."""
-    if not is_matrix_group(rotations):
-        return False
+    r"""Return true if given factor system satisfies the cocycle condition.
 
-    rotations_int = [ndarray2d_to_integer_tuple(r) for r in rotations]
+    .. math::
+       \mu(g_{i}, g_{j}g_{k}) \mu(g_{j}, g_{k}) = \mu(g_{i}g_{j}, g_{k}) \mu(g_{i}, g_{j})
 
-    for i, j, k in product(range(len(rotations)), repeat=3):
-        jk = rotations_int.index(ndarray2d_to_integer_tuple(rotations[j] @ rotations[k]))
-        ij = rotations_int.index(ndarray2d_to_integer_tuple(rotations[i] @ rotations[j]))
-        if not np.isclose(
-            factor_system[i, jk] * factor_system[j, k], factor_system[ij, k] * factor_system[i, j]
-        ):
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+    factor_system: array, (order, order)
+    table: (Optional) array[int], (order, order)
+        Precomputed Cayley table of ``rotations``.
+        If specified, ``rotations`` is assumed to form a group and products are not recomputed.
+    chunk_size: (Optional) int
+        Number of operations :math:`g_{i}` checked at once. Temporary arrays take O(chunk_size * order^2).
+        If not specified, chosen to keep temporary arrays about 2^24 elements.
+    """
+    if table is None:
+        if not is_matrix_group(rotations):
+            return False
+        table = get_cayley_table(rotations)
+
+    order = table.shape[0]
+    if chunk_size is None:
+        chunk_size = max(1, 2**24 // (order * order))
+
+    for start in range(0, order, chunk_size):
+        end = min(start + chunk_size, order)
+        # lhs[i, j, k] = factor_system[i, jk] * factor_system[j, k]
+        lhs = factor_system[start:end][:, table] * factor_system[None, :, :]
+        # rhs[i, j, k] = factor_system[ij, k] * factor_system[i, j]
+        rhs = factor_system[table[start:end]] * factor_system[start:end, :, None]
+        if not np.allclose(lhs, rhs):
             return False
 
     return True
@@ -0,0 +1,374 @@
+"""Induced representations of space groups from small representations."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+
+from spgrep.group import get_little_group
+from spgrep.irreps import enumerate_small_representations
+from spgrep.representation import BlockMonomialRepresentation
+from spgrep.utils import NDArrayComplex, NDArrayFloat, NDArrayInt, get_rotation_indices
+
+
+class InducedRepresentation(BlockMonomialRepresentation):
+    r"""Representation of space group induced from small representation of little group.
+
+    Let :math:`\{ \mathbf{k}_{\sigma} \}_{\sigma}` be the star of :math:`\mathbf{k}` and :math:`g_{\sigma}` be a coset representative with :math:`\mathbf{k}_{\sigma} = g_{\sigma} \mathbf{k}`.
+    The ``i``-th operation :math:`g_{i}` maps the ``sigma``-th arm to the ``permutations[i, sigma]``-th arm :math:`\sigma'` with block
+
+    .. math::
+       \Delta(g_{\sigma'}^{-1} g_{i} g_{\sigma}),
+
+    where :math:`\Delta` is a small representation.
+    Only blocks for coset representatives of translation subgroup are stored.
+    A pure translation :math:`(\mathbf{E}, \mathbf{n})` acts on the ``sigma``-th arm as :math:`\exp(-2 \pi i \mathbf{k}_{\sigma} \cdot \mathbf{n})`.
+
+    Parameters
+    ----------
+    permutations: array[int], (order, num_arms)
+    blocks: array, (order, num_arms, dim_small, dim_small)
+    kpoints: array, (num_arms, 3)
+        Arms of star
+    coset_representatives: (Optional) array[int], (num_arms, )
+        ``coset_representatives[sigma]`` is an index of operation :math:`g_{\sigma}`
+    mesh: (Optional) array[int], (3, )
+        If specified, this is regarded as a representation of quotient group :math:`G/T_{N}` of space group modulo supercell translations,
+        where ``mesh[a]`` is the number of repetitions along the ``a``-th lattice vector.
+        Operations of quotient group are ordered as ``i * prod(mesh) + flat_n``, where ``flat_n`` enumerates lattice translations in ``np.ndindex(*mesh)``.
+    """
+
+    def __init__(
+        self,
+        permutations: NDArrayInt,
+        blocks: NDArrayComplex,
+        kpoints: NDArrayFloat,
+        coset_representatives: NDArrayInt | None = None,
+        mesh: NDArrayInt | None = None,
+    ):
+        """Store arms of star and blocks of induced representation without materializing its matrices."""
+        super().__init__(permutations, blocks)
+        self._kpoints = np.asarray(kpoints, dtype=np.float64)
+        if self._kpoints.shape != (self.num_blocks, 3):
+            raise ValueError("Given kpoints do not match with number of arms.")
+        self._coset_representatives = (
+            None if coset_representatives is None else np.asarray(coset_representatives, dtype=int)
+        )
+        self._mesh = None if mesh is None else np.asarray(mesh, dtype=int)
+
+    @property
+    def kpoints(self) -> NDArrayFloat:
+        """Return arms of star."""
+        return self._kpoints
+
+    @property
+    def num_arms(self) -> int:
+        """Return number of arms of star."""
+        return self.num_blocks
+
+    @property
+    def coset_representatives(self) -> NDArrayInt | None:
+        """Return indices of coset representatives for arms."""
+        return self._coset_representatives
+
+    @property
+    def mesh(self) -> NDArrayInt | None:
+        """Return supercell mesh for quotient group."""
+        return self._mesh
+
+    def get_translation_phases(self, lattice_translations: NDArrayInt) -> NDArrayComplex:
+        """Return phases of pure lattice translations on each arm.
+
+        Parameters
+        ----------
+        lattice_translations: array[int], (num_translations, 3)
+
+        Returns
+        -------
+        phases: array, (num_translations, num_arms)
+        """
+        return np.exp(-2j * np.pi * np.asarray(lattice_translations) @ self._kpoints.T)
+
+    def get_quotient_character(self) -> NDArrayComplex:
+        """Calculate character of representation of quotient group without materializing matrices.
+
+        Returns
+        -------
+        character: array, (order * prod(mesh), )
+        """
+        phases = self.get_translation_phases(self._get_mesh_translations())
+        fixed = self._permutations == np.arange(self.num_arms)[None, :]
+        traces = np.where(fixed, np.einsum("ksaa->ks", self._blocks), 0)
+        character = np.einsum("ks,vs->kv", traces, phases, optimize="greedy")
+        return character.reshape(-1).astype(np.complex128)
+
+    def toarray_quotient(self) -> NDArrayComplex:
+        """Return dense representation matrices of quotient group.
+
+        Returns
+        -------
+        rep: array, (order * prod(mesh), dim, dim)
+        """
+        phases = self.get_translation_phases(self._get_mesh_translations())
+        # Translation acts on rows by arms
+        row_phases = np.repeat(phases, self.block_dim, axis=1)  # (num_translations, dim)
+        rep = row_phases[None, :, :, None] * self.toarray()[:, None, :, :]
+        return rep.reshape(-1, self.shape[1], self.shape[2])
+
+    def tensor_product(self, other: InducedRepresentation) -> InducedRepresentation:
+        """Return tensor product with other representation in block-monomial form.
+
+        Blocks are labeled by pairs of arms ``(sigma, tau)`` as ``sigma * other.num_arms + tau``, and their kpoints are ``kpoints[sigma] + other.kpoints[tau]``.
+        The product is not irreducible in general; use :func:`spgrep.irreps.decompose_representation` to reduce it.
+
+        Parameters
+        ----------
+        other: InducedRepresentation
+            Representation for the same symmetry operations
+
+        Returns
+        -------
+        product: InducedRepresentation
+        """
+        if self.order != other.order:
+            raise ValueError("Representations are given for different number of operations.")
+        permutations = (
+            self._permutations[:, :, None] * other.num_arms + other.permutations[:, None, :]
+        ).reshape(self.order, -1)
+        blocks = np.einsum("ksab,ktcd->kstacbd", self._blocks, other.blocks, optimize="greedy")
+        dim = self.block_dim * other.block_dim
+        blocks = blocks.reshape(self.order, -1, dim, dim)
+        kpoints = (self._kpoints[:, None, :] + other.kpoints[None, :, :]).reshape(-1, 3)
+        mesh = None
+        if (
+            self._mesh is not None
+            and other.mesh is not None
+            and np.array_equal(self._mesh, other.mesh)
+        ):
+            mesh = self._mesh
+        return InducedRepresentation(permutations, blocks, kpoints, mesh=mesh)
+
+    def _get_mesh_translations(self) -> NDArrayInt:
+        if self._mesh is None:
+            raise ValueError("Mesh is not specified for this representation.")
+        return np.array(list(np.ndindex(*self._mesh)), dtype=int).reshape(-1, 3)
+
+
+def induce_small_representation(
+    rotations: NDArrayInt,
+    translations: NDArrayFloat,
+    kpoint: NDArrayFloat,
+    small_rep: NDArrayComplex | NDArrayFloat,
+    mapping_little_group: NDArrayInt,
+    mesh: NDArrayInt | None = None,
+    atol: float = 1e-8,
+) -> InducedRepresentation:
+    """Construct representation of space group induced from small representation.
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+        Rotation parts of coset representatives of space group by translation subgroup in primitive basis
+    translations: array, (order, 3)
+    kpoint: array, (3, )
+    small_rep: array, (little_order, dim_small, dim_small)
+        Small representation. ``small_rep[idx]`` is for ``rotations[mapping_little_group[idx]]``.
+    mapping_little_group: array[int], (little_order, )
+        Returned by :func:`spgrep.group.get_little_group`
+    mesh: (Optional) array[int], (3, )
+        Supercell mesh for quotient group
+    atol: float
+        Absolute tolerance to compare kpoints
+
+    Returns
+    -------
+    induced: InducedRepresentation
+    """
+    rotations = np.asarray(rotations)
+    translations = np.asarray(translations)
+    kpoint = np.asarray(kpoint, dtype=np.float64)
+    little_rotations = rotations[mapping_little_group]
+    little_translations = translations[mapping_little_group]
+
+    # Arms of star: g k = R^-T k
+    inv_rotations = np.linalg.inv(rotations)
+    rotated = np.einsum("iba,b->ia", inv_rotations, kpoint)
+    kpoints: list[NDArrayFloat] = []
+    coset_representatives = []
+    arms = np.zeros(len(rotations), dtype=int)  # g_i k = kpoints[arms[i]]
+    for i, ki in enumerate(rotated):
+        for sigma, k_sigma in enumerate(kpoints):
+            diff = ki - k_sigma
+            if np.allclose(diff, np.rint(diff), atol=atol):
+                arms[i] = sigma
+                break
+        else:
+            arms[i] = len(kpoints)
+            kpoints.append(ki)
+            coset_representatives.append(i)
+
+    # g_i g_sigma = (R_i R_sigma, R_i t_sigma + t_i) belongs to arm permutations[i, sigma]
+    reps_rotations = rotations[coset_representatives]
+    reps_translations = translations[coset_representatives]
+    products = np.einsum("iab,sbc->isac", rotations, reps_rotations)
+    permutations = arms[get_rotation_indices(rotations, products)]
+
+    # h = g_{sigma'}^-1 g_i g_sigma in little group
+    inv_reps = inv_rotations[coset_representatives][permutations]  # (order, num_arms, 3, 3)
+    h_rotations = np.einsum("isab,isbc->isac", inv_reps, products)
+    h_translations = np.einsum(
+        "isab,isb->isa",
+        inv_reps,
+        np.einsum("iab,sb->isa", rotations, reps_translations)
+        + translations[:, None, :]
+        - reps_translations[permutations],
+    )
+    little_indices = get_rotation_indices(little_rotations, h_rotations)
+    # Delta((E, l) g_j) = exp(-2 pi i k.l) Delta(g_j)
+    lattice_parts = h_translations - little_translations[little_indices]
+    phases = np.exp(-2j * np.pi * np.einsum("isa,a->is", lattice_parts, kpoint))
+    blocks = phases[:, :, None, None] * small_rep[little_indices]
+
+    kpoints_array = np.array(kpoints)
+    kpoints_array -= np.floor(kpoints_array + atol)  # Reduce into [0, 1)
+    return InducedRepresentation(
+        permutations,
+        blocks,
+        kpoints_array,
+        coset_representatives=np.array(coset_representatives, dtype=int),
+        mesh=mesh,
+    )
+
+
+def enumerate_quotient_irreps(
+    rotations: NDArrayInt,
+    translations: NDArrayFloat,
+    mesh: NDArrayInt,
+    method: Literal["Neto", "random"] = "Neto",
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    max_num_random_generations: int = 4,
+) -> list[InducedRepresentation]:
+    r"""Enumerate all irreps of space group modulo supercell translations :math:`G/T_{N}`.
+
+    Irreps are induced from small representations star by star over kpoints commensurate with ``mesh``.
+    The order of :math:`G/T_{N}` is ``len(rotations) * prod(mesh)``, but only blocks of each arm for ``len(rotations)`` coset representatives are stored.
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+        Rotation parts of coset representatives of space group by translation subgroup in primitive basis
+    translations: array, (order, 3)
+    mesh: array[int], (3, )
+        Supercell mesh. Supercell translations should be preserved by ``rotations``.
+    method: str, 'Neto' or 'random'
+        Method to compute small representations. See :func:`spgrep.irreps.enumerate_small_representations`.
+    rtol: float
+        Relative tolerance to distinguish difference eigenvalues
+    atol: float
+        Relative tolerance to compare
+    max_num_random_generations: int
+        Maximum number of trials to generate random matrix
+
+    Returns
+    -------
+    irreps: list of InducedRepresentation
+        Unitary irreps of :math:`G/T_{N}`. Use :meth:`InducedRepresentation.toarray_quotient` to materialize them.
+    """
+    mesh = np.asarray(mesh, dtype=int)
+    num_kpoints = int(np.prod(mesh))
+
+    # Action on kpoints commensurate with mesh: m -> N R^-T N^-1 m
+    kpoint_transforms = np.einsum(
+        "a,iba,b->iab", mesh, np.linalg.inv(rotations), 1 / mesh, optimize="greedy"
+    )
+    if not np.allclose(kpoint_transforms, np.rint(kpoint_transforms), atol=atol):
+        raise ValueError("Given mesh is not preserved by rotations.")
+    kpoint_transforms = np.rint(kpoint_transforms).astype(int)
+
+    mesh_points = np.array(list(np.ndindex(*mesh)), dtype=int).reshape(-1, 3)
+    visited = np.zeros(num_kpoints, dtype=np.bool_)
+    irreps = []
+    for flat, m in enumerate(mesh_points):
+        if visited[flat]:
+            continue
+        star = np.remainder(kpoint_transforms @ m, mesh)  # (order, 3)
+        visited[np.ravel_multi_index(star.T, mesh)] = True
+
+        kpoint = m / mesh
+        little_rotations, little_translations, mapping_little_group = get_little_group(
+            rotations, translations, kpoint, atol=atol
+        )
+        small_reps, _ = enumerate_small_representations(
+            little_rotations,
+            little_translations,
+            kpoint,
+            method=method,
+            rtol=rtol,
+            atol=atol,
+            max_num_random_generations=max_num_random_generations,
+        )
+        for small_rep in small_reps:
+            irreps.append(
+                induce_small_representation(
+                    rotations,
+                    translations,
+                    kpoint,
+                    small_rep,
+                    mapping_little_group,
+                    mesh=mesh,
+                    atol=atol,
+                )
+            )
+
+    return irreps
+
+
+def get_quotient_cayley_table(
+    rotations: NDArrayInt,
+    translations: NDArrayFloat,
+    mesh: NDArrayInt,
+) -> NDArrayInt:
+    """Calculate Cayley table of space group modulo supercell translations.
+
+    This takes O((order * prod(mesh))^2) memory and is intended for small meshes.
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+    translations: array, (order, 3)
+    mesh: array[int], (3, )
+
+    Returns
+    -------
+    table: array[int], (order * prod(mesh), order * prod(mesh))
+        Operations are ordered as same as :class:`InducedRepresentation`.
+    """
+    mesh = np.asarray(mesh, dtype=int)
+    order = len(rotations)
+    mesh_points = np.array(list(np.ndindex(*mesh)), dtype=int).reshape(-1, 3)
+
+    # (R_i, t_i + n) (R_j, t_j + m) = (R_k, t_k + n + R_i m + l_ij)
+    products = get_rotation_indices(rotations, np.einsum("iab,jbc->ijac", rotations, rotations))
+    lattice_parts = (
+        np.einsum("iab,jb->ija", rotations, translations)
+        + translations[:, None, :]
+        - translations[products]
+    )
+    lattice_parts = np.rint(lattice_parts).astype(int)
+
+    # new_translations[i, j, n, m] = n + R_i m + l_ij
+    rotated = np.einsum("iab,mb->ima", rotations, mesh_points)
+    new_translations = (
+        mesh_points[None, None, :, None, :]
+        + rotated[:, None, None, :, :]
+        + lattice_parts[:, :, None, None, :]
+    )
+    flat = np.ravel_multi_index(
+        np.moveaxis(np.remainder(new_translations, mesh), -1, 0), mesh
+    )  # (order, order, num_translations, num_translations)
+    table = products[:, :, None, None] * len(mesh_points) + flat
+    # Reorder to [(i, n), (j, m)]
+    table = np.transpose(table, (0, 2, 1, 3)).reshape(order * len(mesh_points), -1)
+    return table
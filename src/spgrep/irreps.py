@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from itertools import product
-from typing import Literal
+from typing import Literal, overload
 from warnings import warn
 
 import numpy as np
@@ -13,16 +14,32 @@ from spgrep.group import (
     get_factor_system_from_little_group,
     get_identity_index,
     get_inverse_index,
-    get_order,
+    get_solvable_chain_generators,
 )
 from spgrep.pointgroup import get_pointgroup_chain_generators
 from spgrep.representation import (
+    BlockMonomialRepresentation,
     frobenius_schur_indicator,
     get_character,
     get_intertwiner,
     get_projective_regular_representation,
 )
-from spgrep.utils import NDArrayComplex, NDArrayFloat, NDArrayInt, nroot
+from spgrep.utils import (
+    NDArrayComplex,
+    NDArrayFloat,
+    NDArrayInt,
+    get_rotation_indices,
+    get_rotations_key,
+    nroot,
+)
+
+MAX_SUBDUCTION_CACHE_SIZE = 1024
+# (Encoded rotations of G, encoded rotations of H) -> indices of H in G
+_subduction_cache: OrderedDict[tuple[str, str], NDArrayInt] = OrderedDict()
+# (Encoded rotations of H, method, rtol, atol) -> irreps of H computed by subduce_irreps
+_subgroup_irreps_cache: OrderedDict[tuple[str, str, float, float], list[NDArrayComplex]] = (
+    OrderedDict()
+)
 
 
 def enumerate_small_representations(
@@ -160,7 +177,8 @@ def enumerate_unitary_irreps(
     real: bool, default=False
         If True, return irreps over real vector space (so called physically irreducible representations)
     method: str, 'Neto' or 'random'
-        'Neto': construct irreps from a fixed chain of subgroups of little co-group
+        'Neto': construct irreps from a fixed chain of subgroups of little co-group.
+        If ``rotations`` is not a tabulated crystallographic point group, the chain is searched from its Cayley table.
         'random': construct irreps by numerically diagonalizing a random matrix commute with regular representation
     rtol: float
         Relative tolerance to distinguish difference eigenvalues
@@ -181,7 +199,11 @@ def enumerate_unitary_irreps(
 
     if method == "Neto":
         table = get_cayley_table(rotations)
-        solvable_chain_generators = get_pointgroup_chain_generators(rotations)
+        try:
+            solvable_chain_generators = get_pointgroup_chain_generators(rotations)
+        except ValueError:
+            # Not tabulated, e.g. magnetic point groups or quotient groups
+            solvable_chain_generators = get_solvable_chain_generators(table)
         irreps = enumerate_unitary_irreps_from_solvable_group_chain(
             table,
             factor_system,
@@ -198,8 +220,7 @@ def enumerate_unitary_irreps(
         raise ValueError(f"Unknown method to compute irreps: {method}")
 
     # Purify values of `irreps`.
-    for irrep in irreps:
-        irrep = purify_irrep_value(irrep, atol=atol)
+    irreps = purify_irrep_value_batch(irreps, atol=atol)
 
     if not real:
         indicators = [frobenius_schur_indicator(irrep) for irrep in irreps]
@@ -303,25 +324,67 @@ def enumerate_unitary_irreps_from_regular_representation(
 
 
 def decompose_representation(
-    representation: NDArrayComplex,
+    representation: NDArrayComplex | BlockMonomialRepresentation,
     rtol: float = 1e-5,
     max_num_random_generations: int = 4,
+    method: Literal["random", "isotypic"] = "random",
+    table: NDArrayInt | None = None,
+    factor_system: NDArrayComplex | None = None,
+    exploit_sparsity: bool = True,
+    atol: float = 1e-8,
 ) -> list[NDArrayComplex]:
     """Decompose given (projective) representation into all unitary irreps.
 
     Parameters
     ----------
-    representation: array, (order, dim0, dim0)
+    representation: array, (order, dim0, dim0) or BlockMonomialRepresentation
         (Projective) representation. representation[k] is a representation matrix for the k-th operation.
     rtol: float
         Relative tolerance to distinguish difference eigenvalues
     max_num_random_generations: int
         Maximum number of trials to generate random matrix
+    method: str, 'random' or 'isotypic'
+        'random': numerically diagonalize a random matrix commute with ``representation`` on the whole space.
+        This takes O(order * dim0^3) and assumes each irrep appears at most once in ``representation``.
+        'isotypic': first split the whole space into isotypic components by a random central element of the group algebra, which costs O(order * dim0^2),
+        and then diagonalize a random commuting matrix only within each component.
+        The central element is a random linear combination of (twisted) class sums, so a single ``eigh`` separates all isotypic components
+        without building a projector for each irrep, whose characters are not known in advance.
+        Requires ``table``.
+    table: (Optional) array[int], (order, order)
+        Cayley table of the group
+    factor_system: (Optional) array, (order, order)
+        Factor system of ``representation``. If not specified, it is read off from ``representation`` and ``table``.
+    exploit_sparsity: bool, default=True
+        Only used for 'isotypic' method.
+        If True, split the whole space into invariant subspaces spanned by subsets of the standard basis before decomposition.
+        This is effective for block-sparse representations such as permutation-times-block representations on atomic sites.
+        For BlockMonomialRepresentation, the subspaces are taken from orbits of blocks without densifying the whole representation.
+    atol: float
+        Absolute tolerance to detect nonzero matrix elements
 
     Returns
     -------
     irreps: list of unitary Irreps with (order, dim, dim)
     """
+    if method == "isotypic":
+        if table is None:
+            raise ValueError("Specify Cayley table for isotypic decomposition.")
+        return _decompose_representation_by_isotypic_components(
+            representation,
+            table,
+            factor_system=factor_system,
+            exploit_sparsity=exploit_sparsity,
+            rtol=rtol,
+            atol=atol,
+            max_num_random_generations=max_num_random_generations,
+        )
+    elif method != "random":
+        raise ValueError(f"Unknown method to decompose representation: {method}")
+
+    if isinstance(representation, BlockMonomialRepresentation):
+        representation = representation.toarray()
+
     dim0 = representation.shape[1]
 
     rng = np.random.default_rng(seed=0)
@@ -340,7 +403,7 @@ def decompose_representation(
         )
 
         # Decompose to subspaces corresponding to Irreps
-        irreps = _get_irreps_from_matrix(representation, matrix, rtol=rtol)
+        irreps = _get_irreps_from_matrix(representation, matrix, rtol=rtol, atol=atol)
 
         if np.sum([irrep.shape[1] for irrep in irreps]) == dim0:
             return irreps
@@ -349,58 +412,257 @@ def decompose_representation(
     return []
 
 
+def _decompose_representation_by_isotypic_components(
+    representation: NDArrayComplex | BlockMonomialRepresentation,
+    table: NDArrayInt,
+    factor_system: NDArrayComplex | None = None,
+    exploit_sparsity: bool = True,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    max_num_random_generations: int = 4,
+) -> list[NDArrayComplex]:
+    rng = np.random.default_rng(seed=0)
+    irreps: list[NDArrayComplex] = []
+    characters: list[NDArrayComplex] = []
+    for sub_rep in _iterate_invariant_subrepresentations(
+        representation, exploit_sparsity=exploit_sparsity, atol=atol
+    ):
+        if factor_system is None:
+            # All subrepresentations share the same factor system
+            factor_system = _get_factor_system_from_representation(sub_rep, table)
+
+        # Hermitian central element acts as a scalar on each isotypic component.
+        # Distinct irreps give distinct scalars for generic random weights.
+        central = np.einsum(
+            "k,kij->ij",
+            _get_random_central_weights(table, factor_system, rng),
+            sub_rep,
+            optimize="greedy",
+        )
+        central += np.conj(central.T)
+        eigvals, eigvecs = np.linalg.eigh(central)
+        starts, ends = _cluster_sorted_eigenvalues(eigvals, rtol=rtol)
+
+        for start, end in zip(starts, ends):
+            # Representation restricted to isotypic component
+            transformation = eigvecs[:, start:end]
+            component = np.einsum(
+                "li,klm,mj->kij",
+                np.conj(transformation),
+                sub_rep,
+                transformation,
+                optimize="greedy",
+            )
+            irrep = _get_irrep_from_isotypic_component(
+                component,
+                rng,
+                rtol=rtol,
+                max_num_random_generations=max_num_random_generations,
+            )
+            if irrep is None:
+                warn("Failed to search all irreps. Try increasing max_num_random_generations.")
+                return []
+
+            character = get_character(irrep)
+            if any(is_equivalent_irrep(character, c) for c in characters):
+                continue
+            irreps.append(irrep)
+            characters.append(character)
+
+    # sort Irreps by (dim, minus of sum of characters)
+    argidx = sorted(range(len(irreps)), key=lambda i: (irreps[i].shape[1], -np.sum(characters[i])))
+    return [irreps[i] for i in argidx]
+
+
+def _get_irrep_from_isotypic_component(
+    component: NDArrayComplex,
+    rng: np.random.Generator,
+    rtol: float = 1e-5,
+    max_num_random_generations: int = 4,
+) -> NDArrayComplex | None:
+    """Return irrep contained in isotypic ``component``, or None if failed."""
+    order = component.shape[0]
+    dim_component = component.shape[1]
+    character_component = get_character(component)
+    if np.around(np.real(np.vdot(character_component, character_component))) == order:
+        # Already irreducible
+        return component
+
+    for _ in range(max_num_random_generations):
+        hermite_random = rng.random((dim_component, dim_component)) + 1j * rng.random(
+            (dim_component, dim_component)
+        )
+        hermite_random += np.conj(hermite_random.T)
+        matrix = np.einsum(
+            "mik,kl,mjl->ij", component, hermite_random, np.conj(component), optimize="greedy"
+        )
+        irreps = _get_irreps_from_matrix(component, matrix, rtol=rtol)
+        if len(irreps) != 1:
+            continue
+
+        # `component` should be a direct sum of copies of irrep
+        irrep = irreps[0]
+        multiplicity = dim_component / irrep.shape[1]
+        overlap = np.vdot(get_character(irrep), character_component)
+        if np.isclose(overlap, order * multiplicity):
+            return irrep
+
+    return None
+
+
+def _get_random_central_weights(
+    table: NDArrayInt, factor_system: NDArrayComplex, rng: np.random.Generator
+) -> NDArrayComplex:
+    r"""Return weights :math:`w` s.t. :math:`\sum_{x} w_{x} D(x)` commutes with projective representation :math:`D`.
+
+    The weights are taken from :math:`\sum_{g, h} r_{g} D(h) D(g) D(h)^{-1}` for random :math:`r_{g}`, where
+
+    .. math::
+       D(h) D(g) D(h)^{-1} = \frac{ \mu(h, g) \mu(hg, h^{-1}) }{ \mu(h, h^{-1}) \mu(E, E) } D(hgh^{-1}).
+    """
+    order = table.shape[0]
+    identity = get_identity_index(table)
+    inverse = np.argmax(table == identity, axis=1)  # inverse[h] = h^-1
+
+    hg = table  # hg[h, g] = hg
+    conjugated = table[hg, inverse[:, None]]  # conjugated[h, g] = h g h^-1
+    phases = (
+        factor_system
+        * factor_system[hg, inverse[:, None]]
+        / factor_system[np.arange(order), inverse][:, None]
+        / factor_system[identity, identity]
+    )
+
+    random = rng.random(order) + 1j * rng.random(order)
+    weights = np.zeros(order, dtype=np.complex128)
+    np.add.at(weights, conjugated, phases * random[None, :])
+    return weights
+
+
+def _get_factor_system_from_representation(
+    representation: NDArrayComplex, table: NDArrayInt
+) -> NDArrayComplex:
+    """Read off factor system from largest matrix elements of projective ``representation``."""
+    order = representation.shape[0]
+    dim = representation.shape[1]
+    # Index of largest matrix element for each operation
+    flat = np.argmax(np.abs(representation.reshape(order, -1)), axis=1)
+    rows, cols = np.divmod(flat, dim)
+
+    # product[i, j] = (representation[i] @ representation[j])[rows[k], cols[k]] with k = table[i, j]
+    rows_ij = rows[table]
+    cols_ij = cols[table]
+    product = np.einsum(
+        "ijl,ijl->ij",
+        representation[np.arange(order)[:, None], rows_ij, :],
+        representation[np.arange(order)[None, :], :, cols_ij],
+    )
+    return product / representation[table, rows_ij, cols_ij]
+
+
+def _iterate_invariant_subrepresentations(
+    representation: NDArrayComplex | BlockMonomialRepresentation,
+    exploit_sparsity: bool = True,
+    atol: float = 1e-8,
+):
+    """Yield dense representation matrices restricted to invariant subspaces spanned by subsets of the standard basis."""
+    if isinstance(representation, BlockMonomialRepresentation):
+        if not exploit_sparsity:
+            yield representation.toarray()
+            return
+        for orbit in representation.get_orbits():
+            sub_rep = representation.toarray(orbit)
+            for block in _get_invariant_blocks(sub_rep, atol=atol):
+                yield sub_rep[:, block][:, :, block]
+        return
+
+    if not exploit_sparsity:
+        yield representation
+        return
+    for block in _get_invariant_blocks(representation, atol=atol):
+        yield representation[:, block][:, :, block]
+
+
+def _get_invariant_blocks(representation: NDArrayComplex, atol: float = 1e-8) -> list[NDArrayInt]:
+    """Split basis indices into connected components of nonzero matrix elements of all operations."""
+    dim0 = representation.shape[1]
+    connected = np.any(np.abs(representation) > atol, axis=0)
+    connected |= connected.T
+
+    blocks = []
+    visited = np.zeros(dim0, dtype=np.bool_)
+    for i in range(dim0):
+        if visited[i]:
+            continue
+        block = np.zeros(dim0, dtype=np.bool_)
+        block[i] = True
+        frontier = block.copy()
+        while np.any(frontier):
+            reached = np.any(connected[frontier], axis=0)
+            frontier = reached & ~block
+            block |= reached
+        visited |= block
+        blocks.append(np.nonzero(block)[0])
+
+    return blocks
+
+
+def _cluster_sorted_eigenvalues(
+    eigvals: NDArrayFloat, rtol: float = 1e-5
+) -> tuple[NDArrayInt, NDArrayInt]:
+    """Return start and end indices of groups of almost degenerated eigenvalues.
+
+    Because ``eigvals`` are sorted, each group is a contiguous run of them.
+    A new group starts where a gap is larger than the tolerance of ``np.isclose``.
+    """
+    gaps = np.diff(eigvals)
+    is_new_space = gaps > 1e-8 + rtol * np.abs(eigvals[1:])
+    starts = np.concatenate([[0], np.nonzero(is_new_space)[0] + 1])
+    ends = np.concatenate([starts[1:], [len(eigvals)]])
+    return starts, ends
+
+
 def _get_irreps_from_matrix(
-    reg: NDArrayComplex, matrix: NDArrayComplex, rtol: float = 1e-5
+    reg: NDArrayComplex, matrix: NDArrayComplex, rtol: float = 1e-5, atol: float = 1e-8
 ) -> list[NDArrayComplex]:
     # eigvecs[:, i] is the normalized eigenvector to eigvals[i]
     eigvals, eigvecs = np.linalg.eigh(matrix)
 
-    # Group by eigenvectors by eigenvalues
-    eigenspaces: list[(float, list[NDArrayFloat])] = []  # type: ignore
-    for eigval, eigvec in zip(eigvals, eigvecs.T):
-        is_new_space = True
-        for i, (eigval2, _) in enumerate(eigenspaces):
-            if np.isclose(eigval, eigval2, rtol=rtol):
-                eigenspaces[i][1].append(eigvec)
-                is_new_space = False
-                break
-        if is_new_space:
-            eigenspaces.append((eigval, [eigvec]))
+    # Group eigenvectors by eigenvalues
+    starts, ends = _cluster_sorted_eigenvalues(eigvals, rtol=rtol)
 
+    # Compute characters of all eigenspaces by one contraction before irreps
+    # to avoid calculating duplicated irreps.
+    # diagonal[k, i] = eigvecs[:, i]^dagger @ reg[k] @ eigvecs[:, i]
     order = reg.shape[0]
+    diagonal = np.einsum("li,kli->ki", np.conj(eigvecs), reg @ eigvecs, optimize="greedy")
+    characters = np.add.reduceat(diagonal, starts, axis=1).T  # (num_spaces, order)
+
+    # Check if each eigenspace is really irrep by character
+    norms = np.around(np.real(np.sum(np.conj(characters) * characters, axis=1)))
+    is_irrep = norms == order
+
+    # Multi-dimensional irreps appeared several times in eigenspaces.
+    # Therefore, we pick the first one of them by comparing their characters.
     irreps: list[NDArrayComplex] = []
-    characters: list[NDArrayFloat] = []
-    for eigval, list_eigvecs in eigenspaces:
-        # QR decomposition of column-wise vectors gives Gram-Schmidt orthonormalized vectors in column wise.
-        transformation = np.linalg.qr(np.transpose(list_eigvecs))[0]
-
-        # Compute character before irrep to avoid calculating duplicated irreps
-        character = np.einsum(
-            "li,klm,mi->k", np.conj(transformation), reg, transformation, optimize="greedy"
-        )
-        # Check if this is really irrep by character
-        if not is_equivalent_irrep(character, character):
+    unique_characters: list[NDArrayComplex] = []
+    for start, end, character, irreducible in zip(starts, ends, characters, is_irrep):
+        if not irreducible:
             continue
-
-        # Multi-dimensional irreps appeared several times in `eigenspaces`.
-        # Therefore, we pick one of them by checking character of each irrep.
-        is_unique = True
-        for character2 in characters:
-            product = np.around(np.sum(np.conj(character) * character2))
-            if np.isclose(product, order, rtol=rtol):
-                is_unique = False
-                break
-        if not is_unique:
+        if any(np.allclose(character, other, rtol=rtol, atol=atol) for other in unique_characters):
             continue
 
+        transformation = eigvecs[:, start:end]
         irrep = np.einsum(
             "li,klm,mj->kij", np.conj(transformation), reg, transformation, optimize="greedy"
         )
         irreps.append(irrep)
-        characters.append(character)
+        unique_characters.append(character)
 
     # sort Irreps by (dim, minus of sum of characters)
-    argidx = sorted(range(len(irreps)), key=lambda i: (irreps[i].shape[1], -np.sum(characters[i])))
+    argidx = sorted(
+        range(len(irreps)), key=lambda i: (irreps[i].shape[1], -np.sum(unique_characters[i]))
+    )
     sorted_irreps = [irreps[i] for i in argidx]
     return sorted_irreps
 
@@ -408,7 +670,7 @@ def _get_irreps_from_matrix(
 def enumerate_unitary_irreps_from_solvable_group_chain(
     table: NDArrayInt,
     factor_system: NDArrayComplex,
-    solvable_chain_generators: list[int],
+    solvable_chain_generators: list[int] | None = None,
     atol: float = 1e-8,
     max_num_random_generations: int = 4,
 ):
@@ -419,9 +681,10 @@ def enumerate_unitary_irreps_from_solvable_group_chain(
     table: array, (order, order)
         Cayley table
     factor_system: array, (order, order)
-    solvable_group_chain: list of single generator of coset
+    solvable_group_chain: (Optional) list of single generator of coset
         Let :math:`G_{0} := G` and :math:`G_{i} := G_{i-1} / \langle` ``solvable_chain_generators[i]`` :math:`\rangle` (i = 0, 1, ...).
         Then, :math:`G_{i}` is normal subgroup of :math:`G_{i-1}` and factor group :math:`G_{i-1}/G_{i}` is Abelian.
+        If not specified, computed by :func:`spgrep.group.get_solvable_chain_generators`.
 
     atol: float
         Absolute tolerance to distinguish difference eigenvalues
@@ -432,14 +695,21 @@ def enumerate_unitary_irreps_from_solvable_group_chain(
     -------
     irreps: list of unitary projective irrep with (order, dim, dim)
     """
+    if solvable_chain_generators is None:
+        solvable_chain_generators = get_solvable_chain_generators(table)
+
     identity = get_identity_index(table)
     group = [identity]  # int -> GroupIdx
     irreps = [np.ones((1, 1, 1), dtype=np.complex128)]
 
     # Extend subgroups from identity to whole
     for r in solvable_chain_generators[::-1]:
-        # Should be power of prime number
-        p = get_order(table, r)
+        # Index of subgroup: smallest `p` with r^p in subgroup
+        p = 1
+        s0 = r
+        while s0 not in group:
+            s0 = table[s0, r]
+            p += 1
 
         # Power of `r`, rm[m] = r^m
         # Power of inverse of `coset_generator`, rminv[m] = r^-m
@@ -487,17 +757,17 @@ def enumerate_unitary_irreps_from_solvable_group_chain(
             if is_equivalent_irrep(conj_characters[0], conj_characters[1]):
                 # Self-conjugated case
 
-                # Scale intertwiner s.t. intertwiner^p == identity
+                # Scale intertwiner s.t. intertwiner^p == sub_irrep(r^p)
                 intertwiner = get_intertwiner(
                     conj_sub_irreps[0],
                     conj_sub_irreps[1],
                     atol=atol,
                     max_num_random_generations=max_num_random_generations,
                 )
-                scale = intertwiner.copy()
-                for _ in range(p - 1):
-                    scale = np.dot(intertwiner, scale)
-                intertwiner /= scale[0, 0] ** (1 / p)
+                power = np.linalg.matrix_power(intertwiner, p)
+                delta_s0 = sub_irrep[subgroup_remapping[s0]]
+                scale = np.trace(np.conj(delta_s0.T) @ power) / dim
+                intertwiner /= scale ** (1 / p)
 
                 omega = 1 / nroot(np.prod([factor_system[r, rm[m]] for m in range(1, p)]), p)
                 for q in range(p):
@@ -527,16 +797,17 @@ def enumerate_unitary_irreps_from_solvable_group_chain(
                     for s in subgroup:
                         idx = table[rm[m], s]
                         for j in range(p):
+                            # (r^m s) r^j = r^i t with t in subgroup
                             i = (j + m) % p
-                            sj = table[rinvm[j], table[s, rm[j]]]
+                            t = table[rinvm[i], table[idx, rm[j]]]
                             next_irrep[
                                 group_remapping[idx],
                                 i * dim : (i + 1) * dim,
                                 j * dim : (j + 1) * dim,
                             ] = (
                                 factor_system[idx, rm[j]]
-                                / factor_system[rm[i], sj]
-                                * sub_irrep[subgroup_remapping[sj]]
+                                / factor_system[rm[i], t]
+                                * sub_irrep[subgroup_remapping[t]]
                             )
                 next_sub_irreps.append(next_irrep)
 
@@ -633,36 +904,199 @@ def is_equivalent_irrep(character1: NDArrayComplex, character2: NDArrayComplex)
         return False
 
 
+# Possible values of irreps: 0 or exp(i * pi * q / 6) (q = 0, ..., 11).
+# Quarter turns are written explicitly so that they are exact.
+_PURE_PHASES = np.exp(1j * np.pi * np.arange(12) / 6)
+_PURE_PHASES[[0, 3, 6, 9]] = [1, 1j, -1, -1j]
+
+# Possible values of physically irreducible representations in ascending order
+_PURE_REAL_VALUES = np.array([-1, -np.sqrt(3) / 2, -1 / 2, 0, 1 / 2, np.sqrt(3) / 2, 1])
+_PURE_REAL_MIDPOINTS = (_PURE_REAL_VALUES[1:] + _PURE_REAL_VALUES[:-1]) / 2
+
+
+def subduce_irreps(
+    irreps_G: list[NDArrayComplex],
+    rotations_G: NDArrayInt,
+    rotations_H: NDArrayInt,
+    irreps_H: list[NDArrayComplex] | None = None,
+    method: Literal["Neto", "random"] = "Neto",
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    max_num_random_generations: int = 4,
+    use_cache: bool = True,
+) -> tuple[NDArrayInt, list[NDArrayComplex]]:
+    """Calculate branching rules of irreps of group G subduced to its subgroup H.
+
+    Characters of ``irreps_G`` are restricted to H and decomposed with the character table of H at once.
+    The embedding of H into G is memoized for each pair of ``rotations_G`` and ``rotations_H``.
+    Irreps of H are memoized for ``rotations_H`` together with ``method``, ``rtol``, and ``atol`` only when they are computed here; given ``irreps_H`` are never memoized.
+
+    Parameters
+    ----------
+    irreps_G: list of array, (order_G, dim, dim)
+        Linear irreps of G
+    rotations_G: array[int], (order_G, 3, 3)
+    rotations_H: array[int], (order_H, 3, 3)
+        Subgroup of ``rotations_G``
+    irreps_H: (Optional) list of array, (order_H, dim, dim)
+        All linear irreps of H. If not specified, computed by :func:`enumerate_unitary_irreps`.
+    method: str, 'Neto' or 'random'
+        Method to compute ``irreps_H``
+    rtol: float
+        Relative tolerance
+    atol: float
+        Absolute tolerance
+    max_num_random_generations: int
+        Maximum number of trials to generate random matrix
+    use_cache: bool, default=True
+        If True, reuse memoized results for the same pair of groups.
+        See also :func:`clear_subduction_cache`.
+
+    Returns
+    -------
+    branching: array[int], (num_irreps_G, num_irreps_H)
+        ``branching[alpha, beta]`` is the multiplicity of ``irreps_H[beta]`` in ``irreps_G[alpha]`` restricted to H.
+    irreps_H: list of array, (order_H, dim, dim)
+    """
+    key = (get_rotations_key(rotations_G), get_rotations_key(rotations_H))
+    if use_cache and key in _subduction_cache:
+        _subduction_cache.move_to_end(key)
+        indices = _subduction_cache[key]
+    else:
+        try:
+            indices = get_rotation_indices(rotations_G, rotations_H)
+        except ValueError as err:
+            raise ValueError("Given rotations_H is not a subgroup of rotations_G.") from err
+        if use_cache:
+            _subduction_cache[key] = indices
+            if len(_subduction_cache) > MAX_SUBDUCTION_CACHE_SIZE:
+                _subduction_cache.popitem(last=False)
+
+    if irreps_H is None:
+        irreps_H = _get_subgroup_irreps(
+            rotations_H,
+            method=method,
+            rtol=rtol,
+            atol=atol,
+            max_num_random_generations=max_num_random_generations,
+            use_cache=use_cache,
+        )
+    elif sum(irrep.shape[1] ** 2 for irrep in irreps_H) != len(rotations_H):
+        raise ValueError("Given irreps_H do not exhaust irreps of rotations_H.")
+
+    characters_G = np.array([get_character(irrep) for irrep in irreps_G])
+    characters_H = np.array([get_character(irrep) for irrep in irreps_H])
+    overlap = characters_G[:, indices] @ np.conj(characters_H).T / len(rotations_H)
+    branching = np.rint(np.real(overlap)).astype(int)
+    if not np.allclose(overlap, branching, rtol=rtol, atol=atol):
+        raise ValueError("Failed to decompose restricted characters into irreps of subgroup.")
+
+    return branching, irreps_H
+
+
+def clear_subduction_cache():
+    """Clear memoized results of :func:`subduce_irreps`."""
+    _subduction_cache.clear()
+    _subgroup_irreps_cache.clear()
+
+
+def _get_subgroup_irreps(
+    rotations_H: NDArrayInt,
+    method: Literal["Neto", "random"] = "Neto",
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    max_num_random_generations: int = 4,
+    use_cache: bool = True,
+) -> list[NDArrayComplex]:
+    """Return copies of irreps of H memoized for ``rotations_H``, ``method``, ``rtol``, and ``atol``."""
+    key = (get_rotations_key(rotations_H), method, rtol, atol)
+    if use_cache and key in _subgroup_irreps_cache:
+        _subgroup_irreps_cache.move_to_end(key)
+        return [irrep.copy() for irrep in _subgroup_irreps_cache[key]]
+
+    irreps, _ = enumerate_unitary_irreps(
+        rotations_H,
+        method=method,
+        rtol=rtol,
+        atol=atol,
+        max_num_random_generations=max_num_random_generations,
+    )
+    irreps_H = [irrep.astype(np.complex128) for irrep in irreps]
+    if use_cache:
+        # Keep copies so that later modification of returned irreps does not affect cache
+        _subgroup_irreps_cache[key] = [irrep.copy() for irrep in irreps_H]
+        if len(_subgroup_irreps_cache) > MAX_SUBDUCTION_CACHE_SIZE:
+            _subgroup_irreps_cache.popitem(last=False)
+    return irreps_H
+
+
 def purify_irrep_value(irrep: NDArrayComplex, atol: float = 1e-8) -> NDArrayComplex:
-    """Purify values of irreps."""
-    # Each value should be 0 or exp(2 pi q / p) (p=1,2,3,4,6, q = 0,...,p-1)
-    possible_values = [
-        0,
-        1,  # 0/1
-        np.exp(1j * np.pi / 3),  # 1/3
-        1j,  # 1/4
-        np.exp(1j * np.pi * 2 / 3),  # 2/3
-        -1,  # 1/2
-        np.exp(1j * np.pi * 4 / 3),  # 4/3
-        -1j,  # 3/4
-        np.exp(1j * np.pi * 5 / 3),  # 5/3
-    ]
-    for v in possible_values:
-        irrep[np.abs(irrep - v) < atol] = v
+    r"""Purify values of irreps in place.
+
+    Each value is snapped to 0 or :math:`\exp(i \pi q / 6)` if it is closer than ``atol``.
+    ``irrep`` may have any shape, e.g. a stack of irreps with equal dimension.
+    """
+    # Round modulus to {0, 1} and argument to the nearest multiple of pi/6
+    q = np.rint(np.angle(irrep) * (6 / np.pi)).astype(int) % 12
+    nearest = np.where(np.abs(irrep) < 0.5, 0, _PURE_PHASES[q])
+    mask = np.abs(irrep - nearest) < atol
+    if np.isrealobj(irrep):
+        # Values within atol of nearest are real for real irrep
+        nearest = np.real(nearest)
+    irrep[mask] = nearest[mask]
     return irrep
 
 
 def purify_real_irrep_value(real_irrep: NDArrayFloat, atol: float = 1e-8) -> NDArrayFloat:
-    """Purify values of physically irreducible representations."""
-    values = [
-        0,
-        1,  # 0/1
-        1 / 2,  # 1/3
-        np.sqrt(3) / 2,  # 1/3
-        -1 / 2,  # 2/3
-        -np.sqrt(3) / 2,  # 2/3
-        -1,  # 1/2
-    ]
-    for v in values:
-        real_irrep[np.abs(real_irrep - v) < atol] = v
+    r"""Purify values of physically irreducible representations in place.
+
+    Each value is snapped to 0, :math:`\pm 1/2`, :math:`\pm \sqrt{3}/2`, or :math:`\pm 1` if it is closer than ``atol``.
+    """
+    nearest = _PURE_REAL_VALUES[np.searchsorted(_PURE_REAL_MIDPOINTS, real_irrep)]
+    mask = np.abs(real_irrep - nearest) < atol
+    real_irrep[mask] = nearest[mask]
     return real_irrep
+
+
+@overload
+def purify_irrep_value_batch(
+    irreps: list[NDArrayComplex], real: Literal[False] = ..., atol: float = ...
+) -> list[NDArrayComplex]: ...
+
+
+@overload
+def purify_irrep_value_batch(
+    irreps: list[NDArrayFloat], real: Literal[True], atol: float = ...
+) -> list[NDArrayFloat]: ...
+
+
+def purify_irrep_value_batch(
+    irreps: list[NDArrayComplex] | list[NDArrayFloat],
+    real: bool = False,
+    atol: float = 1e-8,
+) -> list[NDArrayComplex] | list[NDArrayFloat]:
+    """Purify values of irreps by stacking irreps with equal dimension.
+
+    Parameters
+    ----------
+    irreps: list of array with (order, dim, dim)
+    real: bool, default=False
+        If True, purify values as physically irreducible representations.
+    atol: float
+        Absolute tolerance to snap values
+
+    Returns
+    -------
+    purified: list of array with (order, dim, dim)
+        Purified irreps in the same order as ``irreps``
+    """
+    purify = purify_real_irrep_value if real else purify_irrep_value
+    purified: list = list(irreps)
+    groups: dict[tuple[int, ...], list[int]] = {}
+    for i, irrep in enumerate(irreps):
+        groups.setdefault(irrep.shape, []).append(i)
+    for indices in groups.values():
+        stacked = purify(np.stack([irreps[i] for i in indices]), atol=atol)
+        for i, irrep in zip(indices, stacked):
+            purified[i] = irrep
+    return purified
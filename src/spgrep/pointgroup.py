@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from os import PathLike
+
 import numpy as np
 from spglib import get_pointgroup
 
-from spgrep.utils import NDArrayInt, ndarray2d_to_integer_tuple
+from spgrep.utils import NDArrayFloat, NDArrayInt, encode_rotations, get_rotations_key
+
+# Maximum number of memoized results of `get_pointgroup_chain_generators`
+MAX_CHAIN_GENERATORS_CACHE_SIZE = 1024
+# Encoded ordered rotations -> chain generators, in least-recently-used order
+_chain_generators_cache: OrderedDict[str, tuple[int, ...]] = OrderedDict()
 
 # List of point groups after applying transformation matrices given by `spglib.get_pointgroup`
 # See https://github.com/spglib/spglib/issues/164
@@ -575,6 +585,19 @@ pg_dataset = {
 }
 # fmt: on
 
+
+@lru_cache(maxsize=None)
+def _get_pg_arrays() -> dict[str, list[tuple[NDArrayInt, NDArrayInt]]]:
+    """Return precompiled rotations and their encoded keys for all point groups in all settings."""
+    pg_arrays: dict[str, list[tuple[NDArrayInt, NDArrayInt]]] = {}
+    for pg_symbol, groups in pg_dataset.items():
+        pg_arrays[pg_symbol] = []
+        for group in groups:
+            rotations = np.array(group, dtype=int)
+            pg_arrays[pg_symbol].append((rotations, encode_rotations(rotations)))
+    return pg_arrays
+
+
 # Figure 3.2.1.3 of ITA (2016)
 # tuple of (symbol of normal subgroup, coset representative)
 pg_solvable_chain = {
@@ -678,7 +701,9 @@ def _get_generators(pg_symbol, idx, gens):
     return _get_generators(next_pg_symbol, next_idx, gens)
 
 
-def get_pointgroup_chain_generators(prim_rotations: NDArrayInt) -> list[int]:
+def get_pointgroup_chain_generators(
+    prim_rotations: NDArrayInt, use_cache: bool = True
+) -> list[int]:
     r"""Calculate generators of given crystallographic point group in primitive basis.
 
     The returned generators give a normal series whose factor groups are all Abelian.
@@ -686,6 +711,9 @@ def get_pointgroup_chain_generators(prim_rotations: NDArrayInt) -> list[int]:
     Parameters
     ----------
     prim_rotations: (order, 3, 3)
+    use_cache: bool, default=True
+        If true, look up results memoized by ordered ``prim_rotations`` before calling ``spglib.get_pointgroup``.
+        See also :func:`clear_pointgroup_chain_generators_cache`.
 
     Returns
     -------
@@ -693,26 +721,81 @@ def get_pointgroup_chain_generators(prim_rotations: NDArrayInt) -> list[int]:
         Let :math:`G_{0} := G` and :math:`G_{i} := G_{i-1} / \langle` ``solvable_chain_generators[i]`` :math:`\rangle` (i = 0, 1, ...).
         Then, :math:`G_{i}` is normal subgroup of :math:`G_{i-1}` and factor group :math:`G_{i-1}/G_{i}` is Abelian.
     """
-    pg_symbol, _, P = get_pointgroup(prim_rotations)
+    if not use_cache:
+        return _get_pointgroup_chain_generators(prim_rotations)
+
+    key = get_rotations_key(prim_rotations)
+    if key in _chain_generators_cache:
+        _chain_generators_cache.move_to_end(key)
+        return list(_chain_generators_cache[key])
+
+    generators = _get_pointgroup_chain_generators(prim_rotations)
+    _chain_generators_cache[key] = tuple(generators)
+    if len(_chain_generators_cache) > MAX_CHAIN_GENERATORS_CACHE_SIZE:
+        _chain_generators_cache.popitem(last=False)
+    return generators
+
+
+def clear_pointgroup_chain_generators_cache():
+    """Clear memoized results of :func:`get_pointgroup_chain_generators`."""
+    _chain_generators_cache.clear()
+
+
+def save_pointgroup_chain_generators_cache(filename: str | PathLike):
+    """Save memoized results of :func:`get_pointgroup_chain_generators` to JSON file."""
+    data = {key: list(generators) for key, generators in _chain_generators_cache.items()}
+    with open(filename, "w") as f:
+        json.dump(data, f)
+
+
+def load_pointgroup_chain_generators_cache(filename: str | PathLike):
+    """Load memoized results of :func:`get_pointgroup_chain_generators` saved by :func:`save_pointgroup_chain_generators_cache`."""
+    with open(filename) as f:
+        data = json.load(f)
+    for key, generators in data.items():
+        _chain_generators_cache[key] = tuple(generators)
+        _chain_generators_cache.move_to_end(key)
+    while len(_chain_generators_cache) > MAX_CHAIN_GENERATORS_CACHE_SIZE:
+        _chain_generators_cache.popitem(last=False)
+
+
+def _get_pointgroup_chain_generators(prim_rotations: NDArrayInt) -> list[int]:
+    pg_symbol, idx, _, mapping = _match_standard_pointgroup(prim_rotations)
+    generators = get_generators(pg_symbol, idx)
+    return [int(mapping[g]) for g in generators]
+
+
+def _match_standard_pointgroup(
+    prim_rotations: NDArrayInt,
+) -> tuple[str, int, NDArrayFloat, NDArrayInt]:
+    """Match given crystallographic point group with standardized ones in primitive basis.
+
+    Returns
+    -------
+    pg_symbol: str
+    idx: int
+        Index of setting in ``pg_dataset[pg_symbol]``
+    P: array, (3, 3)
+        Transformation matrix s.t. ``std_rotations[i] == P^-1 @ prim_rotations[mapping[i]] @ P``
+    mapping: array[int], (order, )
+    """
+    pointgroup = get_pointgroup(prim_rotations)
+    if pointgroup is None or pointgroup[0] not in pg_dataset:
+        raise ValueError("Given rotations are not a tabulated crystallographic point group.")
+    pg_symbol, _, P = pointgroup
     Pinv = np.linalg.inv(P)
 
-    # Match given crystallographic point group with standardized ones in primitive basis.
-    order = len(prim_rotations)
-    for idx, std_rotations in enumerate(pg_dataset[pg_symbol]):
-        matched = [ndarray2d_to_integer_tuple(Pinv @ r @ P) for r in prim_rotations]
-
-        success = True
-        mapping = [-1 for _ in range(order)]  # s.t. prim_rotations[mapping[i]] == std_rotations[i]
-        for i, ri in enumerate(std_rotations):
-            try:
-                j = matched.index(ri)  # type: ignore
-            except ValueError:
-                success = False
-                break
-            mapping[i] = j
-        if success:
-            generators = get_generators(pg_symbol, idx)
-            return [mapping[g] for g in generators]
-
-    ValueError("Failed to match with tabulated point groups.")
-    return []  # This line is unreachable, just for persuading mypy!
+    matched_keys = encode_rotations(np.einsum("ij,kjl,lm->kim", Pinv, prim_rotations, P))
+    argsort = np.argsort(matched_keys)
+    sorted_keys = matched_keys[argsort]
+    for idx, (_, std_keys) in enumerate(_get_pg_arrays()[pg_symbol]):
+        if len(std_keys) != len(sorted_keys):
+            continue
+        positions = np.searchsorted(sorted_keys, std_keys)
+        positions = np.minimum(positions, len(sorted_keys) - 1)
+        if np.all(sorted_keys[positions] == std_keys):
+            # s.t. prim_rotations[mapping[i]] == std_rotations[i]
+            mapping = argsort[positions]
+            return pg_symbol, idx, np.array(P), mapping
+
+    raise ValueError("Failed to match with tabulated point groups.")
@@ -9,13 +9,17 @@ import numpy as np
 
 from spgrep.group import get_cayley_table
 from spgrep.utils import (
+    NDArrayBool,
     NDArrayComplex,
     NDArrayFloat,
     NDArrayInt,
+    get_rotation_indices,
     grassmann_distance,
-    ndarray2d_to_integer_tuple,
 )
 
+# Number of full-size temporary arrays alive at once when comparing products of representation matrices
+_NUM_LIVE_TEMPORARIES = 3
+
 
 def get_regular_representation(rotations: NDArrayInt) -> NDArrayInt:
     """Calculate regular representation of point group.
@@ -109,23 +113,28 @@ def get_intertwiner(
     return np.zeros((dim, dim))
 
 
-def get_character(representation: NDArrayComplex) -> NDArrayComplex:
+def get_character(
+    representation: NDArrayComplex | BlockMonomialRepresentation | DirectProductRepresentation,
+) -> NDArrayComplex:
     """Calculate character of representation.
 
     Parameters
     ----------
-    representation: array, (order, dim, dim)
+    representation: array, (order, dim, dim), BlockMonomialRepresentation, or DirectProductRepresentation
 
     Returns
     -------
     character: array, (order, )
     """
+    if isinstance(representation, (BlockMonomialRepresentation, DirectProductRepresentation)):
+        return representation.get_character()
+
     character = np.einsum("ijj->i", representation, optimize="greedy").astype(np.complex128)
     return character
 
 
 def project_to_irrep(
-    representation: NDArrayComplex,
+    representation: NDArrayComplex | BlockMonomialRepresentation | DirectProductRepresentation,
     irrep: NDArrayComplex,
     atol: float = 1e-6,  # A bit large tolerance setting to handle numerical noise in `representation`
     max_num_trials: int = 10,
@@ -134,7 +143,8 @@ def project_to_irrep(
 
     Parameters
     ----------
-    representation: array, (order, dim, dim)
+    representation: array, (order, dim, dim), BlockMonomialRepresentation, or DirectProductRepresentation
+        Matrices of lazy representations are not materialized.
     irrep: array, (order, dim_irrep, dim_irrep)
         Unitary (projective) irrep with factor system s.t. :math:`\mu(E, E) = 1`.
     atol: float, default=1e-5
@@ -174,12 +184,7 @@ def project_to_irrep(
                 basis_nj = (
                     dim_irrep
                     / order
-                    * np.einsum(
-                        "ki,km->im",
-                        np.conj(irrep[:, :, j]),
-                        representation[:, :, n],
-                        optimize="greedy",
-                    )
+                    * _contract_representation_column(representation, np.conj(irrep[:, :, j]), n)
                 )
 
                 if np.allclose(basis_nj, 0, atol=adjusted_atol):
@@ -232,6 +237,17 @@ def project_to_irrep(
     return basis
 
 
+def _contract_representation_column(
+    representation: NDArrayComplex | BlockMonomialRepresentation | DirectProductRepresentation,
+    coeffs: NDArrayComplex,
+    n: int,
+) -> NDArrayComplex:
+    """Return ``np.einsum("ki,km->im", coeffs, representation[:, :, n])``."""
+    if isinstance(representation, (BlockMonomialRepresentation, DirectProductRepresentation)):
+        return representation.contract_column(coeffs, n)
+    return np.einsum("ki,km->im", coeffs, representation[:, :, n], optimize="greedy")
+
+
 def is_unitary(representation: NDArrayComplex) -> bool:
     """Return true if given representation is unitary."""
     dim = representation.shape[1]
@@ -242,25 +258,82 @@ def is_unitary(representation: NDArrayComplex) -> bool:
 
 
 def is_representation(
-    rep: NDArrayComplex,
+    rep: NDArrayComplex | BlockMonomialRepresentation,
     table: NDArrayInt,
     factor_system: NDArrayComplex | None = None,
     rtol: float = 1e-5,
     atol: float = 1e-8,
+    chunk_size: int | None = None,
 ) -> bool:
-    """Return true if given matrix function is a (projective) representation with given factor system."""
+    """Return true if given matrix function is a (projective) representation with given factor system.
+
+    See :func:`find_representation_violation` for parameters.
+    """
+    violation = find_representation_violation(
+        rep, table, factor_system, rtol=rtol, atol=atol, chunk_size=chunk_size
+    )
+    return violation is None
+
+
+def find_representation_violation(
+    rep: NDArrayComplex | BlockMonomialRepresentation,
+    table: NDArrayInt,
+    factor_system: NDArrayComplex | None = None,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    chunk_size: int | None = None,
+) -> tuple[int, int] | None:
+    """Return the first pair of operations violating multiplication of (projective) representation.
+
+    Products of all pairs are compared at once by batched matrix multiplications.
+
+    Parameters
+    ----------
+    rep: array, (order, dim, dim) or BlockMonomialRepresentation
+    table: array[int], (order, order)
+        Cayley table of the group
+    factor_system: (Optional) array, (order, order)
+        Factor system of ``rep``. If not specified, ``rep`` is checked as a linear representation.
+    rtol: float
+        Relative tolerance to compare matrices
+    atol: float
+        Absolute tolerance to compare matrices
+    chunk_size: (Optional) int
+        Number of left operations compared at once. Temporary arrays take O(chunk_size * order * dim^2).
+        If not specified, chosen to keep all temporary arrays alive at once about 2^24 elements in total.
+
+    Returns
+    -------
+    violation: tuple (i, j) or None
+        ``rep[i] @ rep[j] != factor_system[i, j] * rep[table[i, j]]`` for returned ``(i, j)`` in lexicographic order.
+        None if ``rep`` is a (projective) representation.
+    """
     order = rep.shape[0]
     if factor_system is None:
         factor_system = np.ones((order, order), dtype=np.complex128)
 
-    for i, ri in enumerate(rep):
-        for j, rj in enumerate(rep):
-            actual = ri @ rj
-            expect = rep[table[i, j]] * factor_system[i, j]
-            if not np.allclose(actual, expect, rtol=rtol, atol=atol):
-                return False
+    if isinstance(rep, BlockMonomialRepresentation):
+        return rep.find_representation_violation(
+            table, factor_system, rtol=rtol, atol=atol, chunk_size=chunk_size
+        )
+    if isinstance(rep, DirectProductRepresentation):
+        rep = rep.toarray()
 
-    return True
+    dim = rep.shape[1]
+    if chunk_size is None:
+        chunk_size = max(1, 2**24 // (_NUM_LIVE_TEMPORARIES * order * dim * dim))
+
+    for start in range(0, order, chunk_size):
+        end = min(start + chunk_size, order)
+        # actual[i, j] = rep[start + i] @ rep[j]
+        actual = np.matmul(rep[start:end, None], rep[None, :])
+        expect = rep[table[start:end]] * factor_system[start:end, :, None, None]
+        is_close = _is_close_inplace(actual, expect, rtol=rtol, atol=atol, axis=(2, 3))
+        if not np.all(is_close):
+            i, j = np.argwhere(~is_close)[0]
+            return (start + int(i), int(j))
+
+    return None
 
 
 def frobenius_schur_indicator(irrep: NDArrayComplex) -> int:
@@ -295,45 +368,78 @@ def check_spacegroup_representation(
     little_rotations: NDArrayInt,
     little_translations: NDArrayFloat,
     kpoint: NDArrayFloat,
-    rep: NDArrayComplex,
+    rep: NDArrayComplex | BlockMonomialRepresentation,
     spinor_factor_system: NDArrayComplex | None = None,
     rtol: float = 1e-5,
+    chunk_size: int | None = None,
 ) -> bool:
     """Check definition of representation. This function works for primitive and conventional cell."""
+    violation = find_spacegroup_representation_violation(
+        little_rotations,
+        little_translations,
+        kpoint,
+        rep,
+        spinor_factor_system=spinor_factor_system,
+        rtol=rtol,
+        chunk_size=chunk_size,
+    )
+    return violation is None
+
+
+def find_spacegroup_representation_violation(
+    little_rotations: NDArrayInt,
+    little_translations: NDArrayFloat,
+    kpoint: NDArrayFloat,
+    rep: NDArrayComplex | BlockMonomialRepresentation,
+    spinor_factor_system: NDArrayComplex | None = None,
+    rtol: float = 1e-5,
+    chunk_size: int | None = None,
+) -> tuple[int, int] | None:
+    """Return the first pair of operations violating multiplication of representation of space group.
+
+    Differences of translations by lattice vectors are absorbed into phases, and then checked by :func:`find_representation_violation`.
+    This function works for primitive and conventional cell.
+
+    Returns
+    -------
+    violation: tuple (i, j) or None
+        None if ``rep`` is a representation of little group at ``kpoint``.
+    """
     order = len(little_rotations)
     if spinor_factor_system is None:
         spinor_factor_system = np.ones((order, order), dtype=np.complex128)
 
-    little_rotations_int = [ndarray2d_to_integer_tuple(rotation) for rotation in little_rotations]
-
-    # Check if ``rep`` preserves multiplication
-    for idx1, (r1, t1, m1) in enumerate(zip(little_rotations, little_translations, rep)):
-        for idx2, (r2, t2, m2) in enumerate(zip(little_rotations, little_translations, rep)):
-            r12 = r1 @ r2
-            t12 = r1 @ t2 + t1
-            idx = little_rotations_int.index(ndarray2d_to_integer_tuple(r12))
-            # little_translations[idx] may differ from t12 by lattice translation.
-            m12 = (
-                spinor_factor_system[idx1, idx2]
-                * np.exp(-2j * np.pi * np.dot(kpoint, t12 - little_translations[idx]))
-                * rep[idx]
-            )
-
-            if not np.allclose(m12, m1 @ m2, rtol=rtol):
-                return False
-
-    return True
+    # table[i, j] is the first operation with rotation part of little_rotations[i] @ little_rotations[j]
+    table = get_rotation_indices(
+        little_rotations, np.einsum("iab,jbc->ijac", little_rotations, little_rotations)
+    )
+    # little_translations[table[i, j]] may differ from translation part of product by lattice translation.
+    residuals = (
+        np.einsum("iab,jb->ija", little_rotations, little_translations)
+        + little_translations[:, None, :]
+        - little_translations[table]
+    )
+    factor_system = spinor_factor_system * np.exp(
+        -2j * np.pi * np.einsum("a,ija->ij", kpoint, residuals)
+    )
+    return find_representation_violation(
+        rep, table, factor_system, rtol=rtol, chunk_size=chunk_size
+    )
 
 
 def get_direct_product(
-    rep1: NDArrayComplex | NDArrayFloat, rep2: NDArrayComplex | NDArrayFloat
-) -> NDArrayComplex | NDArrayFloat:
+    rep1: NDArrayComplex | NDArrayFloat,
+    rep2: NDArrayComplex | NDArrayFloat,
+    lazy: bool = False,
+) -> NDArrayComplex | NDArrayFloat | DirectProductRepresentation:
     """Return Knocker product of two representations.
 
     Parameters
     ----------
     rep1: array, (order, dim1, dim1)
     rep2: array, (order, dim2, dim2)
+    lazy: bool, default=False
+        If True, return :class:`DirectProductRepresentation` which keeps ``rep1`` and ``rep2`` as factors.
 
     Returns
     -------
@@ -346,7 +452,488 @@ def get_direct_product(
     if rep1.shape != (order, dim1, dim1) or rep2.shape != (order, dim2, dim2):
         raise ValueError("Inconsistent shapes.")
 
+    if lazy:
+        return DirectProductRepresentation([rep1, rep2])
+
     direct = (rep1[:, :, None, :, None] * rep2[:, None, :, None, :]).reshape(
         order, dim1 * dim2, dim1 * dim2
     )
     return direct
+
+
+def get_site_permutations(
+    rotations: NDArrayInt,
+    translations: NDArrayFloat,
+    positions: NDArrayFloat,
+    symprec: float = 1e-5,
+) -> tuple[NDArrayInt, NDArrayFloat]:
+    """Find permutations of sites by space-group operations.
+
+    Sites are hashed by their quantized fractional coordinates, and image of each site is searched only in neighboring cells of the hash grid.
+    This takes O(order * num_sites * log(num_sites)).
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+    translations: array, (order, 3)
+    positions: array, (num_sites, 3)
+        Fractional coordinates of sites
+    symprec: float, default=1e-5
+        Tolerance for each fractional coordinate to compare sites
+
+    Returns
+    -------
+    permutations: array[int], (order, num_sites)
+        The ``i``-th operation moves ``kappa``-th site to ``permutations[i, kappa]``-th site.
+        This can be directly fed into :class:`InducedSiteRepresentation`.
+    shifts: array, (order, num_sites, 3)
+        Lattice translations ``rotations[i] @ positions[kappa] + translations[i] - positions[permutations[i, kappa]]``
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    num_sites = len(positions)
+
+    # Hash grid with cell size larger than `symprec`. Keep keys within int64.
+    num_cells = int(np.clip(np.floor(1 / symprec), 1, 2**20))
+
+    def _get_cells(frac):
+        return np.floor(np.remainder(frac, 1) * num_cells).astype(np.int64) % num_cells
+
+    def _encode(cells):
+        return (cells[..., 0] * num_cells + cells[..., 1]) * num_cells + cells[..., 2]
+
+    keys = _encode(_get_cells(positions))
+    argsort = np.argsort(keys, kind="stable")
+    sorted_keys = keys[argsort]
+    max_occupancy = np.max(np.unique(sorted_keys, return_counts=True)[1])
+
+    # images[i, kappa] = rotations[i] @ positions[kappa] + translations[i]
+    images = np.einsum("iab,kb->ika", rotations, positions) + translations[:, None, :]
+    image_cells = _get_cells(images)
+
+    permutations = np.full(images.shape[:2], -1, dtype=int)
+    for offset in product([-1, 0, 1], repeat=3):
+        neighbor_keys = _encode((image_cells + np.array(offset)) % num_cells)
+        lower = np.searchsorted(sorted_keys, neighbor_keys, side="left")
+        upper = np.searchsorted(sorted_keys, neighbor_keys, side="right")
+        for occupancy in range(max_occupancy):
+            candidates = lower + occupancy
+            valid = (candidates < upper) & (permutations == -1)
+            if not np.any(valid):
+                continue
+            sites = argsort[candidates[valid]]
+            diff = images[valid] - positions[sites]
+            matched = np.all(np.abs(diff - np.around(diff)) < symprec, axis=1)
+            found = permutations[valid]
+            found[matched] = sites[matched]
+            permutations[valid] = found
+
+    if np.any(permutations == -1):
+        raise ValueError("Failed to find images of sites. Try increasing symprec.")
+    if np.any(np.sort(permutations, axis=1) != np.arange(num_sites)[None, :]):
+        raise ValueError("Given operations do not permute sites. Try decreasing symprec.")
+
+    shifts = images - positions[permutations]
+    return permutations, shifts
+
+
+class BlockMonomialRepresentation:
+    r"""Representation whose matrices are permutations of blocks.
+
+    The representation matrix of the ``k``-th operation maps the ``kappa``-th block of basis vectors to the ``permutations[k, kappa]``-th block,
+
+    .. math::
+       D(g_{k})_{ (\pi_{k}(\kappa), a), (\kappa, b) } = [B_{k\kappa}]_{ab},
+
+    where :math:`\pi_{k}` = ``permutations[k]`` and :math:`B_{k\kappa}` = ``blocks[k, kappa]``.
+    Basis vectors are ordered as ``kappa * block_dim + a``.
+    Only permutations and blocks are stored, which takes O(order * num_blocks * block_dim^2) instead of O(order * (num_blocks * block_dim)^2).
+
+    Parameters
+    ----------
+    permutations: array[int], (order, num_blocks)
+    blocks: array, (order, num_blocks, block_dim, block_dim)
+    """
+
+    def __init__(self, permutations: NDArrayInt, blocks: NDArrayComplex):
+        """Store permutations and blocks without materializing representation matrices."""
+        self._permutations = np.asarray(permutations, dtype=int)
+        self._blocks = np.asarray(blocks)
+        order, num_blocks = self._permutations.shape
+        block_dim = self._blocks.shape[2]
+        if self._blocks.shape != (order, num_blocks, block_dim, block_dim):
+            raise ValueError("Given permutations and blocks do not have consistent dimensions.")
+
+    @property
+    def permutations(self) -> NDArrayInt:
+        """Return ``permutations[k, kappa]``, image of the ``kappa``-th block by the ``k``-th operation."""
+        return self._permutations
+
+    @property
+    def blocks(self) -> NDArrayComplex:
+        """Return ``blocks[k, kappa]``, nonzero block in the ``kappa``-th block column of ``k``-th matrix."""
+        return self._blocks
+
+    @property
+    def order(self) -> int:
+        """Return order of group."""
+        return self._permutations.shape[0]
+
+    @property
+    def num_blocks(self) -> int:
+        """Return number of blocks."""
+        return self._permutations.shape[1]
+
+    @property
+    def block_dim(self) -> int:
+        """Return dimension of each block."""
+        return self._blocks.shape[2]
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Return shape of corresponding dense array, (order, dim, dim)."""
+        dim = self.num_blocks * self.block_dim
+        return (self.order, dim, dim)
+
+    @property
+    def dtype(self):
+        """Return dtype of representation matrices."""
+        return self._blocks.dtype
+
+    def __len__(self) -> int:
+        """Return order of group."""
+        return self.order
+
+    def __array__(self, dtype=None, copy=None):
+        """Return dense representation matrices."""
+        array = self.toarray()
+        if dtype is not None:
+            array = array.astype(dtype)
+        return array
+
+    def toarray(self, block_indices: NDArrayInt | None = None) -> NDArrayComplex:
+        """Return dense representation matrices.
+
+        Parameters
+        ----------
+        block_indices: (Optional) array[int]
+            If specified, return representation matrices restricted to basis vectors of these blocks.
+            The blocks should be closed under ``permutations``.
+
+        Returns
+        -------
+        rep: array, (order, dim, dim)
+        """
+        if block_indices is None:
+            block_indices = np.arange(self.num_blocks)
+        block_indices = np.asarray(block_indices, dtype=int)
+        num_blocks = len(block_indices)
+
+        # Position of each block in restricted basis
+        position = np.full(self.num_blocks, -1, dtype=int)
+        position[block_indices] = np.arange(num_blocks)
+        rows = position[self._permutations[:, block_indices]]
+        if np.any(rows == -1):
+            raise ValueError("Given blocks are not closed under permutations.")
+
+        rep = np.zeros(
+            (self.order, num_blocks, self.block_dim, num_blocks, self.block_dim),
+            dtype=self.dtype,
+        )
+        ks = np.arange(self.order)[:, None]
+        cols = np.arange(num_blocks)[None, :]
+        rep[ks, rows, :, cols, :] = self._blocks[:, block_indices]
+        return rep.reshape(self.order, num_blocks * self.block_dim, num_blocks * self.block_dim)
+
+    def get_character(self) -> NDArrayComplex:
+        """Calculate character of representation.
+
+        Only blocks fixed by permutations contribute to traces.
+
+        Returns
+        -------
+        character: array, (order, )
+        """
+        fixed = self._permutations == np.arange(self.num_blocks)[None, :]
+        traces = np.einsum("kmaa->km", self._blocks, optimize="greedy")
+        character = np.sum(np.where(fixed, traces, 0), axis=1).astype(np.complex128)
+        return character
+
+    def get_orbits(self) -> list[NDArrayInt]:
+        """Return orbits of blocks under permutations.
+
+        Basis vectors of blocks in each orbit span an invariant subspace.
+
+        Returns
+        -------
+        orbits: list of array[int]
+        """
+        orbits = []
+        visited = np.zeros(self.num_blocks, dtype=np.bool_)
+        for kappa in range(self.num_blocks):
+            if visited[kappa]:
+                continue
+            orbit = np.unique(self._permutations[:, kappa])
+            visited[orbit] = True
+            orbits.append(orbit)
+        return orbits
+
+    def contract_column(self, coeffs: NDArrayComplex, n: int) -> NDArrayComplex:
+        """Return ``np.einsum("ki,km->im", coeffs, rep[:, :, n])`` for dense ``rep`` without densifying it.
+
+        Parameters
+        ----------
+        coeffs: array, (order, num_coeffs)
+        n: int
+            Index of column
+
+        Returns
+        -------
+        contracted: array, (num_coeffs, dim)
+        """
+        kappa, b = divmod(n, self.block_dim)
+        num_coeffs = coeffs.shape[1]
+        # column[k, a] = rep[k, permutations[k, kappa] * block_dim + a, n]
+        column = self._blocks[:, kappa, :, b]
+        contracted = np.zeros(
+            (num_coeffs, self.num_blocks, self.block_dim),
+            dtype=np.result_type(coeffs, column),
+        )
+        np.add.at(
+            contracted,
+            (slice(None), self._permutations[:, kappa]),
+            np.einsum("ki,ka->kia", coeffs, column).transpose(1, 0, 2),
+        )
+        return contracted.reshape(num_coeffs, -1)
+
+    def find_representation_violation(
+        self,
+        table: NDArrayInt,
+        factor_system: NDArrayComplex | None = None,
+        rtol: float = 1e-5,
+        atol: float = 1e-8,
+        chunk_size: int | None = None,
+    ) -> tuple[int, int] | None:
+        """Return the first pair of operations violating multiplication of (projective) representation.
+
+        See :func:`find_representation_violation` for parameters.
+        """
+        order = self.order
+        if factor_system is None:
+            factor_system = np.ones((order, order), dtype=np.complex128)
+        if chunk_size is None:
+            chunk_size = max(
+                1,
+                2**24 // (_NUM_LIVE_TEMPORARIES * order * self.num_blocks * self.block_dim**2),
+            )
+
+        for start in range(0, order, chunk_size):
+            end = min(start + chunk_size, order)
+            # Product D(i) D(j) maps the kappa-th block to permutations[i, permutations[j, kappa]]
+            # permutations_ij[i, j, kappa] = permutations[start + i, permutations[j, kappa]]
+            permutations_ij = self._permutations[start:end, self._permutations]
+            is_close = np.all(permutations_ij == self._permutations[table[start:end]], axis=2)
+            actual = np.matmul(
+                self._blocks[np.arange(start, end)[:, None, None], self._permutations[None]],
+                self._blocks[None],
+            )
+            expect = self._blocks[table[start:end]] * factor_system[start:end, :, None, None, None]
+            is_close &= _is_close_inplace(actual, expect, rtol=rtol, atol=atol, axis=(2, 3, 4))
+            if not np.all(is_close):
+                i, j = np.argwhere(~is_close)[0]
+                return (start + int(i), int(j))
+
+        return None
+
+
+class InducedSiteRepresentation(BlockMonomialRepresentation):
+    r"""Representation on sites induced from local representations.
+
+    The ``k``-th operation moves site ``kappa`` to site ``permutations[k, kappa]`` with phase ``phases[k, kappa]`` and local matrix ``local[k]``,
+
+    .. math::
+       D(g_{k})_{ (\pi_{k}(\kappa), a), (\kappa, b) } = \phi_{k\kappa} [L_{k}]_{ab}.
+
+    For example, the representation for atomic displacements at wave vector :math:`\mathbf{q}` is obtained with the Cartesian rotation matrices as local matrices and :math:`\phi_{k\kappa} = \exp(-2 \pi i \mathbf{R}_{k}^{\top} \mathbf{q} \cdot \mathbf{h}_{k}(\kappa))`.
+
+    Parameters
+    ----------
+    permutations: array[int], (order, num_sites)
+    phases: array, (order, num_sites)
+    local: array, (order, local_dim, local_dim) or (order, num_sites, local_dim, local_dim)
+        Local matrices common to all sites or for each site
+    """
+
+    def __init__(self, permutations: NDArrayInt, phases: NDArrayComplex, local: NDArrayComplex):
+        """Store site permutations, phases and local matrices as blocks of monomial representation."""
+        permutations = np.asarray(permutations, dtype=int)
+        self._phases = np.asarray(phases)
+        self._local = np.asarray(local)
+        order, num_sites = permutations.shape
+        if self._phases.shape != (order, num_sites):
+            raise ValueError("Given permutations and phases do not have consistent dimensions.")
+
+        if self._local.ndim == 3:
+            local_sites = self._local[:, None, :, :]
+        else:
+            local_sites = self._local
+        blocks = self._phases[:, :, None, None] * local_sites
+        blocks = np.broadcast_to(blocks, (order, num_sites) + self._local.shape[-2:])
+        super().__init__(permutations, blocks)
+
+    @property
+    def phases(self) -> NDArrayComplex:
+        """Return ``phases[k, kappa]``."""
+        return self._phases
+
+    @property
+    def local(self) -> NDArrayComplex:
+        """Return local matrices."""
+        return self._local
+
+
+class DirectProductRepresentation:
+    r"""Tensor product of representations without materializing Kronecker products.
+
+    .. math::
+       D(g_{k}) = D_{1}(g_{k}) \otimes \cdots \otimes D_{n}(g_{k})
+
+    Basis vectors are ordered as in :func:`get_direct_product`, i.e. ``np.ravel_multi_index((a_1, ..., a_n), dims)``.
+    Only factors are stored, which takes O(order * sum_i dim_i^2) instead of O(order * prod_i dim_i^2).
+
+    Parameters
+    ----------
+    factors: list of array, (order, dim_i, dim_i)
+    """
+
+    def __init__(self, factors: list[NDArrayComplex]):
+        """Store factors of tensor product after checking their shapes."""
+        self._factors = [np.asarray(factor) for factor in factors]
+        if len(self._factors) == 0:
+            raise ValueError("Specify at least one factor.")
+        order = self._factors[0].shape[0]
+        for factor in self._factors:
+            if factor.ndim != 3 or factor.shape[0] != order or factor.shape[1] != factor.shape[2]:
+                raise ValueError("Inconsistent shapes.")
+
+    @property
+    def factors(self) -> list[NDArrayComplex]:
+        """Return factors of tensor product."""
+        return self._factors
+
+    @property
+    def order(self) -> int:
+        """Return order of group."""
+        return self._factors[0].shape[0]
+
+    @property
+    def dims(self) -> tuple[int, ...]:
+        """Return dimensions of factors."""
+        return tuple(factor.shape[1] for factor in self._factors)
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Return shape of corresponding dense array, (order, dim, dim)."""
+        dim = int(np.prod(self.dims))
+        return (self.order, dim, dim)
+
+    @property
+    def dtype(self):
+        """Return dtype of representation matrices."""
+        return np.result_type(*self._factors)
+
+    def __len__(self) -> int:
+        """Return order of group."""
+        return self.order
+
+    def __array__(self, dtype=None, copy=None):
+        """Return dense representation matrices."""
+        array = self.toarray()
+        if dtype is not None:
+            array = array.astype(dtype)
+        return array
+
+    def toarray(self) -> NDArrayComplex:
+        """Return dense representation matrices with (order, dim, dim)."""
+        direct = self._factors[0]
+        for factor in self._factors[1:]:
+            direct = get_direct_product(direct, factor)
+        return direct
+
+    def get_character(self) -> NDArrayComplex:
+        """Calculate character of representation as products of characters of factors.
+
+        Returns
+        -------
+        character: array, (order, )
+        """
+        character = np.ones(self.order, dtype=np.complex128)
+        for factor in self._factors:
+            character *= np.einsum("kii->k", factor)
+        return character
+
+    def apply(
+        self, vectors: NDArrayComplex, weights: NDArrayComplex | None = None
+    ) -> NDArrayComplex:
+        """Apply representation matrices to vectors by contracting each factor with the corresponding mode.
+
+        Parameters
+        ----------
+        vectors: array, (num_vectors, dim_1, ..., dim_n)
+        weights: (Optional) array, (order, )
+            If specified, return weighted sum over operations, ``sum_k weights[k] * D(g_k) @ v``.
+            For example, ``weights = dim_irrep / order * np.conj(irrep[:, i, j])`` gives a projection operator for ``irrep``.
+
+        Returns
+        -------
+        applied: array, (order, num_vectors, dim_1, ..., dim_n) or (num_vectors, dim_1, ..., dim_n) if ``weights`` is specified
+        """
+        vectors = np.asarray(vectors)
+        num_factors = len(self._factors)
+        if vectors.shape[1:] != self.dims:
+            raise ValueError("Given vectors do not have consistent dimensions.")
+
+        applied = np.broadcast_to(vectors, (self.order,) + vectors.shape)
+        if weights is not None:
+            applied = np.asarray(weights)[(slice(None),) + (None,) * vectors.ndim] * applied
+        for axis, factor in enumerate(self._factors):
+            # Contract the `axis`-th mode: (order, num_vectors, ..., dim_axis) @ (order, ..., dim_axis, dim_axis)
+            applied = np.moveaxis(applied, 2 + axis, -1)
+            transposed = np.swapaxes(factor, 1, 2).reshape(
+                (self.order,) + (1,) * (num_factors - 1) + factor.shape[1:]
+            )
+            applied = np.moveaxis(np.matmul(applied, transposed), -1, 2 + axis)
+
+        if weights is not None:
+            applied = np.sum(applied, axis=0)
+        return applied
+
+    def contract_column(self, coeffs: NDArrayComplex, n: int) -> NDArrayComplex:
+        """Return ``np.einsum("ki,km->im", coeffs, rep[:, :, n])`` for dense ``rep`` without densifying it."""
+        indices = np.unravel_index(n, self.dims)
+        column = np.ones((self.order, 1), dtype=self.dtype)
+        for factor, idx in zip(self._factors, indices):
+            column = (column[:, :, None] * factor[:, None, :, idx]).reshape(self.order, -1)
+        return np.einsum("ki,km->im", coeffs, column, optimize="greedy")
+
+
+def _is_close_inplace(
+    actual: NDArrayComplex,
+    expect: NDArrayComplex,
+    rtol: float,
+    atol: float,
+    axis: tuple[int, ...],
+) -> NDArrayBool:
+    """Return ``np.all(np.isclose(actual, expect), axis=axis)`` with overwriting ``actual`` by residuals.
+
+    Only residuals and tolerances are allocated, instead of the several full-size temporaries of ``np.isclose``.
+    """
+    if np.can_cast(expect.dtype, actual.dtype, casting="same_kind"):
+        actual -= expect
+    else:
+        # e.g. real representation with complex factor system
+        actual = actual - expect
+    residual = np.abs(actual)
+    tolerance = np.abs(expect)
+    tolerance *= rtol
+    tolerance += atol
+    return np.all(residual <= tolerance, axis=axis)
@@ -7,8 +7,17 @@ from typing import Literal
 
 import numpy as np
 
-from spgrep.group import get_cayley_table, get_factor_system_from_little_group
-from spgrep.irreps import enumerate_unitary_irreps
+from spgrep.group import (
+    get_cayley_table,
+    get_factor_system_from_little_group,
+    get_identity_index,
+)
+from spgrep.irreps import (
+    enumerate_unitary_irreps,
+    enumerate_unitary_irreps_from_regular_representation,
+    enumerate_unitary_irreps_from_solvable_group_chain,
+    purify_irrep_value_batch,
+)
 from spgrep.utils import NDArrayComplex, NDArrayFloat, NDArrayInt
 
 
@@ -21,6 +30,7 @@ def enumerate_spinor_small_representations(
     rtol: float = 1e-5,
     atol: float = 1e-8,
     max_num_random_generations: int = 4,
+    double_group: bool = False,
 ) -> tuple[list[NDArrayComplex], NDArrayComplex, NDArrayComplex]:
     r"""Enumerate all unitary irreps :math:`\mathbf{D}^{\mathbf{k}\alpha}` of little group for spinor.
 
@@ -48,6 +58,11 @@ def enumerate_spinor_small_representations(
         Relative tolerance to compare
     max_num_random_generations: int
         Maximum number of trials to generate random matrix
+    double_group: bool, default=False
+        If True, enumerate ordinary irreps of the double group of order 2 * order built from SU(2) lifts,
+        and keep ones with :math:`\chi(\bar{E}) = -\mathrm{dim}`.
+        Otherwise, enumerate projective irreps with the spinor-derived factor system.
+        Which one is faster depends on group, see ``examples/spinor_double_group.py``.
 
     Returns
     -------
@@ -70,18 +85,30 @@ def enumerate_spinor_small_representations(
         little_translations,
         kpoint,
     )
-    factor_system = spinor_factor_system * nonsymmorphic_factor_system
 
     # Compute irreps of little co-group
-    little_cogroup_irreps, _ = enumerate_unitary_irreps(
-        little_rotations,
-        factor_system,
-        real=False,  # Nonsense to consider real-value irreps
-        method=method,
-        rtol=rtol,
-        atol=atol,
-        max_num_random_generations=max_num_random_generations,
-    )
+    little_cogroup_irreps: list[NDArrayComplex] | list[NDArrayFloat]
+    if double_group:
+        little_cogroup_irreps = _enumerate_spinor_irreps_from_double_group(
+            little_rotations,
+            spinor_factor_system,
+            nonsymmorphic_factor_system,
+            method=method,
+            rtol=rtol,
+            atol=atol,
+            max_num_random_generations=max_num_random_generations,
+        )
+    else:
+        factor_system = spinor_factor_system * nonsymmorphic_factor_system
+        little_cogroup_irreps, _ = enumerate_unitary_irreps(
+            little_rotations,
+            factor_system,
+            real=False,  # Nonsense to consider real-value irreps
+            method=method,
+            rtol=rtol,
+            atol=atol,
+            max_num_random_generations=max_num_random_generations,
+        )
 
     # Small representations of little group
     phases = np.array(
@@ -94,6 +121,78 @@ def enumerate_spinor_small_representations(
     return irreps, spinor_factor_system, unitary_rotations
 
 
+def get_spinor_double_group_table(
+    rotations: NDArrayInt, spinor_factor_system: NDArrayComplex
+) -> NDArrayInt:
+    r"""Calculate Cayley table of double group from spinor-derived factor system.
+
+    The ``i``-th and ``(i + order)``-th elements of double group stand for :math:`\mathbf{U}(\mathbf{S}_{i})` and :math:`-\mathbf{U}(\mathbf{S}_{i})`, respectively.
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+    spinor_factor_system: array, (order, order)
+        Factor system with values of -1 or 1 returned by :func:`get_spinor_factor_system`
+
+    Returns
+    -------
+    double_table: array[int], (2 * order, 2 * order)
+    """
+    order = spinor_factor_system.shape[0]
+    table = get_cayley_table(rotations)
+
+    # signs[i, j] = 1 if U(S_i) U(S_j) = -U(S_k)
+    signs = (np.real(spinor_factor_system) < 0).astype(int)
+    double_table = np.zeros((2 * order, 2 * order), dtype=int)
+    for sign_i, sign_j in product([0, 1], repeat=2):
+        double_table[
+            sign_i * order : (sign_i + 1) * order, sign_j * order : (sign_j + 1) * order
+        ] = table + order * ((signs + sign_i + sign_j) % 2)
+    return double_table
+
+
+def _enumerate_spinor_irreps_from_double_group(
+    rotations: NDArrayInt,
+    spinor_factor_system: NDArrayComplex,
+    nonsymmorphic_factor_system: NDArrayComplex,
+    method: Literal["Neto", "random"] = "Neto",
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    max_num_random_generations: int = 4,
+) -> list[NDArrayComplex]:
+    order = spinor_factor_system.shape[0]
+    double_table = get_spinor_double_group_table(rotations, spinor_factor_system)
+    minus_identity = get_identity_index(double_table) + order
+    # Factor system from nonsymmorphic part does not depend on signs
+    double_factor_system = np.tile(nonsymmorphic_factor_system, (2, 2))
+
+    if method == "Neto":
+        double_irreps = enumerate_unitary_irreps_from_solvable_group_chain(
+            double_table,
+            double_factor_system,
+            atol=atol,
+            max_num_random_generations=max_num_random_generations,
+        )
+    elif method == "random":
+        reg = np.zeros((2 * order, 2 * order, 2 * order), dtype=np.complex128)
+        ks = np.arange(2 * order)
+        reg[ks[:, None], double_table, ks[None, :]] = double_factor_system
+        double_irreps = enumerate_unitary_irreps_from_regular_representation(
+            reg, rtol=rtol, max_num_random_generations=max_num_random_generations
+        )
+    else:
+        raise ValueError(f"Unknown method to compute irreps: {method}")
+
+    # Keep irreps with D(-E) = -1
+    irreps = []
+    for double_irrep in double_irreps:
+        dim = double_irrep.shape[1]
+        if np.isclose(np.trace(double_irrep[minus_identity]), -dim):
+            irreps.append(double_irrep[:order])
+
+    return purify_irrep_value_batch(irreps, atol=atol)
+
+
 def get_spinor_factor_system(
     lattice: NDArrayFloat,
     rotations: NDArrayInt,
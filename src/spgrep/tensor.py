@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
-from itertools import permutations, product
+import json
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement, permutations, product
+from math import factorial
+from os import PathLike
+from pathlib import Path
+from typing import Literal
 
 import numpy as np
 
+from spgrep.clebsch_gordan import get_clebsch_gordan_coefficients, get_irreps_key
 from spgrep.irreps import enumerate_unitary_irreps, is_equivalent_irrep
-from spgrep.representation import get_character, get_direct_product, project_to_irrep
+from spgrep.pointgroup import _get_pg_arrays, _match_standard_pointgroup
+from spgrep.representation import (
+    DirectProductRepresentation,
+    get_character,
+    project_to_irrep,
+)
 from spgrep.utils import NDArrayComplex, NDArrayFloat, NDArrayInt, grassmann_distance
 
+# Tabulated types of tensors for physical properties
+TENSOR_TYPES = ("dielectric", "piezoelectric", "second_harmonic", "elastic")
+# Voigt order of index pairs: xx, yy, zz, yz, zx, xy
+VOIGT_INDICES = ((0, 0), (1, 1), (2, 2), (1, 2), (0, 2), (0, 1))
+TENSOR_TABLE_PATH = Path(__file__).parent / "data" / "tensor_table.json"
+
 
 def get_symmetry_adapted_tensors(
     rep: NDArrayComplex | NDArrayFloat,
@@ -36,41 +54,49 @@ def get_symmetry_adapted_tensors(
     order = rep.shape[0]
 
     irreps, _ = enumerate_unitary_irreps(rotations, real=real, atol=atol)
+    # Hash irreps once for memoized Clebsch-Gordan coefficients
+    group_key = get_irreps_key(irreps)
+    irrep_keys = [get_irreps_key([irrep]) for irrep in irreps]
+
+    # Pairs of basis and index of its irrep
     all_vector_basis = []
-    for irrep in irreps:
+    for idx, irrep in enumerate(irreps):
         list_basis = project_to_irrep(rep, irrep, atol=atol)
         for basis in list_basis:
-            all_vector_basis.append((basis, irrep))
+            all_vector_basis.append((basis, idx))
 
     # Iteratively construct irreps for rank-`tensor` including not invariant ones
     all_tensor_basis = all_vector_basis[:]
     for _ in range(rank - 1):
         next_all_tensor_basis = []
-        for (tensor_basis, tensor_irrep), (vector_basis, vector_irrep) in product(
+        for (tensor_basis, tensor_idx), (vector_basis, vector_idx) in product(
             all_tensor_basis, all_vector_basis
         ):
             # tensor_basis: (dim_tensor, dim(1), ..., dim(p-1))
             # vector_basis: (dim_vector, dim)
-            dim_tensor = tensor_irrep.shape[1]
-            dim_vector = vector_irrep.shape[1]
-            direct_rep = get_direct_product(tensor_irrep, vector_irrep)
-            for irrep in irreps:
-                dim_irrep = irrep.shape[1]
-                decomposed = project_to_irrep(direct_rep, irrep, atol=atol)
-                for coeff in decomposed:
-                    coeff = coeff.reshape(dim_irrep, dim_tensor, dim_vector)
+            coefficients = get_clebsch_gordan_coefficients(
+                irreps[tensor_idx],
+                irreps[vector_idx],
+                irreps,
+                atol=atol,
+                cache_key=(group_key, irrep_keys[tensor_idx], irrep_keys[vector_idx]),
+            )
+            for idx, coeffs in enumerate(coefficients):
+                for coeff in coeffs:
+                    # coeff: (dim_tensor, dim_vector, dim_irrep)
                     # new_basis: (dim_irrep, dim(1), ..., dim(p))
                     new_basis = np.einsum(
-                        "ijk,j...,ka->i...a", coeff, tensor_basis, vector_basis, optimize="greedy"
+                        "jki,j...,ka->i...a", coeff, tensor_basis, vector_basis, optimize="greedy"
                     )
-                    next_all_tensor_basis.append((new_basis, irrep))
+                    next_all_tensor_basis.append((new_basis, idx))
 
         all_tensor_basis = next_all_tensor_basis
 
     # Take invariant tensors
     identity_character = np.ones((order,))
     tensors = []
-    for basis, irrep in all_tensor_basis:
+    for basis, idx in all_tensor_basis:
+        irrep = irreps[idx]
         if irrep.shape[1] > 1:
             continue
         character = get_character(irrep)
@@ -80,6 +106,433 @@ def get_symmetry_adapted_tensors(
     return tensors
 
 
+def get_invariant_tensors(
+    rep: NDArrayComplex | NDArrayFloat,
+    rank: int,
+    intrinsic_permutations: list[tuple[int, ...]] | None = None,
+) -> NDArrayComplex | NDArrayFloat:
+    r"""Calculate orthonormal basis of invariant tensors as the image of the Reynolds operator.
+
+    The invariant subspace of :math:`D^{\otimes n}` with intrinsic symmetry :math:`S` is the image of the projector
+
+    .. math::
+       \mathcal{R} = \frac{1}{|G|} \sum_{g \in G} D(g)^{\otimes n} \, \frac{1}{|P|} \sum_{p \in P} p,
+
+    where :math:`P` is a group of permutations of tensor axes.
+    Its dimension is computed from traces of powers of ``rep`` only,
+    then :math:`\mathcal{R}` is applied to the same number of random tensors by sequential mode products, and orthonormal basis vectors are extracted by one QR decomposition.
+    Unlike :func:`get_symmetry_adapted_tensors` and :func:`apply_intrinsic_symmetry`, this does not enumerate products of basis tensors.
+
+    Parameters
+    ----------
+    rep: array, (order, dim, dim)
+        Representation matrices
+    rank: int
+        Rank of returned tensor
+    intrinsic_permutations: (Optional) list of tuple of int
+        Permutations of ``range(rank)`` generating intrinsic symmetry of tensors, e.g. ``[(1, 0, 2, 3), (0, 1, 3, 2), (2, 3, 0, 1)]`` for elastic constants.
+        If not specified, no intrinsic symmetry is imposed.
+
+    Returns
+    -------
+    tensors: array, (num_tensors, dim, ..., dim)
+        Orthonormal basis of invariant tensors. Real if ``rep`` is real.
+    """
+    order, dim, _ = rep.shape
+    perms = _get_permutation_group(rank, intrinsic_permutations)
+
+    # Dimension of invariant subspace: trace of D^{otimes n} p is product of tr(D^{l}) over cycles of p
+    trace_powers = np.zeros((rank + 1, order), dtype=np.complex128)
+    power = np.broadcast_to(np.eye(dim), rep.shape)
+    for length in range(1, rank + 1):
+        power = power @ rep
+        trace_powers[length] = np.einsum("kii->k", power)
+    traces = np.zeros(order, dtype=np.complex128)
+    for perm in perms:
+        traces += np.prod([trace_powers[length] for length in _get_cycle_lengths(perm)], axis=0)
+    num_tensors = int(np.rint(np.real(np.sum(traces)) / (order * len(perms))))
+    shape = (dim,) * rank
+    if num_tensors == 0:
+        return np.zeros((0,) + shape, dtype=rep.dtype)
+
+    # Apply Reynolds operator to random sketch
+    rng = np.random.default_rng(seed=0)
+    sketch = rng.standard_normal((num_tensors,) + shape)
+    if np.iscomplexobj(rep):
+        sketch = sketch + 1j * rng.standard_normal((num_tensors,) + shape)
+    sketch = sum(np.transpose(sketch, (0,) + tuple(1 + p for p in perm)) for perm in perms)
+    direct = DirectProductRepresentation([rep] * rank)
+    averaged = direct.apply(sketch, weights=np.full(order, 1 / (order * len(perms))))
+
+    q, _ = np.linalg.qr(averaged.reshape(num_tensors, -1).T)
+    tensors = q.T.reshape((num_tensors,) + shape)
+    return tensors
+
+
+def _get_permutation_group(
+    rank: int, generators: list[tuple[int, ...]] | None
+) -> list[tuple[int, ...]]:
+    identity = tuple(range(rank))
+    group = {identity}
+    queue = [identity]
+    generators = generators or []
+    while queue:
+        perm = queue.pop()
+        for generator in generators:
+            product = tuple(perm[i] for i in generator)
+            if product not in group:
+                group.add(product)
+                queue.append(product)
+    return sorted(group)
+
+
+def _get_cycle_lengths(perm: tuple[int, ...]) -> list[int]:
+    lengths = []
+    visited = [False] * len(perm)
+    for start in range(len(perm)):
+        if visited[start]:
+            continue
+        length = 0
+        i = start
+        while not visited[i]:
+            visited[i] = True
+            i = perm[i]
+            length += 1
+        lengths.append(length)
+    return lengths
+
+
+def get_symmetric_power_representation(
+    rep: NDArrayComplex | NDArrayFloat,
+    n: int,
+    kind: Literal["symmetric", "antisymmetric"] = "symmetric",
+) -> tuple[NDArrayComplex | NDArrayFloat, NDArrayInt]:
+    r"""Calculate symmetric power :math:`\mathrm{Sym}^{n} D` or exterior power :math:`\Lambda^{n} D` of representation in compressed basis.
+
+    Basis vectors are labeled by multisets (for 'symmetric') or subsets (for 'antisymmetric') ``index`` of ``range(dim)`` with size ``n``, which corresponds to orthonormal tensor
+
+    .. math::
+       e_{\mathrm{index}} = \frac{1}{\sqrt{N}} \sum_{\sigma} (\pm 1)^{\sigma} e_{\mathrm{index}_{\sigma(1)}} \otimes \cdots \otimes e_{\mathrm{index}_{\sigma(n)}},
+
+    where the summation is over distinct rearrangements and :math:`N` is their number.
+    Matrix elements are computed by expanding products of linear forms (for 'symmetric') or minors (for 'antisymmetric'),
+    which takes polynomial time in ``dim`` instead of enumerating ``n!`` permutations.
+    Nested calls give plethysms, e.g. ``Sym^2(Sym^2 D)`` for elastic constants in Voigt notation.
+
+    Parameters
+    ----------
+    rep: array, (order, dim, dim)
+    n: int
+    kind: str, 'symmetric' or 'antisymmetric'
+
+    Returns
+    -------
+    power_rep: array, (order, num_basis, num_basis)
+    indices: array[int], (num_basis, n)
+        Sorted multisets or subsets labeling basis vectors in lexicographic order
+    """
+    order, dim, _ = rep.shape
+    if kind == "antisymmetric":
+        subsets = list(combinations(range(dim), n))
+        indices = np.array(subsets, dtype=int).reshape(len(subsets), n)
+        if len(indices) == 0:
+            return np.zeros((order, 0, 0), dtype=rep.dtype), indices
+        # Minors: det(D[index, index'])
+        minors = rep[:, indices[:, None, :, None], indices[None, :, None, :]]
+        return np.linalg.det(minors), indices
+    elif kind != "symmetric":
+        raise ValueError(f"Unknown kind of power: {kind}")
+
+    # Monomials of each degree
+    monomials = []
+    for k in range(n + 1):
+        monomials_k = list(combinations_with_replacement(range(dim), k))
+        monomials.append(np.array(monomials_k, dtype=int).reshape(len(monomials_k), k))
+    indices = monomials[n]
+    num_basis = len(indices)
+
+    # coefficients[k, M, M'] = coefficient of x^{M} in prod_{l < (step)} (sum_a D[k, a, M'_l] x_a)
+    coefficients = np.ones((order, 1, num_basis), dtype=rep.dtype)
+    for step in range(n):
+        lookup = {tuple(monomial): idx for idx, monomial in enumerate(monomials[step + 1])}
+        next_coefficients = np.zeros((order, len(monomials[step + 1]), num_basis), dtype=rep.dtype)
+        for a in range(dim):
+            multiplied = [
+                lookup[tuple(sorted(monomial.tolist() + [a]))] for monomial in monomials[step]
+            ]
+            np.add.at(
+                next_coefficients,
+                (slice(None), np.array(multiplied, dtype=int)),
+                coefficients * rep[:, a, indices[:, step]][:, None, :],
+            )
+        coefficients = next_coefficients
+
+    # Normalize for orthonormal basis: sqrt(prod m! / prod m'!)
+    multiplicity_factorials = np.array(
+        [
+            np.prod([factorial(count) for count in np.unique(index, return_counts=True)[1]])
+            for index in indices
+        ],
+        dtype=np.float64,
+    )
+    power_rep = coefficients * np.sqrt(
+        multiplicity_factorials[:, None] / multiplicity_factorials[None, :]
+    )
+    return power_rep, indices
+
+
+def get_invariant_symmetric_tensors(
+    rep: NDArrayComplex | NDArrayFloat,
+    rank: int,
+    kind: Literal["symmetric", "antisymmetric"] = "symmetric",
+) -> tuple[NDArrayComplex | NDArrayFloat, NDArrayInt]:
+    """Calculate invariant totally symmetric (or antisymmetric) tensors in compressed basis.
+
+    Invariants are computed as the image of the group average of :func:`get_symmetric_power_representation`, whose dimension is ``C(dim + rank - 1, rank)`` (or ``C(dim, rank)``) instead of ``dim**rank``.
+    Use :func:`reconstruct_symmetric_tensors` to obtain full tensors.
+
+    Parameters
+    ----------
+    rep: array, (order, dim, dim)
+    rank: int
+    kind: str, 'symmetric' or 'antisymmetric'
+
+    Returns
+    -------
+    coefficients: array, (num_tensors, num_basis)
+        Orthonormal coefficients of invariant tensors in compressed basis
+    indices: array[int], (num_basis, rank)
+        Multisets or subsets labeling compressed basis
+    """
+    power_rep, indices = get_symmetric_power_representation(rep, rank, kind=kind)
+    num_basis = len(indices)
+    reynolds = np.mean(power_rep, axis=0)
+    num_tensors = int(np.rint(np.real(np.trace(reynolds)))) if num_basis > 0 else 0
+    if num_tensors == 0:
+        return np.zeros((0, num_basis), dtype=rep.dtype), indices
+
+    rng = np.random.default_rng(seed=0)
+    sketch = rng.standard_normal((num_basis, num_tensors))
+    q, _ = np.linalg.qr(reynolds @ sketch)
+    return q.T, indices
+
+
+def reconstruct_symmetric_tensors(
+    coefficients: NDArrayComplex | NDArrayFloat,
+    indices: NDArrayInt,
+    dim: int,
+    kind: Literal["symmetric", "antisymmetric"] = "symmetric",
+) -> NDArrayComplex | NDArrayFloat:
+    """Reconstruct full tensors from coefficients in compressed basis.
+
+    Parameters
+    ----------
+    coefficients: array, (num_tensors, num_basis)
+    indices: array[int], (num_basis, rank)
+        Returned by :func:`get_symmetric_power_representation` or :func:`get_invariant_symmetric_tensors`
+    dim: int
+    kind: str, 'symmetric' or 'antisymmetric'
+
+    Returns
+    -------
+    tensors: array, (num_tensors, dim, ..., dim)
+    """
+    num_tensors = coefficients.shape[0]
+    rank = indices.shape[1]
+    shape = (dim,) * rank
+
+    # Position of each sorted index in `indices`
+    lookup = np.full(dim**rank, -1, dtype=int)
+    if len(indices) > 0:
+        lookup[np.ravel_multi_index(indices.T, shape)] = np.arange(len(indices))
+
+    all_indices = np.indices(shape).reshape(rank, -1).T  # (dim**rank, rank)
+    argsort = np.argsort(all_indices, axis=1, kind="stable")
+    sorted_indices = np.take_along_axis(all_indices, argsort, axis=1)
+    positions = lookup[np.ravel_multi_index(sorted_indices.T, shape)]
+    if kind == "symmetric":
+        counts = np.array(
+            [
+                np.prod([factorial(count) for count in np.unique(index, return_counts=True)[1]])
+                for index in sorted_indices
+            ]
+        )
+        weights = np.sqrt(counts / factorial(rank))
+    elif kind == "antisymmetric":
+        # Sign of sorting permutation, and zero for repeated indices
+        weights = np.linalg.det(np.eye(rank)[argsort]) / np.sqrt(factorial(rank))
+        weights[positions == -1] = 0
+    else:
+        raise ValueError(f"Unknown kind of power: {kind}")
+
+    tensors = np.zeros((num_tensors, dim**rank), dtype=coefficients.dtype)
+    valid = positions != -1
+    tensors[:, valid] = coefficients[:, positions[valid]] * weights[None, valid]
+    return tensors.reshape((num_tensors,) + shape)
+
+
+def get_property_tensors(
+    rotations: NDArrayInt,
+    tensor_type: Literal["dielectric", "piezoelectric", "second_harmonic", "elastic"],
+    use_table: bool = True,
+    atol: float = 1e-8,
+) -> NDArrayFloat:
+    r"""Calculate basis of invariant tensors for physical properties under crystallographic point group.
+
+    - 'dielectric': rank-2 symmetric tensor :math:`\varepsilon_{ij} = \varepsilon_{ji}`
+    - 'piezoelectric': rank-3 tensor :math:`d_{ijk} = d_{ikj}`
+    - 'second_harmonic': rank-3 tensor :math:`\chi^{(2)}_{ijk} = \chi^{(2)}_{ikj}`
+    - 'elastic': rank-4 tensor with Voigt symmetry :math:`C_{ijkl} = C_{jikl} = C_{ijlk} = C_{klij}`
+
+    Tensors transform as :math:`T_{i_1 \dots i_n} \mapsto \sum R_{i_1 j_1} \cdots R_{i_n j_n} T_{j_1 \dots j_n}`.
+    Invariant tensors for the 32 point groups in all settings of ``pg_dataset`` are tabulated in compressed basis (see :func:`generate_tensor_table`).
+    If ``rotations`` are conjugate to a tabulated point group, tensors are looked up and transformed to the basis of ``rotations``.
+    Otherwise, they are computed from the Reynolds operator on the compressed basis.
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+    tensor_type: str
+    use_table: bool, default=True
+        If False, always compute tensors without the table.
+    atol: float
+        Absolute tolerance to compute rank of invariant subspace
+
+    Returns
+    -------
+    tensors: array, (num_tensors, 3, ..., 3)
+        Basis of invariant tensors, which is not orthonormal in general.
+        For rotations in a tabulated setting, each basis tensor has a unit coefficient on an independent component in compressed basis.
+    """
+    if tensor_type not in TENSOR_TYPES:
+        raise ValueError(f"Unknown type of tensor: {tensor_type}")
+    rotations = np.asarray(rotations)
+    basis = _get_compressed_basis(tensor_type)  # (num_basis, 3, ..., 3)
+    rank = basis.ndim - 1
+
+    if use_table:
+        try:
+            pg_symbol, idx, P, _ = _match_standard_pointgroup(rotations)
+        except ValueError:
+            pg_symbol = None
+        if pg_symbol is not None:
+            rows = _load_tensor_table()[tensor_type][pg_symbol][idx]
+            coefficients = np.zeros((len(rows), len(basis)))
+            for i, row in enumerate(rows):
+                for col, value in row:
+                    coefficients[i, col] = value
+            std_tensors = np.tensordot(coefficients, basis, axes=1)
+            # rotations = P @ std_rotations @ P^-1 acts on P^{otimes n} @ std_tensors
+            return DirectProductRepresentation([P[None]] * rank).apply(std_tensors)[0]
+
+    coefficients = _get_invariant_coefficients(rotations, tensor_type, atol=atol)
+    return np.tensordot(coefficients, basis, axes=1)
+
+
+def generate_tensor_table(
+    filename: str | PathLike | None = None, decimals: int = 12
+) -> dict[str, dict[str, list[list[list[list[float]]]]]]:
+    """Generate table of invariant tensors for all settings of the 32 point groups used in :func:`get_property_tensors`.
+
+    Parameters
+    ----------
+    filename: (Optional) str or PathLike
+        If specified, dump the table as JSON.
+    decimals: int
+        Number of decimals to round coefficients
+
+    Returns
+    -------
+    table: dict
+        ``table[tensor_type][pg_symbol][idx]`` is invariant tensors in compressed basis for the ``idx``-th setting of ``pg_dataset[pg_symbol]``.
+        Each tensor is stored as a list of nonzero coefficients ``[index of basis, value]``.
+    """
+    table = {}  # type: ignore
+    for tensor_type in TENSOR_TYPES:
+        table[tensor_type] = {}
+        for pg_symbol, settings in _get_pg_arrays().items():
+            table[tensor_type][pg_symbol] = []
+            for std_rotations, _ in settings:
+                coefficients = _get_invariant_coefficients(std_rotations, tensor_type)
+                # Add zero to remove negative zeros
+                coefficients = np.round(coefficients, decimals=decimals) + 0.0
+                # Only store nonzero coefficients as pairs of (index of basis, value)
+                table[tensor_type][pg_symbol].append(
+                    [
+                        [[int(col), float(row[col])] for col in np.nonzero(row)[0]]
+                        for row in coefficients
+                    ]
+                )
+
+    if filename is not None:
+        with open(filename, "w") as f:
+            json.dump(table, f, separators=(",", ":"))
+    return table
+
+
+@lru_cache(maxsize=None)
+def _load_tensor_table() -> dict[str, dict[str, list[list[list[list[float]]]]]]:
+    with open(TENSOR_TABLE_PATH) as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _get_compressed_basis(tensor_type: str) -> NDArrayFloat:
+    """Return orthonormal basis tensors with (num_basis, 3, ..., 3) spanning tensors with intrinsic symmetry of ``tensor_type``."""
+    voigt = np.zeros((len(VOIGT_INDICES), 3, 3))
+    for i, (j, k) in enumerate(VOIGT_INDICES):
+        voigt[i, j, k] = voigt[i, k, j] = 1
+    voigt /= np.linalg.norm(voigt.reshape(len(voigt), -1), axis=1)[:, None, None]
+
+    if tensor_type == "dielectric":
+        basis = voigt
+    elif tensor_type in ["piezoelectric", "second_harmonic"]:
+        basis = np.einsum("ai,bjk->abijk", np.eye(3), voigt).reshape(-1, 3, 3, 3)
+    elif tensor_type == "elastic":
+        pairs = list(combinations_with_replacement(range(len(voigt)), 2))
+        basis = np.array(
+            [
+                np.einsum("ij,kl->ijkl", voigt[a], voigt[b])
+                + np.einsum("ij,kl->ijkl", voigt[b], voigt[a])
+                for a, b in pairs
+            ]
+        )
+        basis /= np.linalg.norm(basis.reshape(len(basis), -1), axis=1)[:, None, None, None, None]
+    else:
+        raise ValueError(f"Unknown type of tensor: {tensor_type}")
+    return basis
+
+
+def _get_invariant_coefficients(
+    rotations: NDArrayInt, tensor_type: str, atol: float = 1e-8
+) -> NDArrayFloat:
+    """Return invariant tensors in compressed basis as reduced row echelon form."""
+    basis = _get_compressed_basis(tensor_type)
+    num_basis, rank = len(basis), basis.ndim - 1
+    order = len(rotations)
+
+    # Reynolds operator restricted to compressed basis, which is invariant under rotations
+    direct = DirectProductRepresentation([np.asarray(rotations, dtype=np.float64)] * rank)
+    averaged = direct.apply(basis, weights=np.full(order, 1 / order))  # (num_basis, 3, ..., 3)
+    reynolds = averaged.reshape(num_basis, -1) @ basis.reshape(num_basis, -1).T
+
+    # Reduced row echelon form of row space
+    matrix = reynolds.copy()
+    pivot_row = 0
+    for col in range(num_basis):
+        if pivot_row == num_basis:
+            break
+        pivot = pivot_row + np.argmax(np.abs(matrix[pivot_row:, col]))
+        if np.abs(matrix[pivot, col]) < atol:
+            continue
+        matrix[[pivot_row, pivot]] = matrix[[pivot, pivot_row]]
+        matrix[pivot_row] /= matrix[pivot_row, col]
+        others = np.arange(num_basis) != pivot_row
+        matrix[others] -= np.outer(matrix[others, col], matrix[pivot_row])
+        pivot_row += 1
+    return matrix[:pivot_row]
+
+
 def apply_intrinsic_symmetry(
     tensors: list[NDArrayComplex] | list[NDArrayFloat],
     atol: float = 1e-6,  # A bit large tolerance setting to handle numerical noise
@@ -89,6 +542,7 @@ def apply_intrinsic_symmetry(
     Note
     ----
     Current implementation may return wrong number of symmetrized tensors for higher rank...
+    Use :func:`get_invariant_symmetric_tensors` for totally symmetric tensors instead.
     """
     list_sym_basis = []  # type: ignore
     for coeff in tensors:
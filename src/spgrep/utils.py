@@ -28,6 +28,71 @@ def ndarray2d_to_integer_tuple(array: NDArrayFloat) -> tuple[tuple[Any]]:
     return array_t  # type: ignore
 
 
+def encode_rotations(rotations: NDArrayInt) -> NDArrayInt:
+    """Encode integer matrices into integer keys.
+
+    Each element should be in [-8, 7], which holds for rotations of crystallographic groups.
+    Elements are packed by four bits with an offset of eight.
+
+    Parameters
+    ----------
+    rotations: array[int], (..., 3, 3)
+
+    Returns
+    -------
+    keys: array[int], (..., )
+    """
+    rotations = np.around(rotations).astype(np.int64)
+    flat = rotations.reshape(rotations.shape[:-2] + (-1,))
+    if np.any(flat < -8) or np.any(flat > 7):
+        raise ValueError("Elements of rotations should be in [-8, 7].")
+    weights = np.left_shift(np.int64(1), 4 * np.arange(flat.shape[-1], dtype=np.int64))
+    keys = np.sum((flat + 8) * weights, axis=-1)
+    return keys
+
+
+def get_rotations_key(rotations: NDArrayInt) -> str:
+    """Return hashable key of ordered ``rotations`` for memoization.
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+
+    Returns
+    -------
+    key: str
+        Comma-separated keys by :func:`encode_rotations`
+    """
+    return ",".join(map(str, encode_rotations(rotations).tolist()))
+
+
+def get_rotation_indices(rotations: NDArrayInt, queries: NDArrayInt) -> NDArrayInt:
+    """Return indices of ``queries`` in ``rotations``.
+
+    If a rotation appears more than once in ``rotations``, the smallest index is returned as ``list.index`` does.
+
+    Parameters
+    ----------
+    rotations: array[int], (order, 3, 3)
+    queries: array[int], (..., 3, 3)
+
+    Returns
+    -------
+    indices: array[int], (..., )
+        ``rotations[indices[...]] == queries[...]``
+    """
+    keys = encode_rotations(rotations)
+    argsort = np.argsort(keys, kind="stable")
+    sorted_keys = keys[argsort]
+
+    query_keys = encode_rotations(queries)
+    positions = np.searchsorted(sorted_keys, query_keys, side="left")
+    positions = np.minimum(positions, len(sorted_keys) - 1)
+    if np.any(sorted_keys[positions] != query_keys):
+        raise ValueError("Some of queries are not found in rotations.")
+    return argsort[positions]
+
+
 def get_symmetry_from_hall_number(hall_number: int) -> tuple[NDArrayInt, NDArrayFloat]:
     """Return symmetry operations from Hall number.
 
@@ -125,6 +190,7 @@ def mode_dot(coeffs: NDArray, list_matrix: list[NDArray]) -> NDArray:
     """Calculate p-mode product of tensor and list of matrices.
 
     For example, 3-mode product of ``coeffs`` and ``list_matrix=[m1, m2, m3]`` is ``np.einsum("ijk,ia,jb,kc", coeffs, m1, m2, m3)``.
+    Each mode is contracted by :func:`numpy.tensordot` without broadcasted intermediates.
 
     Parameters
     ----------
@@ -135,34 +201,28 @@ def mode_dot(coeffs: NDArray, list_matrix: list[NDArray]) -> NDArray:
     -------
     ret: (n_1, ..., n_p)
     """
+    ret = coeffs
+    for axis, mat in enumerate(list_matrix):
+        # Contracted axis is replaced with the last axis of `mat`
+        ret = np.moveaxis(np.tensordot(ret, mat, axes=(axis, 0)), -1, axis)
+    return ret
 
-    def _mode_dot(tensor, mat, axis):
-        # tensor: (m_{0}, ..., m_{axis}, ...)
-        # mat: (m_{axis}, n)
-        # ret: (m_{0}, ..., n, ...)
-        dim_tensor = tuple(
-            [
-                1,
-            ]
-            + list(tensor.shape)
-        )
-        tensor_reshaped = tensor.reshape(dim_tensor)
-
-        dim_mat = tuple(
-            list(mat.shape)
-            + [
-                1,
-            ]
-            * (tensor.ndim - 1)
-        )
-        mat_reshaped = np.swapaxes(np.swapaxes(mat.reshape(dim_mat), 0, 1), 1, axis + 1)
 
-        ret = np.swapaxes(
-            np.sum(tensor_reshaped * mat_reshaped, axis=axis + 1, keepdims=True), 0, axis + 1
-        )
-        return ret[0]
+def mode_dot_batch(stacked_coeffs: NDArray, list_matrix: list[NDArray]) -> NDArray:
+    """Calculate p-mode products of stacked tensors with the same list of matrices.
+
+    Equivalent to ``np.array([mode_dot(coeffs, list_matrix) for coeffs in stacked_coeffs])``.
+
+    Parameters
+    ----------
+    stacked_coeffs: array, (batch, m, ..., m)
+    list_matrix: list of array, shape of the i-th array is (m, n_i)
 
-    ret = coeffs.copy()
-    for axis in range(len(list_matrix)):
-        ret = _mode_dot(ret, list_matrix[axis], axis)
+    Returns
+    -------
+    ret: (batch, n_1, ..., n_p)
+    """
+    ret = stacked_coeffs
+    for axis, mat in enumerate(list_matrix):
+        ret = np.moveaxis(np.tensordot(ret, mat, axes=(axis + 1, 0)), -1, axis + 1)
     return ret
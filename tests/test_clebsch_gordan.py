@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from spgrep.clebsch_gordan import (
+    clear_clebsch_gordan_cache,
+    get_clebsch_gordan_coefficients,
+    get_irreps_key,
+    get_operator_characters,
+    get_selection_rules,
+    get_tensor_product_multiplicities,
+)
+from spgrep.irreps import enumerate_unitary_irreps
+from spgrep.representation import get_character, get_direct_product
+from spgrep.spinor import get_spinor_factor_system
+
+
+@pytest.mark.parametrize("pointgroup", ["Oh", "C3v"])
+def test_clebsch_gordan_coefficients(pointgroup, request):
+    rotations = request.getfixturevalue(pointgroup)
+    irreps, _ = enumerate_unitary_irreps(rotations)
+    characters = np.array([get_character(irrep) for irrep in irreps])
+    multiplicities = get_tensor_product_multiplicities(characters, characters, characters)
+
+    clear_clebsch_gordan_cache()
+    for a, irrep1 in enumerate(irreps):
+        for b, irrep2 in enumerate(irreps):
+            coefficients = get_clebsch_gordan_coefficients(irrep1, irrep2, irreps)
+            _check_clebsch_gordan_coefficients(irrep1, irrep2, irreps, coefficients)
+            assert [len(c) for c in coefficients] == list(multiplicities[a, b])
+
+    # Memoized coefficients are not affected by modifying returned ones
+    expect = [coeffs.copy() for coeffs in coefficients]
+    for coeffs in coefficients:
+        coeffs[:] = 0
+    memoized = get_clebsch_gordan_coefficients(irreps[-1], irreps[-1], irreps)
+    for actual, coeffs in zip(memoized, expect):
+        assert np.allclose(actual, coeffs)
+
+    # Precomputed key gives the same memoized coefficients
+    cache_key = (
+        get_irreps_key(irreps),
+        get_irreps_key([irreps[-1]]),
+        get_irreps_key([irreps[-1]]),
+    )
+    memoized = get_clebsch_gordan_coefficients(irreps[-1], irreps[-1], irreps, cache_key=cache_key)
+    for actual, coeffs in zip(memoized, expect):
+        assert np.allclose(actual, coeffs)
+
+
+def test_clebsch_gordan_coefficients_spinor(C3v, hexagonal_lattice):
+    # Spinor irreps x spinor irreps -> linear irreps
+    spinor_factor_system, _ = get_spinor_factor_system(hexagonal_lattice, C3v)
+    spinor_irreps, _ = enumerate_unitary_irreps(C3v, spinor_factor_system)
+    irreps, _ = enumerate_unitary_irreps(C3v)
+    for irrep1 in spinor_irreps:
+        for irrep2 in spinor_irreps:
+            coefficients = get_clebsch_gordan_coefficients(irrep1, irrep2, irreps, use_cache=False)
+            _check_clebsch_gordan_coefficients(irrep1, irrep2, irreps, coefficients)
+
+
+def test_operator_characters(Oh):
+    direct = np.einsum("kab,kcd->kacbd", Oh, Oh).reshape(-1, 9, 9)
+    swap = np.eye(9).reshape(3, 3, 3, 3).transpose(0, 1, 3, 2).reshape(9, 9)
+    for kind, sign in [("symmetric", 1), ("antisymmetric", -1)]:
+        projector = (np.eye(9) + sign * swap) / 2
+        expect = np.einsum("kij,ji->k", direct, projector)
+        assert np.allclose(get_operator_characters(Oh, kind), expect)
+
+    assert np.allclose(get_operator_characters(Oh, "vector"), np.einsum("kii->k", Oh))
+    with pytest.raises(ValueError):
+        get_operator_characters(Oh, "unknown")
+
+
+def test_selection_rules(Oh):
+    irreps, _ = enumerate_unitary_irreps(Oh)
+    characters = np.array([get_character(irrep) for irrep in irreps])
+    operators = np.array(
+        [get_operator_characters(Oh, kind) for kind in ["scalar", "vector", "symmetric"]]
+    )
+    multiplicities = get_selection_rules(characters, operators)
+    assert multiplicities.shape == (len(irreps), 3, len(irreps))
+
+    # Scalar operator connects only the same irreps
+    assert np.all(multiplicities[:, 0, :] == np.eye(len(irreps), dtype=int))
+
+    # From trivial irrep, vector operator reaches only the irrep of vector itself (T1u)
+    trivial = np.argmax(np.all(np.isclose(characters, 1), axis=1))
+    vector = get_operator_characters(Oh, "vector")
+    for b, character in enumerate(characters):
+        expect = int(np.allclose(character, vector))
+        assert multiplicities[trivial, 1, b] == expect
+
+    # Vector and symmetric tensor have opposite parity under inversion
+    inversion = np.argmax(np.all(Oh == -np.eye(3, dtype=int)[None], axis=(1, 2)))
+    parity = np.sign(np.real(characters[:, inversion]))
+    allowed = multiplicities > 0
+    for a, b in zip(*np.nonzero(allowed[:, 1, :])):
+        assert parity[a] == -parity[b]
+    for a, b in zip(*np.nonzero(allowed[:, 2, :])):
+        assert parity[a] == parity[b]
+
+
+def _check_clebsch_gordan_coefficients(irrep1, irrep2, irreps, coefficients):
+    dim1 = irrep1.shape[1]
+    dim2 = irrep2.shape[1]
+    direct = get_direct_product(irrep1, irrep2)
+    basis = []
+    for irrep, coeffs in zip(irreps, coefficients):
+        for coeff in coeffs:
+            coeff = coeff.reshape(dim1 * dim2, -1)
+            assert np.allclose(direct @ coeff, coeff @ irrep)
+            basis.append(coeff)
+    basis = np.concatenate(basis, axis=1)
+    assert np.allclose(np.conj(basis.T) @ basis, np.eye(dim1 * dim2))
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from spglib import get_symmetry_dataset
+
+from spgrep.core import get_compatibility_relations
+
+
+def test_get_compatibility_relations(corundum_cell):
+    # Gamma -> Lambda, Gamma -> Sigma, and Z -> Lambda
+    kpoints = np.array([[0, 0, 0], [0, 0, 0.1], [0.1, 0, 0], [0, 0, 1.5], [0, 0, 1.4]])
+    edges = [(0, 1), (0, 2), (3, 4)]
+    irreps, multiplicities = get_compatibility_relations(*corundum_cell, kpoints, edges)
+    assert len(multiplicities) == len(edges)
+
+    for (i, j), multiplicity in zip(edges, multiplicities):
+        assert multiplicity.shape == (len(irreps[i]), len(irreps[j]))
+        assert np.all(multiplicity >= 0)
+        dims_i = np.array([irrep.shape[1] for irrep in irreps[i]])
+        dims_j = np.array([irrep.shape[1] for irrep in irreps[j]])
+        assert np.all(multiplicity @ dims_j == dims_i)
+
+    with pytest.raises(ValueError):
+        get_compatibility_relations(*corundum_cell, kpoints, [(1, 0)])
+
+
+def test_compatibility_relations_gamma_to_lambda(corundum_cell):
+    # Gamma (-3m) -> Lambda (3m) of corundum (R-3c)
+    kpoints = np.array([[0, 0, 0], [0, 0, 0.1]])
+    irreps, multiplicities = get_compatibility_relations(*corundum_cell, kpoints, [(0, 1)])
+    multiplicity = multiplicities[0]
+    assert multiplicity.shape == (6, 3)
+
+    # Label irreps at Gamma by characters of inversion and two-fold rotation
+    rotations = get_symmetry_dataset(corundum_cell).rotations
+    inversion = np.where(np.all(rotations == -np.eye(3, dtype=int), axis=(1, 2)))[0][0]
+    twofold = np.where((np.linalg.det(rotations) > 0) & (np.einsum("kii->k", rotations) == -1))[0][
+        0
+    ]
+    labels = {}
+    for alpha, irrep in enumerate(irreps[0]):
+        chi_inversion = np.real(np.trace(irrep[inversion]))
+        chi_twofold = np.real(np.trace(irrep[twofold]))
+        parity = "g" if chi_inversion > 0 else "u"
+        if irrep.shape[1] == 2:
+            labels[f"E{parity}"] = alpha
+        elif chi_twofold > 0:
+            labels[f"A1{parity}"] = alpha
+        else:
+            labels[f"A2{parity}"] = alpha
+    assert len(labels) == 6
+
+    # Lambda1 and Lambda2 are one-dimensional, Lambda3 is two-dimensional
+    (lambda1,) = np.nonzero(multiplicity[labels["A1g"]])[0]
+    (lambda2,) = np.nonzero(multiplicity[labels["A2g"]])[0]
+    (lambda3,) = [beta for beta, irrep in enumerate(irreps[1]) if irrep.shape[1] == 2]
+    expect = {
+        "A1g": lambda1,
+        "A2g": lambda2,
+        "Eg": lambda3,
+        "A1u": lambda2,
+        "A2u": lambda1,
+        "Eu": lambda3,
+    }
+    for label, beta in expect.items():
+        expect_row = np.zeros(3, dtype=int)
+        expect_row[beta] = 1
+        assert np.all(multiplicity[labels[label]] == expect_row)
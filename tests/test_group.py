@@ -3,14 +3,43 @@ import numpy as np
 from spgrep.group import (
     check_cocycle_condition,
     decompose_by_maximal_space_subgroup,
+    get_canonical_factor_system,
+    get_cayley_table,
     get_factor_system_from_little_group,
+    get_identity_index,
+    get_inverse_index,
     get_little_group,
+    get_solvable_chain_generators,
     is_matrix_group,
 )
+from spgrep.irreps import enumerate_unitary_irreps
+from spgrep.pointgroup import pg_dataset
+from spgrep.representation import is_representation
+from spgrep.utils import is_prime
 
 
 def test_is_matrix_group(C3v):
     assert is_matrix_group(C3v)
+    assert not is_matrix_group(C3v[:5])
+
+
+def test_get_cayley_table(C3v):
+    table = get_cayley_table(C3v)
+    for i, j in np.ndindex(table.shape):
+        assert np.array_equal(C3v[i] @ C3v[j], C3v[table[i, j]])
+
+
+def test_get_cayley_table_with_large_elements():
+    # Elements out of range of encoded keys
+    rotations = np.array(
+        [
+            [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+            [[1, -20, 0], [0, -1, 0], [0, 0, 1]],
+        ]
+    )
+    assert is_matrix_group(rotations)
+    assert np.array_equal(get_cayley_table(rotations), [[0, 1], [1, 0]])
+    assert not is_matrix_group(rotations[1:])
 
 
 def test_get_little_group_and_factor_system(P42mnm):
@@ -30,6 +59,16 @@ def test_get_little_group_and_factor_system(P42mnm):
         little_rotations, little_translations, kpoint
     )
     assert check_cocycle_condition(little_rotations, factor_system)
+    table = get_cayley_table(little_rotations)
+    for chunk_size in [1, 3]:
+        assert check_cocycle_condition(
+            little_rotations, factor_system, table=table, chunk_size=chunk_size
+        )
+
+    # Breaking a single value violates cocycle condition
+    broken = factor_system.copy()
+    broken[1, 2] *= -1
+    assert not check_cocycle_condition(little_rotations, broken, table=table, chunk_size=3)
 
 
 def test_decompose_by_maximal_space_subgroup(P42mnm_type3):
@@ -40,3 +79,66 @@ def test_decompose_by_maximal_space_subgroup(P42mnm_type3):
     assert len(xsg_indices) == 8
     assert len(time_reversal_indices) == 8
     assert sorted(xsg_indices + time_reversal_indices) == list(range(16))
+
+
+def test_get_canonical_factor_system(P42mnm, rng):
+    rotations, translations = P42mnm
+    kpoint = np.array([0, 1 / 2, 0])  # X point
+    little_rotations, little_translations, _ = get_little_group(rotations, translations, kpoint)
+    factor_system = get_factor_system_from_little_group(
+        little_rotations, little_translations, kpoint
+    )
+    table = get_cayley_table(little_rotations)
+
+    canonical, gauge = get_canonical_factor_system(little_rotations, factor_system)
+    assert np.allclose(canonical, factor_system * np.outer(gauge, gauge) / gauge[table])
+    assert check_cocycle_condition(little_rotations, canonical, table=table)
+
+    # Factor system differing by coboundary
+    order = len(little_rotations)
+    coboundary = np.exp(2j * np.pi * rng.random(order))
+    factor_system2 = factor_system * np.outer(coboundary, coboundary) / coboundary[table]
+    canonical2, _ = get_canonical_factor_system(little_rotations, factor_system2, table=table)
+    assert np.allclose(canonical, canonical2)
+
+    # Irreps with canonical factor system are re-gauged to those with original one
+    canonical_irreps, _ = enumerate_unitary_irreps(little_rotations, canonical)
+    for canonical_irrep in canonical_irreps:
+        irrep = canonical_irrep / gauge[:, None, None]
+        assert is_representation(irrep, table, factor_system)
+
+    # Trivial class
+    trivial, _ = get_canonical_factor_system(little_rotations, np.ones((order, order)))
+    assert np.allclose(trivial, 1)
+    assert not np.allclose(canonical, 1)
+
+
+def test_get_solvable_chain_generators():
+    for _, groups in pg_dataset.items():
+        for pg in groups:
+            table = get_cayley_table(np.array(pg))
+            generators = get_solvable_chain_generators(table)
+
+            # Extend subgroups from identity by prime index
+            subgroup = {get_identity_index(table)}
+            for r in generators[::-1]:
+                index = 1
+                power = r
+                while power not in subgroup:
+                    power = table[power, r]
+                    index += 1
+                assert is_prime(index)
+
+                extended = set(subgroup)
+                coset = list(subgroup)
+                for _ in range(index - 1):
+                    coset = [table[r, s] for s in coset]
+                    extended.update(coset)
+                assert len(extended) == index * len(subgroup)
+                # `subgroup` is normal in `extended`
+                for g in extended:
+                    assert {
+                        table[table[g, s], get_inverse_index(table, g)] for s in subgroup
+                    } == subgroup
+                subgroup = extended
+            assert len(subgroup) == len(pg)
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from spgrep.core import get_full_spacegroup_irreps, get_spacegroup_irreps
+from spgrep.induced import enumerate_quotient_irreps, get_quotient_cayley_table
+from spgrep.representation import is_representation
+from spgrep.utils import get_symmetry_from_hall_number
+
+
+@pytest.mark.parametrize("mesh", [(1, 1, 1), (2, 2, 2), (2, 2, 3)])
+def test_quotient_irreps(P42mnm, mesh):
+    rotations, translations = P42mnm
+    irreps = enumerate_quotient_irreps(rotations, translations, mesh)
+    order = len(rotations) * int(np.prod(mesh))
+
+    # Sum of squared dimensions equals order of quotient group
+    assert sum(irrep.shape[1] ** 2 for irrep in irreps) == order
+
+    table = get_quotient_cayley_table(rotations, translations, mesh)
+    characters = []
+    for irrep in irreps:
+        rep = irrep.toarray_quotient()
+        assert is_representation(rep, table)
+        character = irrep.get_quotient_character()
+        assert np.allclose(character, np.einsum("kii->k", rep))
+        characters.append(character)
+
+    # Orthogonality of characters
+    characters = np.array(characters)
+    assert np.allclose(characters @ np.conj(characters).T, order * np.eye(len(irreps)))
+
+
+def test_quotient_irreps_incompatible_mesh():
+    # P6/mmm (No. 191) does not preserve mesh (1, 2, 1)
+    rotations, translations = get_symmetry_from_hall_number(hall_number=485)
+    with pytest.raises(ValueError):
+        enumerate_quotient_irreps(rotations, translations, (1, 2, 1))
+
+
+@pytest.mark.parametrize("kpoint", [np.array([0, 0, 0]), np.array([0, 1 / 2, 1])])
+def test_get_full_spacegroup_irreps(kpoint, corundum_cell):
+    irreps, rotations, translations = get_full_spacegroup_irreps(*corundum_cell, kpoint=kpoint)
+    small_irreps, _, _, mapping = get_spacegroup_irreps(*corundum_cell, kpoint=kpoint)
+    assert len(irreps) == len(small_irreps)
+
+    # Products of conventional operations up to lattice translations
+    product_rotations = np.einsum("iab,jbc->ijac", rotations, rotations)
+    product_translations = (
+        np.einsum("iab,jb->ija", rotations, translations) + translations[:, None, :]
+    )
+    diff = product_translations[:, :, None, :] - translations[None, None, :, :]
+    matched = np.all(
+        product_rotations[:, :, None] == rotations[None, None, :], axis=(3, 4)
+    ) & np.all(np.isclose(diff, np.rint(diff)), axis=3)
+    table = np.argmax(matched, axis=2)
+    shifts = np.rint(np.take_along_axis(diff, table[:, :, None, None], axis=2)[:, :, 0])
+    shifts = shifts.astype(int)
+
+    for irrep, small_irrep in zip(irreps, small_irreps):
+        num_arms = irrep.num_arms
+        assert irrep.shape[1] == num_arms * small_irrep.shape[1]
+        assert np.allclose(irrep.blocks[mapping, 0], small_irrep)
+        assert np.all(irrep.permutations[irrep.coset_representatives, 0] == np.arange(num_arms))
+
+        rep = irrep.toarray()
+        phases = np.repeat(
+            irrep.get_translation_phases(shifts.reshape(-1, 3)), irrep.block_dim, axis=1
+        ).reshape(len(rotations), len(rotations), -1)
+        assert np.allclose(
+            np.einsum("iab,jbc->ijac", rep, rep),
+            phases[:, :, :, None] * rep[table],
+        )
+
+        # Characters of tensor product on compact form
+        product = irrep.tensor_product(irrep)
+        assert np.allclose(product.get_character(), irrep.get_character() ** 2)
+
+    materialized, _, _ = get_full_spacegroup_irreps(
+        *corundum_cell, kpoint=kpoint, materialize=True
+    )
+    for irrep, rep in zip(irreps, materialized):
+        assert np.allclose(irrep.toarray(), rep)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import warnings
 from itertools import product
 
 import numpy as np
@@ -9,6 +10,7 @@ from spgrep.core import (
     get_crystallographic_pointgroup_irreps_from_symmetry,
     get_spacegroup_irreps,
     get_spacegroup_irreps_from_primitive_symmetry,
+    get_spacegroup_irreps_incremental,
 )
 from spgrep.group import (
     check_cocycle_condition,
@@ -17,9 +19,16 @@ from spgrep.group import (
     get_little_group,
 )
 from spgrep.irreps import (
+    clear_subduction_cache,
+    decompose_representation,
     enumerate_small_representations,
     enumerate_unitary_irreps,
+    enumerate_unitary_irreps_from_solvable_group_chain,
     is_equivalent_irrep,
+    purify_irrep_value,
+    purify_irrep_value_batch,
+    purify_real_irrep_value,
+    subduce_irreps,
 )
 from spgrep.pointgroup import pg_dataset
 from spgrep.representation import (
@@ -28,6 +37,7 @@ from spgrep.representation import (
     is_representation,
     is_unitary,
 )
+from spgrep.spinor import get_spinor_factor_system
 from spgrep.transform import transform_symmetry_and_kpoint, unique_primitive_symmetry
 from spgrep.utils import NDArrayComplex, get_symmetry_from_hall_number
 
@@ -183,6 +193,19 @@ def test_get_spacegroup_irreps(method, kpoint, shape_expect, num_sym_expect, cor
     assert is_unique_irreps(irreps)
 
 
+def test_get_spacegroup_irreps_lazy(corundum_cell):
+    kpoint = np.array([0, 1, 1 / 2])  # T point for hR
+    irreps, _, _, mapping = get_spacegroup_irreps(*corundum_cell, kpoint=kpoint)
+    views, _, _, mapping_lazy = get_spacegroup_irreps(*corundum_cell, kpoint=kpoint, lazy=True)
+    assert np.all(mapping == mapping_lazy)
+
+    for irrep, view in zip(irreps, views):
+        assert view.shape == irrep.shape
+        assert np.allclose(view[3], irrep[3])
+        assert np.allclose(view[[1, 5]], irrep[[1, 5]])
+        assert np.allclose(np.asarray(view), irrep)
+
+
 def is_unique_irreps(irreps: list[NDArrayComplex]):
     characters = [get_character(irrep) for irrep in irreps]
     for (i, ci), (j, cj) in product(enumerate(characters), repeat=2):
@@ -273,3 +296,198 @@ def test_small_representation_with_origin_shift(hall_number, kpoint, method, ori
         assert check_spacegroup_representation(
             little_rotations, new_little_translations, kpoint, irrep
         )
+
+
+def test_purify_irrep_value(rng):
+    exact = np.array([0, 1, 1j, -1, -1j, np.exp(2j * np.pi / 3), np.exp(-1j * np.pi / 3), 0.3])
+    noisy = exact + 1e-10 * (rng.random(exact.shape) + 1j * rng.random(exact.shape))
+    purified = purify_irrep_value(noisy.copy())
+    assert np.all(purified[:4] == exact[:4])
+    assert np.allclose(purified, exact)
+    assert purified[-1] != exact[-1]  # not snapped
+
+    real_exact = np.array([0, 1, -1, 0.5, -np.sqrt(3) / 2, 0.7])
+    real_noisy = real_exact + 1e-10 * rng.random(real_exact.shape)
+    real_purified = purify_real_irrep_value(real_noisy.copy())
+    assert np.all(real_purified[:5] == real_exact[:5])
+    assert real_purified[-1] != real_exact[-1]
+
+
+def test_purify_irrep_value_batch(C3v):
+    irreps, _ = enumerate_unitary_irreps(C3v)
+    noisy = [irrep + 1e-10 for irrep in irreps]
+    purified = purify_irrep_value_batch(noisy)
+    assert [irrep.shape for irrep in purified] == [irrep.shape for irrep in irreps]
+    for actual, irrep in zip(purified, irreps):
+        assert np.allclose(actual, irrep)
+        assert np.all(actual[irrep == 0] == 0)
+
+
+def test_purify_irrep_value_real_input(C3v):
+    # Real irrep should be purified without casting complex values to real
+    irreps, _ = enumerate_unitary_irreps(C3v, real=True)
+    noisy = [irrep + 1e-10 for irrep in irreps]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        purified = purify_irrep_value_batch(noisy)
+    for actual, irrep in zip(purified, irreps):
+        assert np.isrealobj(actual)
+        assert np.allclose(actual, irrep)
+
+
+def test_decompose_representation(C3v, hexagonal_lattice):
+    # Vector representation in Cartesian coordinates: A1 + E
+    A = hexagonal_lattice.T
+    rep = np.einsum("ij,kjl,lm->kim", A, C3v, np.linalg.inv(A)).astype(np.complex128)
+    irreps = decompose_representation(rep)
+    assert [irrep.shape[1] for irrep in irreps] == [1, 2]
+
+    table = get_cayley_table(C3v)
+    for irrep in irreps:
+        assert is_representation(irrep, table)
+    assert is_unique_irreps(irreps)
+
+
+def test_decompose_representation_isotypic(C3v, hexagonal_lattice):
+    table = get_cayley_table(C3v)
+    order = table.shape[0]
+
+    # Regular representation contains A1 + A2 + 2E
+    regular = np.zeros((order, order, order), dtype=np.complex128)
+    for i, j in product(range(order), repeat=2):
+        regular[i, table[i, j], j] = 1
+    irreps = decompose_representation(regular, method="isotypic", table=table)
+    assert [irrep.shape[1] for irrep in irreps] == [1, 1, 2]
+    for irrep in irreps:
+        assert is_representation(irrep, table)
+    assert is_unique_irreps(irreps)
+
+    # Block-diagonal representation: (A1 + E) + (A1 + E)
+    A = hexagonal_lattice.T
+    vector = np.einsum("ij,kjl,lm->kim", A, C3v, np.linalg.inv(A)).astype(np.complex128)
+    rep = np.zeros((order, 6, 6), dtype=np.complex128)
+    rep[:, :3, :3] = vector
+    rep[:, 3:, 3:] = vector
+    for exploit_sparsity in [True, False]:
+        irreps = decompose_representation(
+            rep, method="isotypic", table=table, exploit_sparsity=exploit_sparsity
+        )
+        assert [irrep.shape[1] for irrep in irreps] == [1, 2]
+        for irrep in irreps:
+            assert is_representation(irrep, table)
+
+
+def test_irreps_from_searched_solvable_chain(hexagonal_lattice):
+    for pg_symbol, groups in pg_dataset.items():
+        if pg_symbol.startswith(("3", "-3", "6", "-6")):
+            lattice = hexagonal_lattice
+        else:
+            lattice = np.eye(3)
+        for pg in groups:
+            rotations = np.array(pg)
+            order = len(rotations)
+            table = get_cayley_table(rotations)
+            spinor_factor_system, _ = get_spinor_factor_system(lattice, rotations)
+            for factor_system in [
+                np.ones((order, order), dtype=np.complex128),
+                spinor_factor_system,
+            ]:
+                irreps = enumerate_unitary_irreps_from_solvable_group_chain(table, factor_system)
+                assert np.sum([irrep.shape[1] ** 2 for irrep in irreps]) == order
+                for irrep in irreps:
+                    assert is_representation(irrep, table, factor_system)
+                assert is_unique_irreps(irreps)
+
+
+def test_irreps_of_quaternion_group():
+    # Quaternion group Q8 = {±1, ±i, ±j, ±k} as 2x2 matrices, which is not tabulated
+    one = np.eye(2, dtype=np.complex128)
+    qi = np.array([[1j, 0], [0, -1j]])
+    qj = np.array([[0, 1], [-1, 0]], dtype=np.complex128)
+    qk = qi @ qj
+    elements = np.array([sign * q for q in [one, qi, qj, qk] for sign in [1, -1]])
+    order = len(elements)
+    table = np.zeros((order, order), dtype=int)
+    for i, j in product(range(order), repeat=2):
+        table[i, j] = np.argmin(np.linalg.norm(elements - elements[i] @ elements[j], axis=(1, 2)))
+
+    irreps = enumerate_unitary_irreps_from_solvable_group_chain(
+        table, np.ones((order, order), dtype=np.complex128)
+    )
+    assert [irrep.shape[1] for irrep in irreps] == [1, 1, 1, 1, 2]
+    for irrep in irreps:
+        assert is_representation(irrep, table)
+
+
+def test_subduce_irreps(Oh, C4):
+    clear_subduction_cache()
+    irreps_G, _ = enumerate_unitary_irreps(Oh)
+    branching, irreps_H = subduce_irreps(irreps_G, Oh, C4)
+    assert branching.shape == (len(irreps_G), len(irreps_H))
+
+    dims_G = np.array([irrep.shape[1] for irrep in irreps_G])
+    dims_H = np.array([irrep.shape[1] for irrep in irreps_H])
+    assert np.all(branching @ dims_H == dims_G)
+    # Regular representation of H appears |G|/|H| times
+    assert np.all(dims_G @ branching == len(Oh) // len(C4) * dims_H)
+
+    # Reuse memoized irreps of subgroup, which are not affected by modifying returned ones
+    expect_irreps_H = [irrep.copy() for irrep in irreps_H]
+    for irrep in irreps_H:
+        irrep[:] = 0
+    branching2, irreps_H2 = subduce_irreps(irreps_G, Oh, C4)
+    assert np.all(branching2 == branching)
+    for irrep, expect in zip(irreps_H2, expect_irreps_H):
+        assert np.allclose(irrep, expect)
+
+    # Caller-supplied irreps of subgroup are not kept in cache
+    clear_subduction_cache()
+    irreps_H3 = [irrep.copy() for irrep in expect_irreps_H[::-1]]
+    branching3, _ = subduce_irreps(irreps_G, Oh, C4, irreps_H=irreps_H3)
+    assert np.all(branching3 == branching[:, ::-1])
+    branching4, irreps_H4 = subduce_irreps(irreps_G, Oh, C4)
+    assert np.all(branching4 == branching)
+    assert len(irreps_H4) == len(expect_irreps_H)
+    for irrep, expect in zip(irreps_H4, expect_irreps_H):
+        assert np.allclose(irrep, expect)
+
+    # Incomplete irreps of subgroup are rejected
+    with pytest.raises(ValueError):
+        subduce_irreps(irreps_G, Oh, C4, irreps_H=expect_irreps_H[:2])
+
+
+def test_subduce_irreps_not_subgroup(C4, C3v):
+    irreps_G, _ = enumerate_unitary_irreps(C4)
+    with pytest.raises(ValueError):
+        subduce_irreps(irreps_G, C4, C3v, use_cache=False)
+
+
+@pytest.mark.parametrize("kpoint", [np.array([0, 0, 0]), np.array([0, 0, 1.5])])
+def test_get_spacegroup_irreps_incremental(kpoint, corundum_cell):
+    lattice, positions, numbers = corundum_cell
+    previous = get_spacegroup_irreps(lattice, positions, numbers, kpoint=kpoint)
+
+    # Break inversion: R-3c -> R3c
+    displaced = positions.copy()
+    displaced[:12, 2] += 0.01
+    irreps, rotations, translations, mapping = get_spacegroup_irreps_incremental(
+        lattice, displaced, numbers, kpoint, previous=previous
+    )
+    expect, _, _, mapping_expect = get_spacegroup_irreps(lattice, displaced, numbers, kpoint)
+    assert len(rotations) < len(previous[1])
+    assert np.all(mapping == mapping_expect)
+    assert len(irreps) == len(expect)
+
+    for irrep in irreps:
+        assert check_spacegroup_representation(
+            rotations[mapping], translations[mapping], kpoint, irrep
+        )
+        character = get_character(irrep)
+        assert any(is_equivalent_irrep(character, get_character(other)) for other in expect)
+
+    # Symmetry recovers: recompute from scratch
+    irreps_back, _, _, mapping_back = get_spacegroup_irreps_incremental(
+        lattice, positions, numbers, kpoint, previous=(irreps, rotations, translations, mapping)
+    )
+    assert np.all(mapping_back == previous[3])
+    assert len(irreps_back) == len(previous[0])
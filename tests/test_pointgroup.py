@@ -1,7 +1,21 @@
 import numpy as np
+import pytest
 
-from spgrep.group import get_cayley_table, get_inverse_index, is_matrix_group
-from spgrep.pointgroup import get_generators, pg_dataset
+import spgrep.pointgroup
+from spgrep.group import (
+    get_cayley_table,
+    get_identity_index,
+    get_inverse_index,
+    is_matrix_group,
+)
+from spgrep.pointgroup import (
+    clear_pointgroup_chain_generators_cache,
+    get_generators,
+    get_pointgroup_chain_generators,
+    load_pointgroup_chain_generators_cache,
+    pg_dataset,
+    save_pointgroup_chain_generators_cache,
+)
 
 
 def test_pg_dataset():
@@ -29,3 +43,46 @@ def test_group_chain():
                 for n in range(gen):
                     assert all([table[inv[g], table[n, g]] < gen for g in range(prev_size)])
                 prev_size = gen
+
+
+def test_get_pointgroup_chain_generators(rng):
+    for _, groups in pg_dataset.items():
+        for pg in groups:
+            # Shuffled operations are matched by encoded keys
+            rotations = np.array(pg)[rng.permutation(len(pg))]
+            generators = get_pointgroup_chain_generators(rotations)
+
+            # Generators should generate whole group
+            table = get_cayley_table(rotations)
+            group = {get_identity_index(table)}
+            for g in generators[::-1]:
+                while True:
+                    new_group = group | {table[g, h] for h in group}
+                    if new_group == group:
+                        break
+                    group = new_group
+            assert len(group) == len(rotations)
+
+
+def test_pointgroup_chain_generators_cache(monkeypatch, tmp_path):
+    rotations = np.array(pg_dataset["m-3m"][0])
+    clear_pointgroup_chain_generators_cache()
+    expect = get_pointgroup_chain_generators(rotations)
+
+    # Repeated lookup skips spglib
+    def _raise(*args, **kwargs):
+        raise AssertionError("Should not be called")
+
+    monkeypatch.setattr(spgrep.pointgroup, "get_pointgroup", _raise)
+    assert get_pointgroup_chain_generators(rotations) == expect
+
+    # Persist and restore cache
+    filename = tmp_path / "cache.json"
+    save_pointgroup_chain_generators_cache(filename)
+    clear_pointgroup_chain_generators_cache()
+    load_pointgroup_chain_generators_cache(filename)
+    assert get_pointgroup_chain_generators(rotations) == expect
+
+    clear_pointgroup_chain_generators_cache()
+    with pytest.raises(AssertionError):
+        get_pointgroup_chain_generators(rotations)
@@ -1,12 +1,27 @@
 import numpy as np
 
-from spgrep.irreps import enumerate_unitary_irreps, is_equivalent_irrep
+from spgrep.core import get_spacegroup_irreps
+from spgrep.group import get_cayley_table
+from spgrep.irreps import (
+    decompose_representation,
+    enumerate_unitary_irreps,
+    is_equivalent_irrep,
+)
 from spgrep.representation import (
+    DirectProductRepresentation,
+    InducedSiteRepresentation,
+    check_spacegroup_representation,
+    find_representation_violation,
+    find_spacegroup_representation_violation,
     get_character,
+    get_direct_product,
     get_intertwiner,
     get_regular_representation,
+    get_site_permutations,
+    is_representation,
     project_to_irrep,
 )
+from spgrep.utils import get_symmetry_from_hall_number
 
 
 def test_get_character(C3v):
@@ -60,3 +75,136 @@ def test_project_to_irrep(C3v):
 def test_frobenius_schur_indicator(C4):
     irreps, indicators = enumerate_unitary_irreps(C4)
     assert sorted(indicators) == [0, 0, 1, 1]
+
+
+def test_induced_site_representation():
+    # Displacements in perovskite structure at X point
+    lattice = np.eye(3)
+    positions = np.array(
+        [
+            [0, 0.5, 0.5],
+            [0.5, 0, 0.5],
+            [0.5, 0.5, 0],
+            [0.5, 0.5, 0.5],
+            [0, 0, 0],
+        ]
+    )
+    numbers = [0, 0, 0, 1, 2]
+    qpoint = np.array([0.5, 0, 0])
+    irreps, rotations, translations, mapping_little_group = get_spacegroup_irreps(
+        lattice, positions, numbers, qpoint
+    )
+    little_rotations = rotations[mapping_little_group]
+    little_translations = translations[mapping_little_group]
+    order = len(little_rotations)
+    num_atoms = len(positions)
+
+    permutations, shifts = get_site_permutations(little_rotations, little_translations, positions)
+    phases = np.exp(-2j * np.pi * np.einsum("ipq,p,ikq->ik", little_rotations, qpoint, shifts))
+    rep = InducedSiteRepresentation(permutations, phases, little_rotations)
+    assert rep.shape == (order, 3 * num_atoms, 3 * num_atoms)
+
+    # Compare with dense representation
+    dense = np.zeros((order, num_atoms, 3, num_atoms, 3), dtype=np.complex128)
+    for i in range(order):
+        for kappa in range(num_atoms):
+            dense[i, permutations[i, kappa], :, kappa, :] = phases[i, kappa] * little_rotations[i]
+    dense = dense.reshape(order, 3 * num_atoms, 3 * num_atoms)
+    assert np.allclose(rep.toarray(), dense)
+    assert np.allclose(get_character(rep), get_character(dense))
+
+    table = get_cayley_table(little_rotations)
+    assert check_spacegroup_representation(little_rotations, little_translations, qpoint, rep)
+    assert (
+        find_spacegroup_representation_violation(
+            little_rotations, little_translations, qpoint, rep, chunk_size=3
+        )
+        is None
+    )
+    assert is_representation(rep, table)
+    assert is_representation(dense, table)
+
+    # Projections agree with those of dense representation
+    for irrep in irreps:
+        basis = project_to_irrep(rep, irrep)
+        basis_dense = project_to_irrep(dense, irrep)
+        assert len(basis) == len(basis_dense)
+
+    # Each irrep is decomposed from orbits of atoms
+    decomposed = decompose_representation(rep, method="isotypic", table=table)
+    assert (
+        sum(len(project_to_irrep(dense, irrep)) * irrep.shape[1] for irrep in decomposed)
+        == 3 * num_atoms
+    )
+
+
+def test_get_site_permutations():
+    # Wurtzite-like sites in P6_3mc
+    rotations, translations = get_symmetry_from_hall_number(480)
+    positions = np.array(
+        [
+            [1 / 3, 2 / 3, 0],
+            [2 / 3, 1 / 3, 0.5],
+            [1 / 3, 2 / 3, 0.375],
+            [2 / 3, 1 / 3, 0.875],
+        ]
+    )
+    # Perturb coordinates across cell boundary
+    positions[0, 2] = 1 - 1e-7
+    permutations, shifts = get_site_permutations(rotations, translations, positions)
+
+    for i, (rotation, translation) in enumerate(zip(rotations, translations)):
+        for kappa, position in enumerate(positions):
+            diff = rotation @ position + translation - positions[permutations[i, kappa]]
+            assert np.allclose(diff, np.around(diff), atol=1e-5)
+            assert np.allclose(shifts[i, kappa], diff)
+
+
+def test_find_representation_violation(C3v):
+    table = get_cayley_table(C3v)
+    reg = get_regular_representation(C3v).astype(np.complex128)
+    for chunk_size in [None, 1, 4]:
+        assert find_representation_violation(reg, table, chunk_size=chunk_size) is None
+
+    broken = reg.copy()
+    broken[2] *= -1
+    violations = [
+        find_representation_violation(broken, table, chunk_size=chunk_size)
+        for chunk_size in [None, 1, 4]
+    ]
+    assert violations[0] is not None
+    assert all(violation == violations[0] for violation in violations)
+    i, j = violations[0]
+    assert not np.allclose(broken[i] @ broken[j], broken[table[i, j]])
+
+
+def test_direct_product_representation(C3v):
+    irreps, _ = enumerate_unitary_irreps(C3v)
+    irrep_E = irreps[-1]
+    vector = C3v.astype(np.float64)
+    lazy = DirectProductRepresentation([irrep_E, vector, irrep_E])
+    dense = get_direct_product(get_direct_product(irrep_E, vector), irrep_E)
+    assert lazy.shape == dense.shape
+    assert np.allclose(lazy.toarray(), dense)
+    assert np.allclose(get_character(lazy), get_character(dense))
+    assert is_representation(lazy, get_cayley_table(C3v))
+    assert isinstance(get_direct_product(irrep_E, vector, lazy=True), DirectProductRepresentation)
+
+    rng = np.random.default_rng(0)
+    vectors = rng.random((2,) + lazy.dims)
+    expect = np.einsum("kij,mj->kmi", dense, vectors.reshape(2, -1))
+    assert np.allclose(lazy.apply(vectors).reshape(len(C3v), 2, -1), expect)
+    weights = rng.random(len(C3v))
+    assert np.allclose(
+        lazy.apply(vectors, weights=weights).reshape(2, -1),
+        np.einsum("k,kmi->mi", weights, expect),
+    )
+
+    for irrep in irreps:
+        basis_lazy = project_to_irrep(lazy, irrep)
+        basis_dense = project_to_irrep(dense, irrep)
+        assert len(basis_lazy) == len(basis_dense)
+        for basis in basis_lazy:
+            assert np.allclose(
+                np.einsum("kij,mj->kmi", dense, basis), np.einsum("klm,li->kmi", irrep, basis)
+            )
@@ -1,3 +1,5 @@
+from itertools import product
+
 import numpy as np
 import pytest
 
@@ -20,6 +22,7 @@ from spgrep.representation import (
 from spgrep.spinor import (
     enumerate_spinor_small_representations,
     get_rotation_angle_and_axis,
+    get_spinor_double_group_table,
     get_spinor_factor_system,
 )
 
@@ -59,8 +62,9 @@ def test_spinor_factor_system_symmorphic(C3v, hexagonal_lattice):
     assert np.allclose(spinor_factor_system[:, identity_idx], 1)
 
 
+@pytest.mark.parametrize("double_group", [False, True])
 @pytest.mark.parametrize("method", [("Neto"), ("random")])
-def test_spinor_irreps(method, C3v, hexagonal_lattice):
+def test_spinor_irreps(method, double_group, C3v, hexagonal_lattice):
     # P3m1 (No. 156)
     rotations = C3v
     lattice = hexagonal_lattice
@@ -69,6 +73,7 @@ def test_spinor_irreps(method, C3v, hexagonal_lattice):
         lattice=lattice,
         little_rotations=rotations,
         method=method,
+        double_group=double_group,
     )
 
     table = get_cayley_table(rotations)
@@ -81,6 +86,19 @@ def test_spinor_irreps(method, C3v, hexagonal_lattice):
     assert sorted([irrep.shape[1] for irrep in irreps]) == [1, 1, 2]
 
 
+def test_spinor_double_group_table(C3v, hexagonal_lattice):
+    spinor_factor_system, unitary_rotations = get_spinor_factor_system(hexagonal_lattice, C3v)
+    double_table = get_spinor_double_group_table(C3v, spinor_factor_system)
+
+    # Double group as SU(2) matrices
+    double_unitary_rotations = np.concatenate([unitary_rotations, -unitary_rotations])
+    for i, j in product(range(len(double_table)), repeat=2):
+        assert np.allclose(
+            double_unitary_rotations[i] @ double_unitary_rotations[j],
+            double_unitary_rotations[double_table[i, j]],
+        )
+
+
 @pytest.mark.parametrize(
     "kpoint,shape_expect",
     [
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+from itertools import permutations
+
 import numpy as np
 import pytest
 from spglib import get_symmetry_from_database
 
 from spgrep.group import get_cayley_table
-from spgrep.representation import is_representation
-from spgrep.tensor import apply_intrinsic_symmetry, get_symmetry_adapted_tensors
+from spgrep.representation import DirectProductRepresentation, is_representation
+from spgrep.tensor import (
+    apply_intrinsic_symmetry,
+    get_invariant_symmetric_tensors,
+    get_invariant_tensors,
+    get_property_tensors,
+    get_symmetric_power_representation,
+    get_symmetry_adapted_tensors,
+    reconstruct_symmetric_tensors,
+)
 
 
 def get_standard_basis() -> list[np.ndarray]:
@@ -120,3 +130,145 @@ def test_symmetric_tensor_hexagonal_rank4():
     sym_tensors = apply_intrinsic_symmetry(tensors)
 
     assert len(sym_tensors) == 18
+
+
+@pytest.mark.parametrize(
+    "hall_number,rank,num_expect",
+    [
+        # Pm-3m (No. 221)
+        (517, 1, 1),
+        (517, 2, 3),
+        (517, 3, 6),
+        (517, 4, 11),
+        # P6/mmm (No. 191)
+        (485, 1, 2),
+        (485, 2, 5),
+        (485, 3, 10),
+    ],
+)
+def test_invariant_tensors(hall_number, rank, num_expect):
+    symmetry = get_symmetry_from_database(hall_number=hall_number)
+    rotations = symmetry["rotations"]
+
+    rep = get_representation_on_symmetric_matrix(rotations)
+    tensors = get_invariant_tensors(rep, rank, list(permutations(range(rank))))
+    assert len(tensors) == num_expect
+    assert np.isrealobj(tensors)
+
+    # Invariant, orthonormal, and intrinsically symmetric
+    applied = DirectProductRepresentation([rep] * rank).apply(tensors)
+    assert np.allclose(applied, tensors[None])
+    flattened = tensors.reshape(num_expect, -1)
+    assert np.allclose(flattened @ flattened.T, np.eye(num_expect))
+    for perm in permutations(range(rank)):
+        assert np.allclose(np.transpose(tensors, (0,) + tuple(1 + p for p in perm)), tensors)
+
+
+def test_invariant_tensors_without_intrinsic_symmetry():
+    symmetry = get_symmetry_from_database(hall_number=517)
+    rotations = symmetry["rotations"].astype(np.float64)
+    # Only the Kronecker delta is invariant rank-2 tensor of vector representation
+    tensors = get_invariant_tensors(rotations, rank=2)
+    assert len(tensors) == 1
+    assert np.allclose(np.abs(tensors[0]), np.eye(3) / np.sqrt(3))
+    # No invariant vector
+    assert get_invariant_tensors(rotations, rank=1).shape == (0, 3)
+
+
+@pytest.mark.parametrize("kind", ["symmetric", "antisymmetric"])
+@pytest.mark.parametrize("n", [1, 2, 3])
+def test_symmetric_power_representation(kind, n):
+    symmetry = get_symmetry_from_database(hall_number=485)
+    rotations = symmetry["rotations"]
+    rep = get_representation_on_symmetric_matrix(rotations)
+    power_rep, indices = get_symmetric_power_representation(rep, n, kind=kind)
+    assert is_representation(power_rep, get_cayley_table(rotations))
+
+    # Compare with restriction of tensor product to orthonormal (anti)symmetric tensors
+    basis = reconstruct_symmetric_tensors(np.eye(len(indices)), indices, dim=6, kind=kind)
+    flattened = basis.reshape(len(indices), -1)
+    assert np.allclose(flattened @ flattened.T, np.eye(len(indices)))
+    applied = DirectProductRepresentation([rep] * n).apply(basis)
+    expect = np.einsum("ai,kbi->kab", flattened, applied.reshape(len(rotations), len(indices), -1))
+    assert np.allclose(power_rep, expect)
+
+
+@pytest.mark.parametrize(
+    "hall_number,rank,num_expect",
+    [
+        (517, 2, 3),
+        (517, 4, 11),
+        (485, 3, 10),
+    ],
+)
+def test_invariant_symmetric_tensors(hall_number, rank, num_expect):
+    symmetry = get_symmetry_from_database(hall_number=hall_number)
+    rotations = symmetry["rotations"]
+    rep = get_representation_on_symmetric_matrix(rotations)
+
+    coefficients, indices = get_invariant_symmetric_tensors(rep, rank)
+    assert len(coefficients) == num_expect
+    tensors = reconstruct_symmetric_tensors(coefficients, indices, dim=6)
+    expect = get_invariant_tensors(rep, rank, list(permutations(range(rank))))
+    # Same subspace
+    flattened = tensors.reshape(num_expect, -1)
+    projector = expect.reshape(num_expect, -1).T @ expect.reshape(num_expect, -1)
+    assert np.allclose(flattened @ projector, flattened)
+
+
+@pytest.mark.parametrize(
+    "hall_number,tensor_type,num_expect",
+    [
+        # Pm-3m (No. 221)
+        (517, "dielectric", 1),
+        (517, "elastic", 3),
+        # P6/mmm (No. 191)
+        (485, "elastic", 5),
+        # R3 (No. 146), rhombohedral axes
+        (434, "elastic", 7),
+        # F-43m (No. 216)
+        (512, "piezoelectric", 1),
+        # P3m1 (No. 156)
+        (446, "second_harmonic", 4),
+    ],
+)
+def test_property_tensors(hall_number, tensor_type, num_expect):
+    symmetry = get_symmetry_from_database(hall_number=hall_number)
+    rotations = symmetry["rotations"]
+
+    tensors = get_property_tensors(rotations, tensor_type)
+    assert len(tensors) == num_expect
+    rank = tensors.ndim - 1
+    direct = DirectProductRepresentation([rotations.astype(np.float64)] * rank)
+    assert np.allclose(direct.apply(tensors), tensors[None])
+
+    # Should span the same subspace as the general engine
+    expect = get_property_tensors(rotations, tensor_type, use_table=False)
+    flat = tensors.reshape(len(tensors), -1)
+    flat_expect = expect.reshape(len(expect), -1)
+    rank_union = np.linalg.matrix_rank(np.concatenate([flat, flat_expect]), tol=1e-8)
+    assert rank_union == num_expect
+
+
+@pytest.mark.parametrize(
+    "hall_number,tensor_type",
+    [
+        # P6_3/mmc (No. 194)
+        (488, "dielectric"),
+        # P6/mmm (No. 191)
+        (485, "elastic"),
+        # F-43m (No. 216)
+        (512, "piezoelectric"),
+        # P3m1 (No. 156)
+        (446, "second_harmonic"),
+        # Pm-3m (No. 221)
+        (517, "elastic"),
+    ],
+)
+def test_property_tensors_table(hall_number, tensor_type):
+    # Tabulated tensors should agree with the general engine in standard settings
+    rotations = get_symmetry_from_database(hall_number=hall_number)["rotations"]
+    tensors = get_property_tensors(rotations, tensor_type)
+    expect = get_property_tensors(rotations, tensor_type, use_table=False)
+    assert tensors.shape == expect.shape
+    assert np.allclose(tensors, expect)
@@ -2,10 +2,13 @@ import numpy as np
 import pytest
 
 from spgrep.utils import (
+    encode_rotations,
+    get_rotation_indices,
     grassmann_distance,
     is_integer_array,
     is_prime,
     mode_dot,
+    mode_dot_batch,
     ndarray2d_to_integer_tuple,
     nroot,
 )
@@ -107,3 +110,33 @@ def test_mode_dot(rng):
     actual = mode_dot(coeffs, [m1, m2, m3])
     assert actual.shape == (3, 5, 7)
     assert np.allclose(actual, expect)
+
+
+def test_mode_dot_batch(rng):
+    stacked_coeffs = rng.random((4, 2, 3, 2))
+    m1 = rng.random((2, 3))
+    m2 = rng.random((3, 5))
+
+    # Trailing axes without matrices are kept
+    expect = np.einsum("sijk,ia,jb->sabk", stacked_coeffs, m1, m2)
+    actual = mode_dot_batch(stacked_coeffs, [m1, m2])
+    assert actual.shape == (4, 3, 5, 2)
+    assert np.allclose(actual, expect)
+    assert np.allclose(mode_dot(stacked_coeffs[1], [m1, m2]), expect[1])
+
+
+def test_get_rotation_indices(C3v):
+    keys = encode_rotations(C3v)
+    assert len(np.unique(keys)) == len(C3v)
+
+    products = np.einsum("iab,jbc->ijac", C3v, C3v)
+    indices = get_rotation_indices(C3v, products)
+    for i, j in np.ndindex(indices.shape):
+        assert np.array_equal(C3v[indices[i, j]], C3v[i] @ C3v[j])
+
+    # Return the first index for duplicated rotations
+    duplicated = np.concatenate([C3v, C3v])
+    assert np.array_equal(get_rotation_indices(duplicated, C3v), np.arange(len(C3v)))
+
+    with pytest.raises(ValueError):
+        get_rotation_indices(C3v, -np.eye(3, dtype=int))